@@ -11,8 +11,10 @@ from pathlib import Path
 # Add the parent directory to the path to allow imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from src.content import ContentError, get_content
 from src.game_engine import GameEngine
 from src.game_state import GameState
+from src.leaderboard import Leaderboard
 from src.player import Player
 from src.save_system import SaveSystem
 
@@ -104,6 +106,17 @@ def prompt_for_difficulty():
 
 def main():
     """Main entry point for the game."""
+    try:
+        get_content()
+    except ContentError as error:
+        for problem in error.problems:
+            print(f"❌ {problem}")
+        print(
+            "\n❌ The game content has problems. "
+            "Fix them and run: python3 -m src.content"
+        )
+        sys.exit(1)
+
     # Support demo mode via command-line flag
     demo_mode = False
     if "--demo" in sys.argv:
@@ -135,8 +148,25 @@ def main():
 
     # Initialize game
     player = Player(player_name, starting_location="bedroom", difficulty=difficulty)
-    game_state = GameState(difficulty=difficulty)
-    engine = GameEngine(player, game_state, save_dir)
+    case = None
+    if "--new-case" in sys.argv:
+        from src.case_generator import new_case
+
+        case = new_case()
+        print(f"\n🎲 New case #{case['seed']}: the killer is someone new.\n")
+    game_state = GameState(difficulty=difficulty, case=case)
+    watch_content = "--watch-content" in sys.argv
+    # Scripted demos stay off the leaderboard
+    leaderboard = None if demo_mode else Leaderboard()
+    engine = GameEngine(
+        player,
+        game_state,
+        save_dir,
+        watch_content=watch_content,
+        leaderboard=leaderboard,
+    )
+    if not demo_mode:
+        game_state.keep_history(engine.save_system.HISTORY_DIR)
 
     # Start the game or run demo
     if demo_mode:
@@ -156,6 +186,7 @@ def main():
             "investigate sammy",
             "investigate spacer_conspiracy",
             "mystery",
+            "analyze",
             "accuse Julius Enderby",
             "settings show",
             "save",
@@ -0,0 +1,139 @@
+"""
+Achievements - Milestones unlocked during play and kept across games
+
+Each achievement watches one fact about the game (clues noted, evidence
+recorded, puzzles solved, trust with an NPC) and unlocks when the fact
+reaches its goal. Progress is updated as facts change, each change only
+touching the achievements that watch that fact.
+"""
+
+from src.events import FactWatcher
+
+
+class Achievement:
+    """A milestone reached when a fact crosses a threshold."""
+
+    def __init__(self, achievement_id, title, description, fact, goal, below=False):
+        """Initialize an achievement.
+
+        Args:
+            achievement_id: Unique achievement ID
+            title: Short title
+            description: What it takes
+            fact: Fact name from src.events it watches
+            goal: Value the fact must reach
+            below: Whether the fact must fall to the goal instead of rise
+        """
+        self.achievement_id = achievement_id
+        self.title = title
+        self.description = description
+        self.fact = fact
+        self.goal = goal
+        self.below = below
+
+    def reached(self, value):
+        """Check whether a fact value meets the goal.
+
+        Args:
+            value: Current value of the fact, or None if unknown
+
+        Returns:
+            bool: Whether the achievement is earned
+        """
+        if value is None:
+            return False
+        return value <= self.goal if self.below else value >= self.goal
+
+
+ACHIEVEMENTS = [
+    Achievement("first_clue", "Observant", "Note your first clue", "clues", 1),
+    Achievement(
+        "total_recall", "Total Recall", "Note 10 clues in one case", "clues", 10
+    ),
+    Achievement(
+        "hard_evidence",
+        "Hard Evidence",
+        "Record a piece of key evidence",
+        "evidence",
+        1,
+    ),
+    Achievement(
+        "airtight", "Airtight Case", "Record 4 pieces of key evidence", "evidence", 4
+    ),
+    Achievement("puzzler", "Puzzler", "Solve a puzzle", "puzzles", 1),
+    Achievement("master_puzzler", "Master Puzzler", "Solve every puzzle", "puzzles", 3),
+    Achievement(
+        "partners",
+        "Partners",
+        "Earn R. Daneel Olivaw's friendship",
+        "trust:R. Daneel Olivaw",
+        50,
+    ),
+    Achievement(
+        "persona_non_grata",
+        "Persona Non Grata",
+        "Lose the Commissioner's trust",
+        "trust:Julius Enderby",
+        -25,
+        below=True,
+    ),
+]
+
+
+class AchievementTracker:
+    """Follows a session's progress toward the achievements."""
+
+    def __init__(self, leaderboard=None, achievements=ACHIEVEMENTS):
+        """Initialize the tracker.
+
+        Args:
+            leaderboard: Leaderboard to keep unlocks in, or None to keep
+                them for this session only
+            achievements: Achievements to track
+        """
+        self.leaderboard = leaderboard
+        self.achievements = list(achievements)
+        self.unlocked = leaderboard.unlocked() if leaderboard else set()
+        self.by_fact = {}  # Fact name -> achievements still locked
+        for achievement in self.achievements:
+            if achievement.achievement_id not in self.unlocked:
+                self.by_fact.setdefault(achievement.fact, []).append(achievement)
+        self.watcher = FactWatcher(self.by_fact)
+
+    def update(self, player, game_state):
+        """Bring progress up to date with the facts that changed.
+
+        Args:
+            player: Player object
+            game_state: GameState object
+
+        Returns:
+            list: Achievements unlocked by the changes
+        """
+        earned = []
+        for fact in self.watcher.changed(player, game_state):
+            value = self.watcher.values[fact]
+            for achievement in self.by_fact.get(fact, ()):
+                if achievement.reached(value):
+                    earned.append(achievement)
+        for achievement in earned:
+            self.unlocked.add(achievement.achievement_id)
+            self.by_fact[achievement.fact].remove(achievement)
+            if self.leaderboard is not None:
+                self.leaderboard.unlock(achievement.achievement_id, player.name)
+        return earned
+
+    def progress(self):
+        """List every achievement with how far along it is.
+
+        Returns:
+            list: (Achievement, unlocked, current value or None) tuples
+        """
+        return [
+            (
+                achievement,
+                achievement.achievement_id in self.unlocked,
+                self.watcher.values.get(achievement.fact),
+            )
+            for achievement in self.achievements
+        ]
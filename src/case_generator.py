@@ -0,0 +1,550 @@
+"""
+Case Generator - Seeded murder cases checked by a solver before play
+
+Each seed gives a new killer, motives, alibis, sightings, an evidence
+chain with items placed around the City, and events that hint at the
+leads. A case is only used once a solver has played it through and found
+exactly one suspect left: the killer.
+
+Fill the cache ahead of time with:
+    python -m src.case_generator --count 20
+"""
+
+import json
+import os
+import random
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.content import START_LOCATION, get_content
+from src.save_system import SaveSystem
+from src.schedules import TIME_PERIODS
+from src.utils import format_clock
+
+CASE_FORMAT = 1
+CACHE_DIR = SaveSystem.DEFAULT_SAVE_DIR.parent / "cases"
+
+# Evidence against the killer needed before an accusation is allowed
+ACCUSE_THRESHOLD = 3
+# Seeds tried per case wanted before giving up
+MAX_ATTEMPTS = 10
+
+WITNESSES = [
+    "Desk Officer",
+    "Neighbor",
+    "City Official",
+    "Street Vendor",
+    "Dispensary Attendant",
+    "Scene Officer",
+    "Corridor monitor log",
+    "Expressway turnstile log",
+]
+
+MOTIVES = [
+    "Sarton was about to expose an embezzlement scheme that led back to them",
+    "Blamed Sarton for a colleague's dismissal after a failed robot trial",
+    "Secretly sympathised with the Medievalists and feared Sarton's robots",
+    "Stood to take over Sarton's research contract if he were gone",
+    "Had been blackmailed by Sarton over an old Spacetown permit",
+    "Lost a promotion when Sarton's report criticised their department",
+]
+
+# (topic, item, examine text, finding). {who} names the implicated suspects.
+INCRIMINATING = [
+    (
+        "fibers",
+        "fabric_scrap",
+        "A scrap of uniform cloth snagged on a vent grille.",
+        "The fibres on the scrap match clothing issued to {who}.",
+    ),
+    (
+        "ledger",
+        "expense_ledger",
+        "A requisitions ledger with several pages dog-eared.",
+        "The ledger shows {who} signed out a blaster permit the day before the murder.",
+    ),
+    (
+        "footage",
+        "camera_reel",
+        "A reel from a corridor surveillance camera.",
+        "The footage catches {who} heading toward the Spacetown gate at 14:40.",
+    ),
+    (
+        "keycard",
+        "access_card",
+        "A magnetic access card, its edge chipped.",
+        "The card was issued to {who} and opened the Spacetown service door at 14:52.",
+    ),
+    (
+        "letter",
+        "torn_letter",
+        "Half of a letter, torn across the signature.",
+        "The letter, in {who}'s hand, threatens Sarton if his work continues.",
+    ),
+    (
+        "casing",
+        "blaster_casing",
+        "A spent blaster charge casing.",
+        "Prints on the casing belong to {who}.",
+    ),
+    (
+        "transit",
+        None,
+        None,
+        "Expressway logs place {who} on a strip toward Spacetown during the afternoon.",
+    ),
+    (
+        "accounts",
+        None,
+        None,
+        "Credit records show {who} made a large, unexplained payment that morning.",
+    ),
+]
+
+CLEARING = [
+    (
+        "roster",
+        None,
+        None,
+        "The duty roster proves {who} could not have left their post.",
+    ),
+    (
+        "medical",
+        "clinic_slip",
+        "A dispensary clinic appointment slip.",
+        "The clinic slip shows {who} was being treated far from Spacetown.",
+    ),
+    (
+        "firstlaw",
+        None,
+        None,
+        (
+            "A positronic audit confirms {who} is bound by the First Law "
+            "and could not kill."
+        ),
+    ),
+]
+
+
+def _is_robot(name):
+    """Check whether a cast member is a robot.
+
+    Args:
+        name: Character name
+
+    Returns:
+        bool: True for R. names
+    """
+    return name.startswith("R. ")
+
+
+def _reachable(locations, start):
+    """Find the locations that can be walked to from a start.
+
+    Args:
+        locations: Bundle location table
+        start: Location key
+
+    Returns:
+        set: Reachable location keys
+    """
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        for target in locations[queue.popleft()]["exits"].values():
+            if target in locations and target not in seen:
+                seen.add(target)
+                queue.append(target)
+    return seen
+
+
+def _names(names):
+    """Join names for a finding.
+
+    Args:
+        names: Suspect names
+
+    Returns:
+        str: "A", "A and B" or "A, B and C"
+    """
+    return names[0] if len(names) == 1 else f"{', '.join(names[:-1])} and {names[-1]}"
+
+
+def generate_case(seed):
+    """Generate a case from a seed.
+
+    The same seed always gives the same case for the same content.
+
+    Args:
+        seed: Integer seed
+
+    Returns:
+        dict: Case, ready for MysteryPlot(case=...) once check_case passes
+    """
+    from src.mystery_plot import MysteryPlot
+
+    rng = random.Random(seed)
+    authored = MysteryPlot()
+    victim = authored.victim
+    locations = get_content().locations
+    death_start, death_end = victim.death_window
+
+    reachable = _reachable(locations, START_LOCATION)
+    away = sorted(
+        key for key in reachable if key not in victim.scene and key != START_LOCATION
+    )
+    cast = list(authored.suspects)
+    humans = [name for name in cast if not _is_robot(name)]
+    killer = rng.choice(humans)
+    innocents = [name for name in cast if name != killer]
+
+    # Innocents are cleared either by witnesses covering the death window
+    # or by a finding; a decoy or two are implicated first
+    decoys = rng.sample(innocents, rng.randint(1, 2))
+    by_alibi = [name for name in innocents if rng.random() < 0.6]
+    by_finding = [name for name in innocents if name not in by_alibi]
+
+    suspects = {}
+    sightings = []
+    for name in cast:
+        location = rng.choice(away)
+        place = locations[location]["name"]
+        if name == killer:
+            # Seen before and after, with a hole in the middle of the window
+            left = death_start - rng.randrange(10, 40)
+            back = rng.randrange(death_start + 25, death_end + 30)
+            witness = rng.choice(WITNESSES)
+            sightings.append([name, location, "12:00", format_clock(left), witness])
+            sightings.append([name, location, format_clock(back), "18:00", witness])
+            claim = [location, "12:00", "18:00"]
+            alibi = f"Claims to have been in the {place} all afternoon"
+            hideout = place
+        elif name in by_alibi:
+            start = death_start - rng.randrange(15, 120)
+            end = death_end + rng.randrange(15, 120)
+            split = rng.randrange(death_start + 5, death_end - 5)
+            second = rng.choice(away)
+            sightings.append(
+                [
+                    name,
+                    location,
+                    format_clock(start),
+                    format_clock(split),
+                    rng.choice(WITNESSES),
+                ]
+            )
+            sightings.append(
+                [
+                    name,
+                    second,
+                    format_clock(split),
+                    format_clock(end),
+                    rng.choice(WITNESSES),
+                ]
+            )
+            claim = [location, format_clock(start), format_clock(end)]
+            alibi = f"Says they were in the {place} with witnesses"
+        else:
+            claim = None
+            alibi = "Cannot say where they were; nobody saw them"
+        suspects[name] = {
+            "motive": rng.choice(MOTIVES),
+            "alibi": alibi,
+            "claim": claim,
+        }
+
+    evidence = []
+    topics = rng.sample(INCRIMINATING, rng.randint(ACCUSE_THRESHOLD + 1, 5))
+    for i, (topic, item, examine, finding) in enumerate(topics):
+        implicates = [killer]
+        if i < len(decoys):
+            implicates.append(decoys[i])
+            rng.shuffle(implicates)
+        evidence.append(
+            {
+                "topic": topic,
+                "item": item,
+                "examine": examine,
+                "implicates": implicates,
+                "clears": [],
+                "text": finding.format(who=_names(implicates)),
+            }
+        )
+    # Findings that clear whoever has no alibi, robots by the First Law
+    clearing = {entry[0]: entry for entry in CLEARING}
+    robots = [name for name in by_finding if _is_robot(name)]
+    people = [name for name in by_finding if not _is_robot(name)]
+    if robots:
+        topic, item, examine, finding = clearing["firstlaw"]
+        evidence.append(
+            {
+                "topic": topic,
+                "item": item,
+                "examine": examine,
+                "implicates": [],
+                "clears": robots,
+                "text": finding.format(who=_names(robots)),
+            }
+        )
+    if people:
+        topic, item, examine, finding = clearing[rng.choice(["roster", "medical"])]
+        evidence.append(
+            {
+                "topic": topic,
+                "item": item,
+                "examine": examine,
+                "implicates": [],
+                "clears": people,
+                "text": finding.format(who=_names(people)),
+            }
+        )
+
+    # Chain the leads: some only make sense once an earlier one is found
+    rng.shuffle(evidence)
+    slots = [(day, period) for day in (1, 2, 3) for period in TIME_PERIODS][1:]
+    events = []
+    for i, lead in enumerate(evidence):
+        lead["id"] = f"{lead['topic']}_evidence"
+        lead["requires"] = evidence[i - 1]["id"] if i and rng.random() < 0.5 else None
+        lead["location"] = rng.choice(away) if lead["item"] else None
+        day, period = slots[min(len(slots) - 1, i * len(slots) // len(evidence))]
+        hint = (
+            f"in the {locations[lead['location']]['name']}"
+            if lead["item"]
+            else "in the records"
+        )
+        events.append(
+            {
+                "id": f"case_{lead['topic']}",
+                "description": (
+                    f"An informant whispers that the {lead['topic']} lead "
+                    f"can be found {hint}."
+                ),
+                "period": period,
+                "day": day,
+            }
+        )
+
+    return {
+        "format": CASE_FORMAT,
+        "seed": seed,
+        "fingerprint": get_content().fingerprint,
+        "killer": killer,
+        "murder_motive": (
+            f"{suspects[killer]['motive']}. {killer} slipped out of the {hideout} "
+            f"during the afternoon, went to Spacetown and shot Sarton."
+        ),
+        "suspects": suspects,
+        "sightings": sightings,
+        "evidence": evidence,
+        "events": events,
+    }
+
+
+def check_case(case):
+    """Play a case through and report why it cannot be used.
+
+    The solver follows the lead chain, collecting each item from where it
+    was placed, records every finding and checks every alibi, then asks
+    the deduction engine who is left.
+
+    Args:
+        case: Case dict
+
+    Returns:
+        list: Problems (empty when the case is solvable and unambiguous)
+    """
+    from src.mystery_plot import MysteryPlot
+
+    problems = []
+    if case.get("format") != CASE_FORMAT:
+        return [f"case format {case.get('format')} is not {CASE_FORMAT}"]
+    locations = get_content().locations
+    reachable = _reachable(locations, START_LOCATION)
+    try:
+        mystery = MysteryPlot(case)
+    except (KeyError, TypeError, ValueError) as error:
+        return [f"case does not fit the cast or map: {error}"]
+
+    if case["killer"] not in mystery.suspects or _is_robot(case["killer"]):
+        problems.append(f"'{case['killer']}' cannot be the killer")
+    if len(mystery.leads) != len(case["evidence"]):
+        problems.append("two leads share a topic")
+    for lead in case["evidence"]:
+        if lead["item"] and lead["location"] not in reachable:
+            problems.append(f"{lead['item']} is placed where the player cannot go")
+        if lead["item"] and lead["item"] in get_content().items:
+            problems.append(f"{lead['item']} clashes with an authored item")
+    for sighting in case["sightings"]:
+        if sighting[1] not in locations:
+            problems.append(f"{sighting[0]} seen at unknown location '{sighting[1]}'")
+    if problems:
+        return problems
+
+    # Follow the chain in the order a player could
+    pending = list(case["evidence"])
+    while pending:
+        ready = [
+            lead
+            for lead in pending
+            if not lead["requires"] or mystery.has_evidence(lead["requires"])
+        ]
+        if not ready:
+            return [
+                f"leads can never be reached: {', '.join(l['id'] for l in pending)}"
+            ]
+        for lead in ready:
+            mystery.record_evidence(lead["id"])
+            pending.remove(lead)
+    for name in mystery.suspects:
+        mystery.verify_alibi(name)
+
+    remaining = mystery.deduction.candidates
+    if remaining != {case["killer"]}:
+        problems.append(
+            f"the facts leave {sorted(remaining)} instead of only the killer"
+        )
+    if mystery.evidence_against(case["killer"]) < ACCUSE_THRESHOLD:
+        problems.append("not enough evidence against the killer to accuse")
+    return problems
+
+
+def _generate_checked(seed):
+    """Generate and check one case (runs in a worker process).
+
+    Args:
+        seed: Integer seed
+
+    Returns:
+        tuple: (seed, case or None, problems)
+    """
+    case = generate_case(seed)
+    problems = check_case(case)
+    return seed, None if problems else case, problems
+
+
+class CaseCache:
+    """Directory of generated cases that already passed the solver."""
+
+    def __init__(self, directory=CACHE_DIR):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding one JSON file per case
+        """
+        self.directory = Path(directory)
+
+    def _path(self, seed):
+        """Get the file for a seed."""
+        return self.directory / f"case-{seed}.json"
+
+    def seeds(self):
+        """List the cached seeds.
+
+        Returns:
+            list: Seeds, oldest first
+        """
+        if not self.directory.exists():
+            return []
+        return sorted(int(path.stem[5:]) for path in self.directory.glob("case-*.json"))
+
+    def store(self, case):
+        """Write a checked case.
+
+        Args:
+            case: Case dict
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(case["seed"])
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(case), encoding="utf-8")
+        temporary.replace(path)
+
+    def fill(self, count, workers=None, first_seed=None):
+        """Generate cases in a process pool until the cache holds more.
+
+        Args:
+            count: Number of checked cases to add
+            workers: Worker processes (default: one per CPU)
+            first_seed: Seed to start from (default: random)
+
+        Returns:
+            tuple: (cases stored, seeds rejected by the solver)
+        """
+        seed = (
+            first_seed
+            if first_seed is not None
+            else random.SystemRandom().randrange(1 << 31)
+        )
+        stored = rejected = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while stored < count and stored + rejected < count * MAX_ATTEMPTS:
+                batch = range(seed, seed + (count - stored))
+                seed += len(batch)
+                for _, case, _problems in pool.map(_generate_checked, batch):
+                    if case is None:
+                        rejected += 1
+                    else:
+                        self.store(case)
+                        stored += 1
+        return stored, rejected
+
+    def take(self):
+        """Remove and return the oldest cached case that still checks out.
+
+        Cases made for older content are checked again, and dropped if
+        they no longer pass.
+
+        Returns:
+            dict or None: Case, or None when the cache is empty
+        """
+        for seed in self.seeds():
+            path = self._path(seed)
+            try:
+                case = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                case = None
+            path.unlink(missing_ok=True)
+            if case is None:
+                continue
+            if case.get("fingerprint") == get_content().fingerprint or not check_case(
+                case
+            ):
+                return case
+        return None
+
+
+def new_case(cache=None):
+    """Get a checked case, from the cache when it has one.
+
+    Args:
+        cache: CaseCache to take from (default: the standard cache)
+
+    Returns:
+        dict: Case
+
+    Raises:
+        RuntimeError: If no generated case passes the solver
+    """
+    case = (cache or CaseCache()).take()
+    first_seed = random.SystemRandom().randrange(1 << 31)
+    for seed in range(first_seed, first_seed + MAX_ATTEMPTS):
+        if case is not None:
+            return case
+        _, case, problems = _generate_checked(seed)
+    if case is None:
+        raise RuntimeError(f"No generated case passed the solver: {problems}")
+    return case
+
+
+if __name__ == "__main__":
+    count = (
+        int(sys.argv[sys.argv.index("--count") + 1]) if "--count" in sys.argv else 20
+    )
+    cache = CaseCache()
+    stored, rejected = cache.fill(count, workers=os.cpu_count())
+    print(
+        f"✅ Stored {stored} checked cases in {cache.directory} ({rejected} rejected)"
+    )
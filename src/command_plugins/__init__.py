@@ -0,0 +1,25 @@
+"""
+Command Plugins - Command modules imported on first use of one of their verbs
+"""
+
+# Verb -> plugin module. Listed here so the registry can route a verb to
+# its module without importing every plugin at startup.
+PLUGIN_COMMANDS = {
+    "ask": "family",
+    "play": "family",
+    "comfort": "family",
+    "travel": "travel",
+    "route": "travel",
+    "canvass": "crowd",
+    "analyze": "case",
+    "analyse": "case",
+    "timeline": "case",
+    "alibi": "case",
+    "whatif": "case",
+    "partner": "partner",
+    "wait": "clock",
+    "sleep": "clock",
+    "achievements": "records",
+    "leaderboard": "records",
+    "scores": "records",
+}
@@ -0,0 +1,238 @@
+"""
+Case Commands - Reasoning over the murder case
+"""
+
+from src.command_registry import command
+from src.mystery_plot import BRANCH_DESCRIPTIONS
+from src.planner import HintPlanner
+from src.schedules import DAY_MINUTES
+from src.timeline import CLAIM, EVENT
+from src.utils import format_clock
+
+# Longest lists shown before the rest are summarised
+MAX_LISTED = 8
+
+
+@command(
+    "analyze",
+    aliases=("analyse",),
+    usage=[("analyze", "Show who still fits the facts")],
+    category="INVESTIGATION",
+    read_only=True,
+    depends_on=("mystery",),
+)
+def cmd_analyze(processor, args):
+    """Analyze command - list the suspects the facts have not ruled out.
+
+    Args:
+        args: Unused
+    """
+    deduction = processor.game_state.mystery.deduction
+    candidates = deduction.ranked_candidates()
+
+    print("\n🧠 CASE ANALYSIS\n")
+    if not candidates:
+        print("  No suspect fits every fact. Something you recorded is wrong.\n")
+        return
+
+    print(f"  Still possible ({len(candidates)}):")
+    for name, support in candidates[:MAX_LISTED]:
+        clues = (
+            f"{support} clue{'s' if support != 1 else ''}"
+            if support
+            else "no evidence yet"
+        )
+        print(f"    • {name} — {clues}")
+    if len(candidates) > MAX_LISTED:
+        print(f"    … and {len(candidates) - MAX_LISTED} more")
+
+    if deduction.eliminated:
+        print("\n  Ruled out:")
+        for name, reason in list(deduction.eliminated.items())[:MAX_LISTED]:
+            print(f"    ✗ {name} — {reason}")
+        if len(deduction.eliminated) > MAX_LISTED:
+            print(f"    … and {len(deduction.eliminated) - MAX_LISTED} more")
+
+    leads = deduction.splitting_evidence()
+    if len(candidates) == 1:
+        print(f"\n  Only {candidates[0][0]} remains.\n")
+    elif leads:
+        print("\n  Leads that would narrow it down:")
+        for evidence, implicated in leads[:MAX_LISTED]:
+            lead = evidence.replace("_", " ")
+            print(f"    🔎 {lead} — would point at {', '.join(implicated)}")
+        print()
+    else:
+        print("\n  No open lead separates the remaining suspects.")
+        mystery = processor.game_state.mystery
+        unchecked = [
+            name for name, _ in candidates if not mystery.suspects[name].alibis_verified
+        ]
+        if unchecked:
+            print(f"  Alibis not yet checked: {', '.join(unchecked)}")
+        print()
+
+
+def _print_records(records, content):
+    """Print timeline records one per line.
+
+    Args:
+        records: TimelineRecords sorted by start
+        content: WorldBundle used for location names
+    """
+    for record in records:
+        place = content.locations.get(record.location, {}).get("name", record.location)
+        if record.kind == CLAIM:
+            line = f"{record.subject} claims to have been in {place}"
+        elif record.kind == EVENT:
+            line = f"{record.subject} in {place}"
+        else:
+            line = f"{record.subject} seen in {place} ({record.source})"
+        print(f"    {record.span():<11} {line}")
+
+
+@command(
+    "timeline",
+    usage=[
+        ("timeline", "Who was where at time of death"),
+        ("timeline <who|where>", "Whereabouts on the murder day"),
+    ],
+    category="INVESTIGATION",
+    read_only=True,
+    depends_on=("mystery",),
+)
+def cmd_timeline(processor, args):
+    """Timeline command - show whereabouts on the day of the murder.
+
+    Args:
+        args: Optional location or person to show the whole day for
+    """
+    mystery = processor.game_state.mystery
+    timeline = mystery.timeline
+    content = processor.content
+    start, end = mystery.victim.death_window
+
+    if not args:
+        print(f"\n🕒 TIME OF DEATH {format_clock(start)}–{format_clock(end)}\n")
+        print("  Confirmed near the scene:")
+        _print_records(timeline.present(mystery.victim.scene, start, end), content)
+        print("\n  Unaccounted for elsewhere:")
+        missing = timeline.unaccounted(
+            mystery.suspects, start, end, mystery.victim.scene
+        )
+        for name, gaps in missing:
+            spans = ", ".join(
+                f"{format_clock(lo)}–{format_clock(hi)}" for lo, hi in gaps
+            )
+            print(f"    • {name} — {spans}")
+        if not missing:
+            print("    Nobody.")
+        print()
+        return
+
+    query = args.strip()
+    location = content.data["location_names"].get(query.lower())
+    if location is None and query.lower().replace(" ", "_") in content.locations:
+        location = query.lower().replace(" ", "_")
+    if location is not None:
+        records = timeline.at(location, 0, DAY_MINUTES)
+        title = content.locations[location]["name"]
+    else:
+        title = processor.resolve_npc_name(query)
+        records = timeline.of(title, 0, DAY_MINUTES)
+        if not records and title not in mystery.suspects:
+            print(f"\n❌ Nothing on the timeline for '{query}'.\n")
+            return False
+
+    print(f"\n🕒 TIMELINE: {title}\n")
+    if records:
+        _print_records(records, content)
+    else:
+        print("    No recorded whereabouts.")
+    print()
+
+
+@command(
+    "alibi",
+    usage=[("alibi <suspect>", "Check an alibi against timeline")],
+    category="INVESTIGATION",
+    advances_time=20,
+)
+def cmd_alibi(processor, args):
+    """Alibi command - check a suspect's alibi against confirmed sightings.
+
+    Args:
+        args: Suspect name
+    """
+    if not args:
+        print("\n❌ Whose alibi do you want to check?\n")
+        return False
+
+    mystery = processor.game_state.mystery
+    name = processor.resolve_npc_name(args.strip())
+    suspect = mystery.suspects.get(name)
+    if suspect is None:
+        print(f"\n❌ '{args.strip()}' is not a suspect.\n")
+        return False
+
+    start, end = mystery.victim.death_window
+    solid = mystery.verify_alibi(name)
+    print(f"\n📋 {name} says: {suspect.alibi}")
+    if solid:
+        print(
+            "✅ Confirmed sightings account for the whole time of death. Ruled out.\n"
+        )
+        return
+    gaps = mystery.timeline.gaps(name, start, end, mystery.victim.scene)
+    spans = ", ".join(f"{format_clock(lo)}–{format_clock(hi)}" for lo, hi in gaps)
+    print(f"❓ Nobody can place them away from the scene during {spans}.\n")
+
+
+def _forecast(processor, game_state):
+    """Work out where a session could still lead.
+
+    Args:
+        processor: CommandProcessor
+        game_state: GameState of the real session or a fork of it
+
+    Returns:
+        str: Best ending still open and how far it is
+    """
+    plan = HintPlanner(game_state, processor.content).plan(processor.player)
+    if plan is None:
+        return "no ending within reach"
+    _, distance, ending, _ = plan
+    return f"{ending.title.title()}, {distance} step{'s' if distance != 1 else ''} away"
+
+
+@command(
+    "whatif",
+    usage=[("whatif [choice]", "See where a suspicion leads")],
+    category="INVESTIGATION",
+)
+def cmd_whatif(processor, args):
+    """Whatif command - play a branch of the case in a fork of the session.
+
+    The real session is left as it was.
+
+    Args:
+        args: Optional choice; without one every choice is compared
+    """
+    choice = (args or "").strip().lower().replace(" ", "_")
+    if choice and choice not in BRANCH_DESCRIPTIONS:
+        print(f"\n❌ Unknown choice. Try: {', '.join(BRANCH_DESCRIPTIONS)}\n")
+        return False
+
+    game_state = processor.game_state
+    print("\n🔀 WHAT IF…\n")
+    print(f"  As things stand: {_forecast(processor, game_state)}")
+    for name in [choice] if choice else BRANCH_DESCRIPTIONS:
+        branch = game_state.fork()
+        mystery = branch.mystery
+        mystery.branch_choice(name)
+        closed = sorted(mystery.locked_suspects | mystery.locked_evidence)
+        print(f"\n  {name.replace('_', ' ').capitalize()}:")
+        closes = ", ".join(c.replace("_", " ") for c in closed) or "nothing"
+        print(f"    Closes off: {closes}")
+        print(f"    Leads to:   {_forecast(processor, branch)}")
+    print()
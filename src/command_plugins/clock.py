@@ -0,0 +1,48 @@
+"""
+Clock Commands - Letting game time pass
+"""
+
+from src.command_registry import command
+
+
+@command(
+    "wait",
+    aliases=("sleep",),
+    usage=[
+        ("wait", "Wait until something happens"),
+        ("wait <minutes>", "Let some time pass"),
+    ],
+    category="GAME",
+    advances_time=True,
+)
+def cmd_wait(processor, args):
+    """Wait command - skip ahead on the game clock.
+
+    Without a number of minutes the clock jumps straight to the next
+    scheduled event.
+
+    Args:
+        args: Optional minutes to wait
+    """
+    game_state = processor.game_state
+    if args:
+        word = args.split()[0]
+        if not word.isdigit() or int(word) == 0:
+            print("\n❌ Usage: wait [minutes]\n")
+            return False
+        minutes = int(word)
+    else:
+        due = game_state.event_manager.next_event_time()
+        if due is None:
+            print(
+                "\n⏳ Nothing more is expected to happen. "
+                "Better to keep investigating.\n"
+            )
+            return False
+        minutes = max(0, due - game_state.clock)
+
+    game_state.advance_clock(minutes, record=True)
+    print(
+        f"\n⏳ {minutes} min pass. It is {game_state.clock_time()} on day "
+        f"{game_state.day} ({game_state.time_period}).\n"
+    )
@@ -0,0 +1,26 @@
+"""
+Crowd Commands - Questioning bystanders in the City's crowds
+"""
+
+from src.command_registry import command
+
+
+@command(
+    "canvass",
+    usage=[("canvass", "Ask bystanders what they saw")],
+    category="INVESTIGATION",
+    advances_time=20,
+)
+def cmd_canvass(processor, args):
+    """Canvass command - question the crowd around you for sightings.
+
+    Args:
+        args: Unused
+    """
+    location_key = processor.player.current_location
+    sighting = processor.game_state.world.crowds.sighting(location_key)
+    if sighting is None:
+        print("\n❌ There's no crowd here to canvass.\n")
+        return False
+
+    print(f"\n🗣️ A bystander leans in: '{sighting}'\n")
@@ -0,0 +1,104 @@
+"""
+Family Commands - Interactions with Jessie and Ben at home
+"""
+
+from src.command_registry import command
+
+
+def _increase_trust(processor, npc_name, amount):
+    """Raise an NPC's trust, if the game tracks a relationship with them."""
+    relationship = processor.game_state.relationships.get_relationship(npc_name)
+    if relationship is not None:
+        relationship.increase_trust(amount)
+
+
+@command(
+    "ask",
+    usage=[("ask <npc> <topic>", "Ask a family member about a topic")],
+    category="FAMILY",
+    advances_time=15,
+)
+def cmd_ask(processor, args):
+    """Ask command - ask an NPC about a topic (family-focused)
+
+    Args:
+        args: "<npc> <topic>"
+    """
+    if not args:
+        print("\n❌ Usage: ask <npc> <topic>\n")
+        return False
+
+    parts = args.split(maxsplit=1)
+    npc_input = parts[0].lower()
+    canonical_npc = processor.resolve_npc_name(npc_input)
+    topic = parts[1].lower() if len(parts) > 1 else ""
+
+    # Family-specific topics
+    if canonical_npc and canonical_npc.lower() in ("jessie baley",):
+        if "dinner" in topic or "meal" in topic:
+            print("\n💬 Jessie: 'Yes — dinner at seven. Ben is excited.'\n")
+            _increase_trust(processor, "Jessie Baley", 3)
+            return
+        print("\n💬 Jessie: 'I'm busy right now, love. Later?'\n")
+        return
+
+    if canonical_npc and canonical_npc.lower() in ("ben baley",):
+        if "robot" in topic:
+            print("\n💬 Ben: 'Robots are cool! They can walk and talk.'\n")
+            _increase_trust(processor, "Ben Baley", 2)
+            return
+        print("\n💬 Ben: 'I dunno about that. Can we play instead?'\n")
+        return
+
+    print(f"\n❌ You can't ask '{canonical_npc}' about that here.\n")
+    return False
+
+
+@command(
+    "play",
+    usage=[("play <npc>", "Play with a child NPC (Ben)")],
+    category="FAMILY",
+    advances_time=30,
+)
+def cmd_play(processor, args):
+    """Play command - play with a child NPC (Ben)."""
+    if not args:
+        print("\n❌ Play with whom? Try: play ben\n")
+        return False
+
+    npc_input = args.lower().strip()
+    canonical_npc = processor.resolve_npc_name(npc_input)
+
+    if canonical_npc and canonical_npc.lower() in ("ben baley",):
+        print("\n🎲 You play a quick game with Ben. He laughs and tugs your sleeve.\n")
+        _increase_trust(processor, "Ben Baley", 10)
+        return
+
+    print("\n❌ You can't play with that NPC.\n")
+    return False
+
+
+@command(
+    "comfort",
+    usage=[("comfort <npc>", "Comfort a worried family member")],
+    category="FAMILY",
+    advances_time=15,
+)
+def cmd_comfort(processor, args):
+    """Comfort command - comfort a worried family member (Jessie)."""
+    if not args:
+        print("\n❌ Comfort whom? Try: comfort jessie\n")
+        return False
+
+    npc_input = args.lower().strip()
+    canonical_npc = processor.resolve_npc_name(npc_input)
+
+    if canonical_npc and canonical_npc.lower() in ("jessie baley",):
+        print(
+            "\n🤝 You take Jessie in a brief embrace and assure her you'll be careful.\n"
+        )
+        _increase_trust(processor, "Jessie Baley", 8)
+        return
+
+    print("\n❌ That action isn't appropriate for that NPC.\n")
+    return False
@@ -0,0 +1,102 @@
+"""
+Partner Commands - Asking R. Daneel Olivaw for guidance
+"""
+
+from src.command_registry import command
+from src.planner import HintPlanner
+
+
+def _planner(processor):
+    """Get the session's hint planner, building it for a new case or map.
+
+    Args:
+        processor: CommandProcessor
+
+    Returns:
+        HintPlanner: Planner
+    """
+    game_state = processor.game_state
+    planner = game_state.hint_planner
+    if (
+        planner is None
+        or planner.mystery is not game_state.mystery
+        or planner.content is not processor.content
+    ):
+        planner = HintPlanner(game_state, processor.content)
+        game_state.hint_planner = planner
+    return planner
+
+
+def _describe(action, following, content):
+    """Put a planned step into Daneel's words.
+
+    Args:
+        action: Planned action tuple
+        following: Actions after it
+        content: WorldBundle used for location names
+
+    Returns:
+        str: Suggestion
+    """
+    kind = action[0]
+    if kind == "go":
+        target = content.locations[action[2]]["name"]
+        purpose = next((step for step in following if step[0] != "go"), None)
+        reason = ""
+        if purpose and purpose[0] == "take":
+            reason = f" The {purpose[1]} lies ahead, and we will need it."
+        elif purpose and purpose[0] == "investigate":
+            lead = purpose[1].replace("_", " ")
+            reason = f" From there we can look into the {lead} lead."
+        return (
+            f"I suggest we go {action[1]}, toward the {target}.{reason} "
+            f"('go {action[1]}')"
+        )
+    if kind == "take":
+        return (
+            f"That {action[1]} may prove important. We should take it. "
+            f"('take {action[1]}')"
+        )
+    if kind == "investigate":
+        return (
+            f"We have what we need to pursue the {action[1].replace('_', ' ')} lead. "
+            f"('investigate {action[1]}')"
+        )
+    if kind == "puzzle":
+        return (
+            f"Your record would be stronger if the {action[1]} puzzle were solved. "
+            f"('puzzle {action[1]}' for a clue)"
+        )
+    return (
+        "The evidence now suffices for an accusation. Review it first with 'analyze'."
+    )
+
+
+@command(
+    "partner",
+    usage=[("partner hint", "Ask Daneel what to do next")],
+    category="INVESTIGATION",
+)
+def cmd_partner(processor, args):
+    """Partner command - consult R. Daneel Olivaw.
+
+    Args:
+        args: "hint"
+    """
+    if (args or "").strip().lower() != "hint":
+        print("\n❌ Usage: partner hint\n")
+        return False
+
+    name = processor.game_state.partner_name
+    plan = _planner(processor).plan(processor.player)
+    if plan is None:
+        print(
+            f"\n🤖 {name}: 'I see no way forward from here, partner. "
+            f"Perhaps we should return to the City proper.'\n"
+        )
+        return
+
+    action, distance, ending, following = plan
+    print(f"\n🤖 {name}: '{_describe(action, following, processor.content)}'")
+    steps = f"{distance} step{'s' if distance != 1 else ''}"
+    print(f"   ({steps} from the best outcome still open: {ending.title.title()})\n")
@@ -0,0 +1,73 @@
+"""
+Record Commands - Achievements and the local leaderboard
+"""
+
+from src.command_registry import command
+from src.leaderboard import format_runs
+
+DIFFICULTIES = ("easy", "normal", "hard")
+
+
+@command(
+    "achievements",
+    usage=[("achievements", "Show achievements and progress")],
+    category="GAME",
+)
+def cmd_achievements(processor, args):
+    """Achievements command - list achievements and progress toward them."""
+    tracker = processor.records
+    if tracker is None:
+        print("\n🏆 Achievements are not tracked in this session.\n")
+        return False
+
+    print("\n🏆 ACHIEVEMENTS\n")
+    for achievement, unlocked, value in tracker.progress():
+        if unlocked:
+            status = "✅"
+            detail = ""
+        else:
+            status = "🔒"
+            detail = f" ({value if value is not None else 0}/{achievement.goal})"
+        print(f"  {status} {achievement.title} - {achievement.description}{detail}")
+    print()
+    return True
+
+
+@command(
+    "leaderboard",
+    aliases=("scores",),
+    usage=[
+        ("leaderboard", "Show the best finished games"),
+        ("leaderboard <filter>", "Best games at a difficulty/ending"),
+    ],
+    category="GAME",
+)
+def cmd_leaderboard(processor, args):
+    """Leaderboard command - show the top finished games.
+
+    Args:
+        args: Optional difficulty or ending ID to filter by
+    """
+    tracker = processor.records
+    if tracker is None or tracker.leaderboard is None:
+        print("\n🏆 The leaderboard is not kept in this session.\n")
+        return False
+
+    difficulty = ending = None
+    word = args.strip().lower()
+    if word in DIFFICULTIES:
+        difficulty = word
+    elif word:
+        endings = {e.ending_id for e in processor.game_state.endings_manager.endings}
+        if word not in endings:
+            print(f"\n❌ Unknown difficulty or ending '{word}'.")
+            choices = ", ".join(DIFFICULTIES + tuple(sorted(endings)))
+            print(f"   Try one of: {choices}\n")
+            return False
+        ending = word
+
+    runs = tracker.leaderboard.top(10, difficulty=difficulty, ending=ending)
+    print(f"\n🏆 LEADERBOARD{f' ({word})' if word else ''}\n")
+    print(format_runs(runs) if runs else "   No finished games yet.")
+    print()
+    return True
@@ -0,0 +1,163 @@
+"""
+Travel Commands - Multi-step movement by foot, strip and expressway
+"""
+
+from src.command_registry import command
+from src.parser import ARTICLES, PREPOSITIONS
+from src.transit import merge_legs, route_in_world
+
+MODE_ICONS = {"walk": "🚶", "strip": "🛤️", "expressway": "🚄"}
+
+
+def _resolve_destination(world, args):
+    """Resolve a travel argument to a location key.
+
+    Args:
+        world: WorldState
+        args: Raw argument text, e.g. "to the records office"
+
+    Returns:
+        str or None: Location key
+    """
+    words = [
+        w for w in args.lower().split() if w not in ARTICLES and w not in PREPOSITIONS
+    ]
+    return world.find_location(" ".join(words)) if words else None
+
+
+def _print_destinations(world, source):
+    """List every authored location with its travel time from the player.
+
+    Args:
+        world: WorldState
+        source: Player's location key
+    """
+    reachable = []
+    unreachable = []
+    for key, location in world.locations.items():
+        if key == source:
+            continue
+        route = route_in_world(world, source, key)
+        if route is None:
+            unreachable.append(location.name)
+        else:
+            reachable.append(f"{location.name} ({route[0]} min)")
+
+    if reachable:
+        print(f"🗺️ Destinations: {', '.join(reachable)}")
+    if unreachable:
+        print(f"🚫 Unreachable from here: {', '.join(unreachable)}")
+    print()
+
+
+def _plan(processor, args, verb):
+    """Find the fastest route from the player's location to a destination.
+
+    Prints the reason when no route can be used.
+
+    Args:
+        processor: CommandProcessor
+        args: Destination text
+        verb: Command name used in messages
+
+    Returns:
+        tuple or None: (destination key, total minutes, legs)
+    """
+    world = processor.game_state.world
+    source = processor.player.current_location
+    if not args:
+        print(f"\n❌ Usage: {verb} <location>\n")
+        _print_destinations(world, source)
+        return None
+
+    destination = _resolve_destination(world, args)
+    if destination is None:
+        print(f"\n❌ Unknown location '{args}'.\n")
+        return None
+
+    route = route_in_world(world, source, destination)
+    if route is None:
+        name = world.get_location(destination).name
+        print(f"\n❌ {name} cannot be reached from here - no route leads there.\n")
+        return None
+
+    minutes, legs = route
+    if not legs:
+        print("\n📍 You are already there.\n")
+        return None
+    return destination, minutes, legs
+
+
+def _print_legs(world, legs):
+    """Print the legs of a route, merging consecutive rides.
+
+    Args:
+        world: WorldState
+        legs: List of (mode, label, location key, minutes)
+    """
+    for mode, label, key, minutes in merge_legs(legs):
+        if mode == "walk":
+            how = f"walk {label}"
+        elif mode == "strip":
+            how = "ride the strips"
+        else:
+            how = f"take the {label}"
+        name = world.get_location(key).name
+        print(f"   {MODE_ICONS[mode]} {how} → {name} ({minutes} min)")
+
+
+@command(
+    "route",
+    usage=[("route <location>", "Show the fastest way there")],
+    category="MOVEMENT",
+)
+def cmd_route(processor, args):
+    """Route command - show the fastest route without moving.
+
+    Args:
+        args: Destination location
+    """
+    plan = _plan(processor, args, "route")
+    if plan is None:
+        return False
+
+    _, minutes, legs = plan
+    print(f"\n🗺️ Fastest route ({minutes} min):")
+    _print_legs(processor.game_state.world, legs)
+    print()
+
+
+@command(
+    "travel",
+    usage=[("travel <location>", "Go there in one turn")],
+    category="MOVEMENT",
+    advances_time=True,
+)
+def cmd_travel(processor, args):
+    """Travel command - follow the fastest route to a location.
+
+    The trip's duration passes on the game clock.
+
+    Args:
+        args: Destination location
+    """
+    plan = _plan(processor, args, "travel")
+    if plan is None:
+        return False
+
+    destination, minutes, legs = plan
+    game_state = processor.game_state
+    world = game_state.world
+    for _, _, location_key, _ in legs:
+        # Sector rooms passed on the way are not streamed in
+        if location_key == destination or not world.is_generated(location_key):
+            game_state.visit_location(location_key)
+    processor.player.current_location = destination
+
+    game_state.advance_clock(minutes, record=True)
+    print(f"\n✅ You travel to {world.get_location(destination).name}:")
+    _print_legs(world, legs)
+    print(
+        f"\n⏱️ The trip took {minutes} min. "
+        f"{game_state.mystery.time_remaining} min until the Spacers leave.\n"
+    )
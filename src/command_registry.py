@@ -0,0 +1,223 @@
+"""
+Command Registry - Declarative command metadata and lazy plugin loading
+"""
+
+import importlib
+
+# Order in which help categories are listed
+CATEGORY_ORDER = [
+    "MOVEMENT",
+    "INTERACTION",
+    "INVESTIGATION",
+    "INFORMATION",
+    "SETTINGS",
+    "FAMILY",
+    "SAVE/LOAD",
+    "GAME",
+]
+
+HELP_WIDTH = 60
+
+
+class CommandSpec:
+    """Metadata describing a single player command."""
+
+    def __init__(
+        self,
+        name,
+        handler=None,
+        aliases=(),
+        usage=(),
+        category="GAME",
+        advances_time=False,
+        read_only=False,
+        depends_on=(),
+    ):
+        """Initialize a command spec.
+
+        Args:
+            name: Primary verb
+            handler: Function called as handler(processor, args), or None
+                for commands handled by the game engine itself
+            aliases: Alternative verbs
+            usage: List of (syntax, description) pairs shown in help
+            category: Help category
+            advances_time: Game minutes the command takes when it
+                succeeds, True if the handler lets time pass itself, or
+                False if it takes no time
+            read_only: Whether the command never changes game state
+            depends_on: Names of the state objects ("player", "game_state",
+                "mystery", "relationships") whose versions key the cached
+                output of a read-only command
+        """
+        self.name = name
+        self.handler = handler
+        self.aliases = tuple(aliases)
+        self.usage = list(usage)
+        self.category = category
+        self.advances_time = advances_time
+        # Minutes charged after the handler succeeds
+        self.minutes = 0 if isinstance(advances_time, bool) else advances_time
+        self.read_only = read_only
+        self.depends_on = tuple(depends_on)
+
+    @property
+    def verbs(self):
+        """All verbs that invoke this command."""
+        return (self.name,) + self.aliases
+
+
+def command(name, **metadata):
+    """Decorator that attaches command metadata to a handler.
+
+    The handler is registered when its class (or plugin module) is
+    collected by a CommandRegistry.
+
+    Args:
+        name: Primary verb
+        **metadata: Keyword arguments for CommandSpec
+
+    Returns:
+        function: Decorator
+    """
+
+    def decorator(func):
+        func.command_spec = CommandSpec(name, func, **metadata)
+        return func
+
+    return decorator
+
+
+class CommandRegistry:
+    """Maps verbs to command specs, importing plugin modules on first use."""
+
+    def __init__(self, plugin_package=None, plugin_index=None):
+        """Initialize the registry.
+
+        Args:
+            plugin_package: Dotted package name holding plugin modules
+            plugin_index: Dict of verb to plugin module name (relative to
+                plugin_package), consulted before the plugin is imported
+        """
+        self.specs = {}
+        self.verbs = {}
+        self.plugin_package = plugin_package
+        self.plugin_index = dict(plugin_index or {})
+        self.loaded_plugins = set()
+
+    def register(self, spec):
+        """Register a command spec under all of its verbs.
+
+        Args:
+            spec: CommandSpec to register
+
+        Raises:
+            ValueError: If a verb is already taken by another command
+        """
+        for verb in spec.verbs:
+            existing = self.verbs.get(verb)
+            if existing is not None and existing is not spec:
+                raise ValueError(
+                    f"Verb '{verb}' of '{spec.name}' is already registered "
+                    f"by '{existing.name}'"
+                )
+            self.verbs[verb] = spec
+        self.specs[spec.name] = spec
+
+    def collect(self, namespace):
+        """Register every decorated handler found in a class or module.
+
+        Args:
+            namespace: Class or module to scan
+        """
+        for value in vars(namespace).values():
+            spec = getattr(value, "command_spec", None)
+            if isinstance(spec, CommandSpec):
+                self.register(spec)
+
+    def describe(self, name, **metadata):
+        """Register help metadata for a command handled outside the registry.
+
+        Args:
+            name: Primary verb
+            **metadata: Keyword arguments for CommandSpec
+        """
+        self.register(CommandSpec(name, None, **metadata))
+
+    def lookup(self, verb):
+        """Find the spec for a verb, loading its plugin if needed.
+
+        Args:
+            verb: Lowercase verb
+
+        Returns:
+            CommandSpec or None
+        """
+        spec = self.verbs.get(verb)
+        if spec is None and verb in self.plugin_index:
+            self.load_plugin(self.plugin_index[verb])
+            spec = self.verbs.get(verb)
+        return spec
+
+    def load_plugin(self, module_name):
+        """Import a plugin module and register its commands.
+
+        Args:
+            module_name: Module name relative to the plugin package
+        """
+        if module_name in self.loaded_plugins:
+            return
+        module = importlib.import_module(f"{self.plugin_package}.{module_name}")
+        self.collect(module)
+        self.loaded_plugins.add(module_name)
+
+    def load_all_plugins(self):
+        """Import every plugin module listed in the index."""
+        for module_name in sorted(set(self.plugin_index.values())):
+            self.load_plugin(module_name)
+
+    def render_help(self, footer_sections=()):
+        """Render the help box from command metadata.
+
+        Plugins are loaded first so their commands are listed too.
+
+        Args:
+            footer_sections: Extra blocks of text appended inside the box,
+                each under its own divider
+
+        Returns:
+            str: Formatted help text
+        """
+        self.load_all_plugins()
+
+        by_category = {}
+        for spec in self.specs.values():
+            by_category.setdefault(spec.category, []).append(spec)
+
+        inner = HELP_WIDTH - 2
+        lines = [
+            f"╔{'═' * inner}╗",
+            f"║{'AVAILABLE COMMANDS':^{inner}}║",
+            f"╠{'═' * inner}╣",
+        ]
+        categories = CATEGORY_ORDER + sorted(set(by_category) - set(CATEGORY_ORDER))
+        first = True
+        for category in categories:
+            specs = by_category.get(category)
+            if not specs:
+                continue
+            if not first:
+                lines.append(f"║{'':{inner}}║")
+            first = False
+            lines.append(f"║ {category + ':':<{inner - 1}}║")
+            for spec in specs:
+                for syntax, description in spec.usage:
+                    text = f"   {syntax:<20} {description}"
+                    lines.append(f"║{text:<{inner}}║")
+        for section in footer_sections:
+            lines.append(f"╠{'═' * inner}╣")
+            for line in section.strip("\n").split("\n"):
+                lines.append(f"║ {line:<{inner - 1}}║")
+        lines.append(f"╚{'═' * inner}╝")
+
+        return "\n" + "\n".join(f"        {line}" for line in lines) + "\n"
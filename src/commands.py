@@ -2,49 +2,48 @@
 Command Processor - Handles player commands
 """
 
-from src.locations import LOCATIONS
-
-
-# NPC name mappings for first-name shortcuts
-NPC_NAME_MAP = {
-    # Full names
-    "r. daneel olivaw": "R. Daneel Olivaw",
-    "daneel": "R. Daneel Olivaw",
-    "r daneel": "R. Daneel Olivaw",
-    "olivaw": "R. Daneel Olivaw",
-    "julius enderby": "Julius Enderby",
-    "julius": "Julius Enderby",
-    "enderby": "Julius Enderby",
-    "commissioner": "Julius Enderby",
-    "records clerk": "Records Clerk",
-    "clerk": "Records Clerk",
-    "vince barrett": "Vince Barrett",
-    "vince": "Vince Barrett",
-    "barrett": "Vince Barrett",
-    "r. sammy": "R. Sammy",
-    "sammy": "R. Sammy",
-    "r sammy": "R. Sammy",
-    "han fastolfe": "Han Fastolfe",
-    "han": "Han Fastolfe",
-    "fastolfe": "Han Fastolfe",
-    "dr. anthony gerrigel": "Dr. Anthony Gerrigel",
-    "anthony": "Dr. Anthony Gerrigel",
-    "gerrigel": "Dr. Anthony Gerrigel",
-    "dr gerrigel": "Dr. Anthony Gerrigel",
-    "francis clousarr": "Francis Clousarr",
-    "francis clousarr": "Francis Clousarr",
-    "clousarr": "Francis Clousarr",
-    "jessie bailey": "Jessie Bailey",
-    "jessie": "Jessie Bailey",
-    "ben bailey": "Ben Bailey",
-    "ben": "Ben Bailey",
-    "bentley": "Ben Bailey",
-}
+import io
+from contextlib import redirect_stdout
+
+from src.command_plugins import PLUGIN_COMMANDS
+from src.command_registry import CommandRegistry, command
+from src.content import get_content
+from src.parser import CommandParser
+from src.transit import WALK_MINUTES
+
+# Game minutes taken by commands that charge their own time, so that only
+# real attempts use up the deadline
+ACCUSE_MINUTES = 30
+PUZZLE_MINUTES = 20
+
+# Static tips appended below the generated command list in 'help'
+HELP_FOOTER = (
+    """NAVIGATION TIPS:
+- Use 'go <direction>' or 'go <location>' to move.
+- Type 'look' to see your current surroundings.
+- Use 'examine <thing>' for details on objects/NPCs.
+- Chain commands with ';', e.g. 'go corridor; go plaza'.""",
+    """SETTINGS DETAILS:
+- Change your detective name for immersion.
+- Difficulty affects puzzle and investigation challenge.
+- Text speed adjusts how quickly text appears.
+- Accessibility mode enables high-contrast display.""",
+)
+
+# NPCs whose dialogue presents a numbered choice menu
+INTERACTIVE_NPCS = ("jessie baley", "ben baley")
 
 
 class CommandProcessor:
     """Processes and executes player commands."""
 
+    # Shared by all sessions so repeated phrasings hit the same parse cache;
+    # built from the content bundle by the first processor
+    parser = None
+
+    # Built once for the class from the @command handlers below
+    registry = CommandRegistry("src.command_plugins", PLUGIN_COMMANDS)
+
     def __init__(self, player, game_state, demo_mode=False):
         """Initialize command processor.
 
@@ -56,37 +55,32 @@ class CommandProcessor:
         self.player = player
         self.game_state = game_state
         self.demo_mode = demo_mode
-        self.commands = {
-            "look": self.cmd_look,
-            "go": self.cmd_go,
-            "move": self.cmd_go,
-            "examine": self.cmd_examine,
-            "inspect": self.cmd_examine,
-            "talk": self.cmd_talk,
-            "ask": self.cmd_ask,
-            "play": self.cmd_play,
-            "comfort": self.cmd_comfort,
-            "speak": self.cmd_talk,
-            "inventory": self.cmd_inventory,
-            "inv": self.cmd_inventory,
-            "i": self.cmd_inventory,
-            "take": self.cmd_take,
-            "get": self.cmd_take,
-            "drop": self.cmd_drop,
-            "status": self.cmd_status,
-            "stats": self.cmd_stats,
-            "help": self.cmd_help,
-            "accuse": self.cmd_accuse,
-            "investigate": self.cmd_investigate,
-            "relationships": self.cmd_relationships,
-            "mystery": self.cmd_mystery,
-            "puzzle": self.cmd_puzzle,
-            "settings": self.cmd_settings,
-            "quit": self.cmd_quit,
-            # 'exit' intentionally omitted so it does NOT quit the game
-        }
+        # AchievementTracker of a session that keeps records, else None
+        self.records = None
+        if CommandProcessor.parser is None:
+            CommandProcessor.use_content(self.content)
+
+        # Output of read-only commands keyed by (command, args), stored
+        # with the state versions it was rendered under
+        self.render_cache = {}
+        self.render_cache_hits = 0
+        self.render_cache_misses = 0
+
+    @property
+    def content(self):
+        """The current world content (replaced by a content reload)."""
+        return get_content()
+
+    @classmethod
+    def use_content(cls, content):
+        """Build the shared parser from a content bundle's alias tables.
 
-    def _resolve_npc_name(self, input_name):
+        Args:
+            content: WorldBundle
+        """
+        cls.parser = CommandParser(content.npc_aliases, content.item_aliases)
+
+    def resolve_npc_name(self, input_name):
         """Resolve a player input NPC name to the canonical full name.
 
         Args:
@@ -95,33 +89,151 @@ class CommandProcessor:
         Returns:
             str: Canonical NPC name, or the input if no match found
         """
-        input_lower = input_name.lower().strip()
-        return NPC_NAME_MAP.get(input_lower, input_name)
+        return self.content.resolve_npc(input_name) or input_name
 
     def process(self, command_string):
         """Process a player command.
 
         Args:
             command_string: The command string from the player
+
+        Returns:
+            bool: False if the command failed or was not recognised
         """
-        parts = command_string.split(maxsplit=1)
-        if not parts:
-            return
+        command, args = self.parse(command_string)
+        if not command:
+            return False
+
+        spec = self.registry.lookup(command)
+        if spec is not None and spec.handler is not None:
+            if spec.read_only:
+                return self._run_cached(spec, args)
+            succeeded = spec.handler(self, args) is not False
+            if succeeded and spec.minutes:
+                self.game_state.advance_clock(spec.minutes)
+            return succeeded
 
-        command = parts[0].lower()
-        args = parts[1] if len(parts) > 1 else ""
+        print(
+            f"\n❌ Unknown command: '{command}'. Type 'help' for available commands.\n"
+        )
+        return False
 
-        if command in self.commands:
-            self.commands[command](args)
-        else:
-            print(
-                f"\n❌ Unknown command: '{command}'. Type 'help' for available commands.\n"
-            )
+    def parse(self, command_string):
+        """Parse player input against the current location.
+
+        Args:
+            command_string: The command string from the player
+
+        Returns:
+            tuple: (command, args)
+        """
+        world = self.game_state.world
+        location_key = self.player.current_location
+        context = (
+            location_key,
+            tuple(world.exits_at(location_key).items()),
+            tuple(world.npcs_at(location_key)),
+            tuple(world.items_at(location_key)),
+            tuple(self.player.inventory),
+        )
+        return self.parser.parse(command_string, context)
+
+    def _run_cached(self, spec, args):
+        """Run a read-only command, reusing its output if state is unchanged.
+
+        Args:
+            spec: CommandSpec of a read-only command
+            args: Command arguments
+
+        Returns:
+            bool: Whether the command succeeded
+        """
+        key = (spec.name, args)
+        versions = self._state_versions(spec.depends_on)
+        cached = self.render_cache.get(key)
+        if cached is not None and cached[0] == versions:
+            self.render_cache_hits += 1
+            print(cached[1], end="")
+            return cached[2]
+
+        self.render_cache_misses += 1
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            succeeded = spec.handler(self, args) is not False
+        output = buffer.getvalue()
+        self.render_cache[key] = (versions, output, succeeded)
+        print(output, end="")
+        return succeeded
+
+    def _state_versions(self, names):
+        """Get the mutation versions of the named state objects.
+
+        A new case brings new state objects whose versions start over, so
+        the case generation comes first.
+
+        Args:
+            names: Tuple of state names from CommandSpec.depends_on
+
+        Returns:
+            tuple: Case generation, then version numbers in the same order
+        """
+        states = {
+            "player": self.player,
+            "game_state": self.game_state,
+            "mystery": self.game_state.mystery,
+            "relationships": self.game_state.relationships,
+        }
+        return (
+            self.game_state.case_generation,
+            *(states[name].version for name in names),
+        )
 
+    def render_cache_stats(self):
+        """Get hit statistics for the read-only render cache.
+
+        Returns:
+            dict: hits, misses and hit_rate (0.0-1.0)
+        """
+        total = self.render_cache_hits + self.render_cache_misses
+        return {
+            "hits": self.render_cache_hits,
+            "misses": self.render_cache_misses,
+            "hit_rate": self.render_cache_hits / total if total else 0.0,
+        }
+
+    def needs_input(self, command_string):
+        """Check whether a command will stop and prompt the player.
+
+        Args:
+            command_string: The command string from the player
+
+        Returns:
+            bool: True if the command shows an interactive choice menu
+        """
+        if self.demo_mode:
+            return False
+
+        command, args = self.parse(command_string)
+        return command == "talk" and args.lower().strip() in INTERACTIVE_NPCS
+
+    @command(
+        "look",
+        usage=[("look", "Look around your surroundings")],
+        category="MOVEMENT",
+        read_only=True,
+        depends_on=("player",),
+    )
     def cmd_look(self, args):
         """Look command - examine current surroundings."""
         print(f"\n{self.player.get_status()}\n")
 
+    @command(
+        "go",
+        aliases=("move",),
+        usage=[("go <direction>", "Move to another location")],
+        category="MOVEMENT",
+        advances_time=WALK_MINUTES,
+    )
     def cmd_go(self, args):
         """Go/move command - move to another location.
 
@@ -130,28 +242,35 @@ class CommandProcessor:
         """
         if not args:
             print("\n❌ Go where? Please specify a direction or location.\n")
-            return
+            return False
 
         args = args.lower().strip()
-        location = LOCATIONS.get(self.player.current_location)
-        if not location:
+        world = self.game_state.world
+        if not world.get_location(self.player.current_location):
             print("\n❌ Current location data is missing. You cannot move right now.\n")
-            return
+            return False
 
-        exits = getattr(location, "exits", {}) or {}
+        exits = world.exits_at(self.player.current_location)
         if args not in exits:
             print(f"\n❌ You can't go {args} from here.\n")
             if exits:
                 print(f"Available exits: {', '.join(exits.keys())}\n")
             else:
                 print("There are no obvious exits from here.\n")
-            return
+            return False
 
-        new_location = location.exits[args]
+        new_location = exits[args]
         self.player.current_location = new_location
-        self.game_state.visited_locations.add(new_location)
+        self.game_state.visit_location(new_location)
         print(f"\n✅ You move {args}...\n")
 
+    @command(
+        "examine",
+        aliases=("inspect",),
+        usage=[("examine <thing>", "Examine an object or person")],
+        category="MOVEMENT",
+        advances_time=10,
+    )
     def cmd_examine(self, args):
         """Examine command - look closely at something.
 
@@ -160,16 +279,17 @@ class CommandProcessor:
         """
         if not args:
             print("\n❌ Examine what? Please specify.\n")
-            return
+            return False
 
         args = args.lower().strip()
-        location = LOCATIONS.get(self.player.current_location)
-        if not location:
+        world = self.game_state.world
+        location_key = self.player.current_location
+        if not world.get_location(location_key):
             print("\n❌ Current location data is missing. Nothing to examine here.\n")
-            return
+            return False
 
-        loc_items = location.items or []
-        loc_npcs = location.npcs or []
+        loc_items = world.items_at(location_key)
+        loc_npcs = world.npcs_at(location_key)
 
         # Check items in location
         if args in [item.lower() for item in loc_items]:
@@ -187,6 +307,7 @@ class CommandProcessor:
             return
 
         print(f"\n❌ You don't see '{args}' here.\n")
+        return False
 
     def _examine_item(self, item):
         """Examine an item at current location.
@@ -194,23 +315,11 @@ class CommandProcessor:
         Args:
             item: Item name
         """
-        examinations = {
-            "notebook": "Your worn detective's notebook, filled with years of observations and cases.",
-            "communication_device": "A sleek communication device. You can contact the station from here.",
-            "case_files": "Official case files. They contain details about recent incidents in the city.",
-            "forensic_evidence": "Evidence markers and biological samples. Whoever did this left traces.",
-            "personal_effects": "Belongings of the victim. A wedding ring, a photo, personal mementos.",
-            "citizen_records": "Vast databases of every citizen in the Caves. Where do you start?",
-            "nutrition_pack": "Standard nutrition rations. Efficient, but utterly flavorless.",
-            "eyeglass_evidence": """A pair of eyeglasses in a repair case. The lenses are clearly broken — shattered 
-in a pattern consistent with impact trauma. The metal frames show signs of stress. 
-These glasses are definitely not new — they're being repaired. 
-                
-You notice fragments of glass that could be tested forensically. 
-This might be connected to the crime scene.""",
-        }
-
-        examination = examinations.get(item, f"You examine the {item} carefully.")
+        examination = (
+            self.content.examination(item)
+            or self.game_state.mystery.item_examinations.get(item)
+            or f"You examine the {item} carefully."
+        )
         print(f"\n🔍 {examination}\n")
 
     def _examine_npc(self, npc):
@@ -220,35 +329,23 @@ This might be connected to the crime scene.""",
             npc: NPC name (can be first name or full name)
         """
         # Resolve first name to full name
-        canonical_npc = self._resolve_npc_name(npc)
-        
-        descriptions = {
-            "r. daneel olivaw": "A humanoid robot with a smooth, plastic face and penetrating electronic eyes. Despite being a robot, there's something almost human about him.",
-            "julius enderby": "The Commissioner — an imposing man in uniform with keen eyes. He commands authority and expects results.",
-            "desk officer": "A hardened veteran of the police force, weathered by years of service.",
-            "neighbor": "An ordinary citizen going about their daily life.",
-            "city official": "A bureaucrat in formal attire, always busy with official business.",
-            "street vendor": "Someone selling goods in the plaza, trying to make a living.",
-            "administrator": "A professional, efficient and polite.",
-            "records clerk": "A tired-looking person who has spent years managing data.",
-            "dispensary attendant": "An employee mindlessly restocking nutrition dispensers.",
-            "scene officer": "A forensic officer still collecting evidence.",
-            "jessie bailey": "Jessie Bailey — your wife. Warm, practical, and quietly proud of your work. She worries about the long hours and keeps the household steady.",
-            "ben bailey": "Ben Bailey — your young son. Energetic, curious, and fascinated by robots. He loves asking questions and getting distracted easily.",
-            "vince barrett": "A junior officer with a bitter expression. He lost his position when robots were integrated into the department.",
-            "r. sammy": "A service robot with efficient movements. His optical sensors track everything with mechanical precision.",
-            "han fastolfe": "A well-dressed stranger with an air of quiet authority. He carries himself with the bearing of someone accustomed to spacer technology.",
-            "dr. anthony gerrigel": "A distinguished scientist surrounded by robotics equipment and research data. His expression is thoughtful and measured.",
-            "francis clousarr": "A thin, intense man behind detention glass. His eyes burn with conviction and resentment toward robots.",
-        }
+        canonical_npc = self.resolve_npc_name(npc)
 
         if canonical_npc:
-            key = canonical_npc.lower()
-            description = descriptions.get(key, f"You observe {canonical_npc} carefully.")
+            description = self.content.description(canonical_npc) or (
+                f"You observe {canonical_npc} carefully."
+            )
         else:
             description = "You observe an unknown character carefully."
         print(f"\n👤 {description}\n")
 
+    @command(
+        "talk",
+        aliases=("speak",),
+        usage=[("talk <to person>", "Speak with an NPC")],
+        category="INTERACTION",
+        advances_time=15,
+    )
     def cmd_talk(self, args):
         """Talk command - speak to an NPC.
 
@@ -257,18 +354,18 @@ This might be connected to the crime scene.""",
         """
         if not args:
             print("\n❌ Talk to whom? Specify an NPC.\n")
-            return
+            return False
 
         args = args.lower().strip()
-        location = LOCATIONS.get(self.player.current_location)
-        if not location:
+        world = self.game_state.world
+        if not world.get_location(self.player.current_location):
             print("\n❌ Current location data is missing. No one to talk to.\n")
-            return
+            return False
 
-        loc_npcs = location.npcs or []
+        loc_npcs = world.npcs_at(self.player.current_location)
         if args not in [npc.lower() for npc in loc_npcs]:
             print(f"\n❌ '{args}' isn't here.\n")
-            return
+            return False
 
         self._dialogue(args)
 
@@ -279,9 +376,9 @@ This might be connected to the crime scene.""",
             npc: NPC name (lowercase, can be first name or full name)
         """
         # Resolve first name to full name
-        canonical_npc = self._resolve_npc_name(npc)
+        canonical_npc = self.resolve_npc_name(npc)
         
-        self.player.met_characters.add(canonical_npc)
+        self.player.meet_character(canonical_npc)
 
         # Notify relationship manager (if available) that we talked to this NPC
         try:
@@ -296,104 +393,7 @@ This might be connected to the crime scene.""",
         except Exception:
             pass
 
-        dialogues = {
-            "r. daneel olivaw": """
-        R. Daneel Olivaw regards you with those unblinking robotic eyes.
-        
-        "Good morning, Detective. I am R. Daneel Olivaw, a humanoid robot
-        from the Outer Regions. I have been assigned as your partner in
-        this investigation. I hope my presence will not be... problematic.
-        I am designed to follow the Three Laws of Robotics, which ensures
-        I will protect human life."
-        
-        How do you respond?
-        """,
-            "julius enderby": """
-        The Commissioner leans back in his chair, his face stern.
-        
-        "Listen here, detective. I know you're not happy about working
-        with a robot. But the Outer Regions have demanded it. There's
-        been a murder with political implications. We need to solve this
-        quickly and carefully. The robot stays with you."
-        
-        He eyes you coldly. The matter is not up for discussion.
-        """,
-            "records clerk": """
-        The clerk looks up from their work, exhausted.
-        
-        "Welcome to Records. Do you need citizen information? Birth records?
-        Employment history? Everything about every person in these caves
-        is filed here. It's all... so much data."
-        
-        What information do you seek?
-        """,
-            "vince barrett": """
-        Vince looks at you with barely concealed frustration.
-        
-        "Another investigation where the robots get all the attention, huh?
-        Used to be, we did the real work. Now they show up and take credit
-        for the deductions. Just watch — that Daneel will solve it and
-        we'll all look bad for needing the help."
-        
-        He turns away bitterly.
-        """,
-            "r. sammy": """
-        R. Sammy's optical sensors pulse with pale blue light.
-        
-        "Detective. My data analysis is complete. Dr. Roj Nemennuh Sarton
-        was a significant figure in robotics research. The circumstances
-        of his death suggest involvement by someone with motive and opportunity.
-        I stand ready to assist in deductive analysis."
-        
-        The robot speaks with mechanical precision.
-        """,
-            "han fastolfe": """
-        Han regards you with composed interest.
-        
-        "Detective. I knew of Roj Sarton through his published research.
-        He was attempting something ambitious — proving that humans and robots
-        could work together seamlessly. His death is a tragedy for that vision.
-        I wonder if someone feared what his success might mean."
-        
-        He pauses meaningfully.
-        """,
-            "dr. anthony gerrigel": """
-        Dr. Gerrigel looks up from his workstation, concern in his eyes.
-        
-        "Roj and I collaborated frequently. He was exploring questions about
-        robot consciousness and human-robot partnership. His latest work...
-        it was groundbreaking. Perhaps too groundbreaking for some people."
-        
-        He adjusts his glasses thoughtfully.
-        """,
-            "francis clousarr": """
-        Francis leans forward, his voice sharp and bitter.
-        
-        "You want to know if I did it? I didn't. But I'm glad he's dead.
-        Sarton spent his life making machines that take human jobs, human lives,
-        human dignity. Maybe someone else agreed with me more forcefully."
-        
-        His fists clench against the detention glass.
-        """,
-            "jessie bailey": """
-        Jessie looks up from a small pile of personal effects, smiling when she sees you.
-
-        "Hello, love," she says softly. "Are you all right? You look tired. Don't forget we have dinner at seven — Ben has been asking about your robot partner."
-
-        She reaches for your hand, steady and familiar. "Be careful out there."
-
-        """,
-            "ben bailey": """
-        Ben bounces in place, eyes wide with curiosity.
-
-        "Is that the robot?" he asks, pointing toward R. Daneel. "Can I see how it walks? Can it play with me?"
-
-        He fidgets, then leans in conspiratorially: "Do robots eat?"
-
-        """,
-        }
-
-        dialogue = dialogues.get(npc, f"You talk with {npc}.")
+        dialogue = self.content.dialogue(canonical_npc) or f"You talk with {npc}."
         # Replace address 'Detective' with the player's actual name for immersion
         try:
             pname = self.player.name
@@ -404,7 +404,7 @@ This might be connected to the crime scene.""",
 
         # Branching dialogue for family members
         try:
-            if npc.lower() == "jessie bailey":
+            if npc.lower() == "jessie baley":
                 # Present simple choice menu
                 print("\nOptions: 1) Reassure Jessie  2) Ask about dinner  3) Say goodbye\n")
                 if self.demo_mode:
@@ -418,7 +418,9 @@ This might be connected to the crime scene.""",
                 if choice == "1":
                     print("\nYou reassure Jessie that you'll be careful. She seems calmer.\n")
                     try:
-                        self.game_state.relationships.get_relationship("Jessie Bailey").increase_trust(5)
+                        self.game_state.relationships.get_relationship(
+                            "Jessie Baley"
+                        ).increase_trust(5)
                     except Exception:
                         pass
                 elif choice == "2":
@@ -426,7 +428,7 @@ This might be connected to the crime scene.""",
                 else:
                     print("\nYou exchange a quiet word and leave.\n")
 
-            elif npc.lower() == "ben bailey":
+            elif npc.lower() == "ben baley":
                 print("\nOptions: 1) Play with Ben  2) Answer about robots  3) Send him to his room\n")
                 if self.demo_mode:
                     choice = "1"  # Default choice in demo mode
@@ -439,7 +441,9 @@ This might be connected to the crime scene.""",
                 if choice == "1":
                     print("\nYou play a quick game with Ben. His laughter fills the room.\n")
                     try:
-                        self.game_state.relationships.get_relationship("Ben Bailey").increase_trust(7)
+                        self.game_state.relationships.get_relationship(
+                            "Ben Baley"
+                        ).increase_trust(7)
                     except Exception:
                         pass
                 elif choice == "2":
@@ -449,6 +453,14 @@ This might be connected to the crime scene.""",
         except Exception:
             pass
 
+    @command(
+        "inventory",
+        aliases=("inv", "i"),
+        usage=[("inventory (i)", "Show what you're carrying")],
+        category="INFORMATION",
+        read_only=True,
+        depends_on=("player",),
+    )
     def cmd_inventory(self, args):
         """Inventory command - show what player is carrying."""
         print("\n📦 INVENTORY:\n")
@@ -460,6 +472,16 @@ This might be connected to the crime scene.""",
             print(f"  • {item} x{quantity}")
         print()
 
+    @command(
+        "take",
+        aliases=("get",),
+        usage=[
+            ("take <item>", "Pick up an item"),
+            ("take all", "Pick up all items in location"),
+        ],
+        category="INTERACTION",
+        advances_time=2,
+    )
     def cmd_take(self, args):
         """Take command - pick up an item or all items.
 
@@ -468,33 +490,30 @@ This might be connected to the crime scene.""",
         """
         if not args:
             print("\n❌ Take what? Please specify (or 'take all').\n")
-            return
+            return False
 
         args = args.lower().strip()
-        location = LOCATIONS.get(self.player.current_location)
-        if not location:
+        world = self.game_state.world
+        location_key = self.player.current_location
+        if not world.get_location(location_key):
             print(
                 "\n❌ Current location data is missing. You can't take items right now.\n"
             )
-            return
+            return False
 
-        loc_items = location.items or []
+        loc_items = world.items_at(location_key)
 
         if args == "all":
             if not loc_items:
                 print("\n❌ There are no items here to take.\n")
-                return
+                return False
 
             items_taken = []
             for item in list(loc_items):  # Create a copy to iterate safely
                 self.player.add_item(item)
                 items_taken.append(item)
 
-            # Clear stored items on the location (ensure list exists)
-            if location.items is None:
-                location.items = []
-            else:
-                location.items.clear()
+            world.clear_items(location_key)
 
             items_str = ", ".join(items_taken)
             print(f"\n✅ You take all items: {items_str}.\n")
@@ -502,18 +521,23 @@ This might be connected to the crime scene.""",
 
         if args not in [item.lower() for item in loc_items]:
             print(f"\n❌ You don't see '{args}' here.\n")
-            return
+            return False
 
         # Find the actual item name (with correct case)
         actual_item = next(item for item in loc_items if item.lower() == args)
         self.player.add_item(actual_item)
-        # Remove from the underlying location.items if present
-        if location.items is None:
-            location.items = []
-        if actual_item in location.items:
-            location.items.remove(actual_item)
+        world.remove_item(location_key, actual_item)
         print(f"\n✅ You take the {actual_item}.\n")
 
+    @command(
+        "drop",
+        usage=[
+            ("drop <item>", "Drop an item from inventory"),
+            ("drop all", "Drop all items from inventory"),
+        ],
+        category="INTERACTION",
+        advances_time=1,
+    )
     def cmd_drop(self, args):
         """Drop command - drop an item or all items from inventory.
 
@@ -522,54 +546,57 @@ This might be connected to the crime scene.""",
         """
         if not args:
             print("\n❌ Drop what? Please specify (or 'drop all').\n")
-            return
+            return False
 
         args = args.lower().strip()
 
         if args == "all":
             if not self.player.inventory:
                 print("\n❌ You're not carrying anything.\n")
-                return
+                return False
 
             items_dropped = []
-            location = LOCATIONS.get(self.player.current_location)
-            if not location:
+            world = self.game_state.world
+            location_key = self.player.current_location
+            if not world.get_location(location_key):
                 print(
                     "\n❌ Current location data is missing. You can't drop items here.\n"
                 )
-                return
-
-            if location.items is None:
-                location.items = []
+                return False
 
             for item in list(self.player.inventory.keys()):
                 quantity = self.player.inventory[item]
-                location.items.append(item)
+                world.add_item(location_key, item)
                 items_dropped.append(f"{item} x{quantity}")
 
-            self.player.inventory.clear()
+            self.player.clear_inventory()
             items_str = ", ".join(items_dropped)
             print(f"\n✅ You drop all items: {items_str}.\n")
             return
 
         if not self.player.has_item(args):
             print(f"\n❌ You don't have '{args}'.\n")
-            return
+            return False
 
         self.player.remove_item(args)
-        location = LOCATIONS.get(self.player.current_location)
-        if not location:
+        world = self.game_state.world
+        location_key = self.player.current_location
+        if not world.get_location(location_key):
             print(
                 "\n❌ Current location data is missing. Dropped item lost to the void.\n"
             )
-            return
+            return False
 
-        if location.items is None:
-            location.items = []
-
-        location.items.append(args)
+        world.add_item(location_key, args)
         print(f"\n✅ You drop the {args}.\n")
 
+    @command(
+        "status",
+        usage=[("status", "Show detective status & clues")],
+        category="INFORMATION",
+        read_only=True,
+        depends_on=("player", "game_state"),
+    )
     def cmd_status(self, args):
         """Status command - show detailed player and game status."""
         print(self.player.get_status())
@@ -580,6 +607,13 @@ This might be connected to the crime scene.""",
                 print(f"   {i}. {clue}")
         print()
 
+    @command(
+        "stats",
+        usage=[("stats", "Show quick statistics")],
+        category="INFORMATION",
+        read_only=True,
+        depends_on=("player", "game_state"),
+    )
     def cmd_stats(self, args):
         """Stats command - show quick statistics."""
         print("\n" + "=" * 50)
@@ -596,74 +630,24 @@ This might be connected to the crime scene.""",
         print(f"Locations Visited: {len(self.game_state.visited_locations)}")
         print("=" * 50 + "\n")
 
+    @command(
+        "help",
+        usage=[("help", "Show this help message")],
+        category="INFORMATION",
+        read_only=True,
+        depends_on=(),
+    )
     def cmd_help(self, args):
         """Help command - show available commands."""
-        help_text = """
-        ╔════════════════════════════════════════════════════════════╗
-        ║                   AVAILABLE COMMANDS                     ║
-        ╠════════════════════════════════════════════════════════════╣
-        ║ MOVEMENT:                                                ║
-        ║   go <direction>     Move to another location            ║
-        ║     Example: go north, go east, go spacetown             ║
-        ║   look              Look around your surroundings        ║
-        ║   examine <thing>   Examine an object or person         ║
-        ║                                                            ║
-        ║ INTERACTION:                                             ║
-        ║   talk <to person>  Speak with an NPC                   ║
-        ║   take <item>       Pick up an item                     ║
-        ║   take all          Pick up all items in location       ║
-        ║   drop <item>       Drop an item from inventory         ║
-        ║   drop all          Drop all items from inventory       ║
-        ║                                                            ║
-        ║ INVESTIGATION:                                           ║
-        ║   mystery           Show mystery details                ║
-        ║   accuse <person>   Accuse someone of the murder        ║
-        ║   relationships     Show NPC relationships              ║
-        ║   puzzle <id>       Solve a puzzle (access_code, etc.)  ║
-        ║                                                            ║
-        ║ INFORMATION:                                             ║
-        ║   inventory (i)     Show what you're carrying           ║
-        ║   status            Show detective status & clues        ║
-        ║   stats             Show quick statistics               ║
-        ║   help              Show this help message               ║
-        ║                                                            ║
-        ║ SETTINGS:                                                ║
-        ║   settings          Open settings menu                  ║
-        ║   settings name <new_name>      Change your detective name║
-        ║   settings difficulty <level>   Change difficulty        ║
-        ║      (easy, normal, hard)                               ║
-        ║   settings textspeed <fast|normal|slow> Adjust text speed║
-        ║   settings accessibility <on|off> Toggle accessibility   ║
-        ║   settings show                 Show all settings        ║
-        ║   settings close                Close settings menu      ║
-        ║                                                            ║
-        ║ FAMILY:                                                  ║
-        ║   ask <npc> <topic>   Ask an NPC about a topic (family) ║
-        ║   play <npc>          Play with a child NPC (Ben)       ║
-        ║   comfort <npc>       Comfort a worried family member   ║
-        ║                                                            ║
-        ║ SAVE/LOAD:                                               ║
-        ║   save (s)          Save your game progress             ║
-        ║   load (l)          Load a previous save                ║
-        ║                                                            ║
-        ║ GAME:                                                    ║
-        ║   quit              Exit the game                       ║
-        ╠════════════════════════════════════════════════════════════╣
-        ║ NAVIGATION TIPS:                                         ║
-        ║ - Use 'go <direction>' or 'go <location>' to move.       ║
-        ║ - Type 'look' to see your current surroundings.          ║
-        ║ - Use 'examine <thing>' for details on objects/NPCs.     ║
-        ║ - For a list of locations, type 'status' or 'look'.      ║
-        ╠════════════════════════════════════════════════════════════╣
-        ║ SETTINGS DETAILS:                                        ║
-        ║ - Change your detective name for immersion.              ║
-        ║ - Difficulty affects puzzle and investigation challenge. ║
-        ║ - Text speed adjusts how quickly text appears.           ║
-        ║ - Accessibility mode enables high-contrast display.      ║
-        ╚════════════════════════════════════════════════════════════╝
-        """
-        print(help_text)
-
+        print(self.registry.render_help(HELP_FOOTER))
+
+    @command(
+        "mystery",
+        usage=[("mystery", "Show mystery details")],
+        category="INVESTIGATION",
+        read_only=True,
+        depends_on=("mystery",),
+    )
     def cmd_mystery(self, args):
         """Show mystery details and suspects."""
         print(self.game_state.mystery.get_mystery_summary())
@@ -672,84 +656,12 @@ This might be connected to the crime scene.""",
             print(f"  • {suspect_name}")
         print()
 
-    def cmd_ask(self, args):
-        """Ask command - ask an NPC about a topic (family-focused)
-
-        Args:
-            args: "<npc> <topic>"
-        """
-        if not args:
-            print("\n❌ Usage: ask <npc> <topic>\n")
-            return
-
-        parts = args.split(maxsplit=1)
-        npc_input = parts[0].lower()
-        canonical_npc = self._resolve_npc_name(npc_input)
-        topic = parts[1].lower() if len(parts) > 1 else ""
-
-        # Family-specific topics
-        if canonical_npc and canonical_npc.lower() in ("jessie bailey",):
-            if "dinner" in topic or "meal" in topic:
-                print("\n💬 Jessie: 'Yes — dinner at seven. Ben is excited.'\n")
-                try:
-                    self.game_state.relationships.get_relationship("Jessie Bailey").increase_trust(3)
-                except Exception:
-                    pass
-                return
-            print("\n💬 Jessie: 'I'm busy right now, love. Later?'\n")
-            return
-
-        if canonical_npc and canonical_npc.lower() in ("ben bailey",):
-            if "robot" in topic:
-                print("\n💬 Ben: 'Robots are cool! They can walk and talk.'\n")
-                try:
-                    self.game_state.relationships.get_relationship("Ben Bailey").increase_trust(2)
-                except Exception:
-                    pass
-                return
-            print("\n💬 Ben: 'I dunno about that. Can we play instead?'\n")
-            return
-
-        print(f"\n❌ You can't ask '{canonical_npc}' about that here.\n")
-
-    def cmd_play(self, args):
-        """Play command - play with a child NPC (Ben)."""
-        if not args:
-            print("\n❌ Play with whom? Try: play ben\n")
-            return
-
-        npc_input = args.lower().strip()
-        canonical_npc = self._resolve_npc_name(npc_input)
-        
-        if canonical_npc and canonical_npc.lower() in ("ben bailey",):
-            print("\n🎲 You play a quick game with Ben. He laughs and tugs your sleeve.\n")
-            try:
-                self.game_state.relationships.get_relationship("Ben Bailey").increase_trust(10)
-            except Exception:
-                pass
-            return
-
-        print("\n❌ You can't play with that NPC.\n")
-
-    def cmd_comfort(self, args):
-        """Comfort command - comfort a worried family member (Jessie)."""
-        if not args:
-            print("\n❌ Comfort whom? Try: comfort jessie\n")
-            return
-
-        npc_input = args.lower().strip()
-        canonical_npc = self._resolve_npc_name(npc_input)
-        
-        if canonical_npc and canonical_npc.lower() in ("jessie bailey",):
-            print("\n🤝 You take Jessie in a brief embrace and assure her you'll be careful.\n")
-            try:
-                self.game_state.relationships.get_relationship("Jessie Bailey").increase_trust(8)
-            except Exception:
-                pass
-            return
-
-        print("\n❌ That action isn't appropriate for that NPC.\n")
-
+    @command(
+        "accuse",
+        usage=[("accuse <person>", "Accuse someone of the murder")],
+        category="INVESTIGATION",
+        advances_time=True,
+    )
     def cmd_accuse(self, args):
         """Accuse someone of the murder.
 
@@ -758,7 +670,7 @@ This might be connected to the crime scene.""",
         """
         if not args:
             print("\n❌ Accuse whom? Be specific.\n")
-            return
+            return False
 
         args = args.strip().title()
 
@@ -768,9 +680,11 @@ This might be connected to the crime scene.""",
             print(
                 f"\n❌ You don't have enough evidence yet. You need {remaining} more clue(s).\n"
             )
-            return
+            return False
 
-        result = self.game_state.mystery.check_solution(args)
+        result = self.game_state.mystery.accuse(args)
+        # Right or wrong, making the accusation takes time
+        self.game_state.advance_clock(ACCUSE_MINUTES)
 
         if result["correct"]:
             print(f"\n✅ {result['message']}")
@@ -779,18 +693,36 @@ This might be connected to the crime scene.""",
         else:
             print(f"\n❌ {result['message']}")
             print(f"{result['explanation']}\n")
-
+            if self.game_state.mystery.accused != args:
+                return False
+            # A suspect stays accused, and goes to trial if time runs out
+            print("📝 The accusation stays on record until you name someone else.\n")
+
+    @command(
+        "investigate",
+        usage=[("investigate <topic>", "Analyse a lead or clue")],
+        category="INVESTIGATION",
+        advances_time=30,
+    )
     def cmd_investigate(self, args):
         """Investigate clue or evidence.
 
         Args:
             args: What to investigate (eyeglasses, enderby, spacer_conspiracy, etc.)
         """
+        mystery = self.game_state.mystery
         if not args:
-            print("\n💡 You can investigate: eyeglasses, enderby, sammy, spacer_conspiracy\n")
-            return
+            topics = (
+                ", ".join(mystery.leads)
+                if mystery.case
+                else "eyeglasses, enderby, sammy, spacer_conspiracy"
+            )
+            print(f"\n💡 You can investigate: {topics}\n")
+            return False
 
         investigation = args.lower().strip()
+        if mystery.case is not None:
+            return self._investigate_lead(investigation)
 
         # Eyeglass evidence investigation
         if investigation == "eyeglasses":
@@ -810,6 +742,7 @@ This might be connected to the crime scene.""",
                 self.game_state.mystery.record_evidence("broken_glasses_found")
             else:
                 print("\n❌ You don't have eyeglass evidence.\n")
+                return False
 
         # Enderby investigation
         elif investigation == "enderby":
@@ -872,11 +805,50 @@ This might be connected to the crime scene.""",
 
         else:
             print(f"\n❌ Cannot investigate '{investigation}'. Unknown topic.\n")
+            return False
+
+    def _investigate_lead(self, topic):
+        """Follow up a lead of a generated case.
 
+        Args:
+            topic: Lead topic
+
+        Returns:
+            bool: False if the lead cannot be followed up yet
+        """
+        mystery = self.game_state.mystery
+        lead = mystery.leads.get(topic)
+        if lead is None:
+            print(f"\n❌ Cannot investigate '{topic}'. Unknown topic.\n")
+            return False
+        if lead["item"] and lead["item"] not in self.player.inventory:
+            print(f"\n❌ You need the {lead['item']} to follow that lead.\n")
+            return False
+        if lead["requires"] and not mystery.has_evidence(lead["requires"]):
+            print("\n❌ You don't have enough to go on yet. Find another lead first.\n")
+            return False
+
+        print(f"\n🔎 {lead['text']}\n")
+        print(f"✅ EVIDENCE RECORDED: {topic}\n")
+        mystery.record_evidence(lead["id"])
+
+    @command(
+        "relationships",
+        usage=[("relationships", "Show NPC relationships")],
+        category="INVESTIGATION",
+        read_only=True,
+        depends_on=("relationships",),
+    )
     def cmd_relationships(self, args):
         """Show relationships with all NPCs."""
         print(self.game_state.relationships.get_all_relationships())
 
+    @command(
+        "puzzle",
+        usage=[("puzzle <id> [answer]", "Get a hint or solve a puzzle")],
+        category="INVESTIGATION",
+        advances_time=True,
+    )
     def cmd_puzzle(self, args):
         """Attempt to solve a puzzle or get hint.
 
@@ -887,19 +859,22 @@ This might be connected to the crime scene.""",
             print("\n❌ Usage: puzzle <id> or solve <id> <answer>\n")
             solved, total = self.game_state.puzzle_manager.get_solved_puzzles()
             print(f"Puzzles solved: {solved}/{total}\n")
-            return
+            return False
 
         parts = args.split(maxsplit=1)
         puzzle_id = parts[0].lower()
 
         if len(parts) == 1:
-            # Get hint
+            # Get hint (takes no time)
             hint = self.game_state.puzzle_manager.get_hint(puzzle_id)
             print(f"\n💡 Hint: {hint}\n")
         else:
             # Attempt solution
             answer = parts[1]
             result = self.game_state.puzzle_manager.solve_puzzle(puzzle_id, answer)
+            if "reward" in result or "attempts" in result:
+                # Only an answer actually checked against the puzzle takes time
+                self.game_state.advance_clock(PUZZLE_MINUTES)
 
             if result["success"]:
                 print(f"\n{result['message']}")
@@ -907,7 +882,20 @@ This might be connected to the crime scene.""",
                 print(f"Investigation points +{result.get('reward', 0)}!\n")
             else:
                 print(f"\n{result['message']}\n")
-
+                return False
+
+    @command(
+        "settings",
+        usage=[
+            ("settings", "Open settings menu"),
+            ("settings show", "Show all settings"),
+            ("settings name <name>", "Change your detective name"),
+            ("settings difficulty", "<easy|normal|hard>"),
+            ("settings textspeed", "<fast|normal|slow>"),
+            ("settings accessibility", "<on|off>"),
+        ],
+        category="SETTINGS",
+    )
     def cmd_settings(self, args):
         """Settings command - view and manage game settings."""
         print("\n" + "=" * 50)
@@ -933,6 +921,7 @@ This might be connected to the crime scene.""",
                 new_name = parts[1]
                 if len(new_name) > 30:
                     print("❌ Name too long (max 30 characters)\n")
+                    return False
                 else:
                     old_name = self.player.name
                     self.player.name = new_name
@@ -941,6 +930,7 @@ This might be connected to the crime scene.""",
                 new_diff = parts[1].lower()
                 if new_diff not in ("easy", "normal", "hard"):
                     print("❌ Difficulty must be easy, normal, or hard.\n")
+                    return False
                 else:
                     old_diff = self.player.difficulty
                     self.player.difficulty = new_diff
@@ -950,6 +940,7 @@ This might be connected to the crime scene.""",
                 speed = parts[1].lower()
                 if speed not in ("fast", "normal", "slow"):
                     print("❌ Text speed must be fast, normal, or slow.\n")
+                    return False
                 else:
                     self.player.text_speed = speed
                     print(f"✓ Text speed set to '{speed}'.\n")
@@ -957,6 +948,7 @@ This might be connected to the crime scene.""",
                 acc = parts[1].lower()
                 if acc not in ("on", "off"):
                     print("❌ Accessibility must be 'on' or 'off'.\n")
+                    return False
                 else:
                     self.player.accessibility = "High Contrast" if acc == "on" else "Standard"
                     print(f"✓ Accessibility mode set to '{self.player.accessibility}'.\n")
@@ -975,9 +967,32 @@ This might be connected to the crime scene.""",
                 print("Closing settings menu.\n")
             else:
                 print("❌ Unknown settings option.\n")
+                return False
 
+    @command(
+        "quit",
+        usage=[("quit", "Exit the game")],
+        category="GAME",
+    )
     def cmd_quit(self, args):
         """Quit command - exit the game."""
         print("\nThank you for playing! Goodbye.\n")
         import sys
         sys.exit(0)
+
+
+CommandProcessor.registry.collect(CommandProcessor)
+# 'exit' is intentionally not an alias of quit so it does NOT quit the game.
+# Save and load are handled by the game engine; listed here for help.
+CommandProcessor.registry.describe(
+    "save",
+    aliases=("s",),
+    usage=[("save (s)", "Save your game progress")],
+    category="SAVE/LOAD",
+)
+CommandProcessor.registry.describe(
+    "load",
+    aliases=("l",),
+    usage=[("load (l)", "Load a previous save")],
+    category="SAVE/LOAD",
+)
@@ -0,0 +1,761 @@
+"""
+Content Compiler - Validates the authored content and builds the world bundle
+
+The game's content is authored as Python literal tables in data-only
+modules, plus the relationships, dialogue trees, mystery, events and
+endings that code builds. ``python -m src.content`` loads all of it,
+cross-checks it and writes an indexed JSON bundle of the tables plus a
+memory-mapped string table holding their text, which the game reads at
+startup. Validation errors block the build.
+
+The bundle is stamped with a fingerprint of the table modules alone, so
+code changes do not make it stale. When it is stale or missing the game
+collects and validates the content itself and refuses to start on
+problems.
+"""
+
+import hashlib
+import json
+import sys
+from collections import deque
+from pathlib import Path
+
+from src.string_table import StringTable, write_string_table
+from src.utils import clock_minutes
+
+SOURCE_DIR = Path(__file__).parent
+BUNDLE_PATH = SOURCE_DIR / "world_bundle.json"
+STRINGS_PATH = SOURCE_DIR / "world_strings.bin"
+BUNDLE_FORMAT = 3
+
+# Tables authored as plain literals: module -> {variable: section}. They
+# are read from the source with ast, so they can be re-read while the
+# game runs without re-importing any module. These modules hold nothing
+# but the tables; their bytes make up the fingerprint.
+LITERAL_TABLES = {
+    "locations.py": {"LOCATIONS": "locations"},
+    "content_tables.py": {
+        "NPC_NAME_MAP": "npc_aliases",
+        "ITEM_ALIASES": "item_aliases",
+        "ITEM_EXAMINATIONS": "item_examinations",
+        "NPC_DESCRIPTIONS": "npc_descriptions",
+        "NPC_DIALOGUES": "npc_dialogues",
+    },
+    "npc_schedules.py": {"NPC_SCHEDULES": "schedules"},
+}
+TABLE_MODULES = tuple(LITERAL_TABLES)
+
+# Modules whose content is built by code; validated, but not compiled
+# into the bundle
+CODE_MODULES = (
+    "relationships.py",
+    "dialogue_system.py",
+    "mystery_plot.py",
+    "events.py",
+    "endings.py",
+)
+SOURCE_MODULES = TABLE_MODULES + CODE_MODULES
+
+START_LOCATION = "bedroom"
+
+
+class ContentError(Exception):
+    """Raised when the authored content fails validation."""
+
+    def __init__(self, problems):
+        """Initialize the error.
+
+        Args:
+            problems: List of problem descriptions
+        """
+        super().__init__(f"{len(problems)} content problem(s)")
+        self.problems = problems
+
+
+class WorldBundle:
+    """Read-only view of a compiled content bundle.
+
+    The bundle holds the tables' structure and indexes; text fields hold
+    keys into the string table.
+    """
+
+    def __init__(self, data, strings):
+        """Initialize the view.
+
+        Args:
+            data: Bundle dict produced by compile_content
+            strings: StringTable, or a plain dict of key to text
+        """
+        self.data = data
+        self.strings = strings
+        self.fingerprint = data["fingerprint"]
+        self.locations = data["locations"]
+        self.npcs = data["npcs"]
+        self.items = data["items"]
+        self.npc_aliases = data["npc_aliases"]
+        self.item_aliases = data["item_aliases"]
+
+    def resolve_npc(self, name):
+        """Resolve an alias or any spelling of a name to the canonical NPC.
+
+        Args:
+            name: Player input
+
+        Returns:
+            str or None: Canonical NPC name
+        """
+        return self.npc_aliases.get(name.lower().strip())
+
+    def examination(self, item):
+        """Get the text shown when examining an item.
+
+        Args:
+            item: Item key
+
+        Returns:
+            str or None
+        """
+        return self.text(self.items.get(item, {}).get("examine"))
+
+    def description(self, npc):
+        """Get the text shown when examining an NPC.
+
+        Args:
+            npc: Canonical NPC name
+
+        Returns:
+            str or None
+        """
+        return self.text(self.npcs.get(npc, {}).get("description"))
+
+    def dialogue(self, npc):
+        """Get an NPC's opening lines.
+
+        Args:
+            npc: Canonical NPC name
+
+        Returns:
+            str or None
+        """
+        return self.text(self.npcs.get(npc, {}).get("dialogue"))
+
+    def location_description(self, location_key):
+        """Get an authored location's description.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            str or None
+        """
+        return self.text(self.locations.get(location_key, {}).get("description"))
+
+    def text(self, key):
+        """Look up a string table entry.
+
+        Args:
+            key: String key (None gives None)
+
+        Returns:
+            str or None
+        """
+        return None if key is None else self.strings.get(key)
+
+
+def source_fingerprint():
+    """Hash the table modules so stale bundles can be detected.
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    for name in TABLE_MODULES:
+        digest.update((SOURCE_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+def collect_sources(modules=SOURCE_MODULES, previous=None):
+    """Load the authored content from its modules.
+
+    Args:
+        modules: Source module filenames to read
+        previous: Sources from an earlier call whose other sections are kept
+
+    Returns:
+        dict: Plain-data view of every content table
+    """
+    sources = dict(previous) if previous else {"duplicate_keys": {}}
+    sources["duplicate_keys"] = dict(sources["duplicate_keys"])
+    for filename in modules:
+        if filename in LITERAL_TABLES:
+            tables, duplicates = read_literal_tables(filename)
+            sources.update(tables)
+            sources["duplicate_keys"][filename] = duplicates
+        else:
+            sources.update(_CODE_COLLECTORS[filename]())
+    return sources
+
+
+def read_literal_tables(filename):
+    """Read a module's literal tables from its source without importing it.
+
+    ``Location(...)`` entries become dicts of their keyword arguments.
+    Python silently keeps the last value of a repeated dict key, so keys
+    written twice are reported from the syntax tree.
+
+    Args:
+        filename: Module filename in LITERAL_TABLES
+
+    Returns:
+        tuple: (dict of section to table, list of (table, key, line) duplicates)
+    """
+    import ast
+
+    wanted = LITERAL_TABLES[filename]
+    tree = ast.parse((SOURCE_DIR / filename).read_text(encoding="utf-8"))
+    tables = {}
+    duplicates = []
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)):
+            continue
+        names = [
+            t.id for t in node.targets if isinstance(t, ast.Name) and t.id in wanted
+        ]
+        if not names:
+            continue
+        table = {}
+        for key_node, value_node in zip(node.value.keys, node.value.values):
+            key = ast.literal_eval(key_node)
+            if key in table:
+                duplicates.append((names[0], key, key_node.lineno))
+            if isinstance(value_node, ast.Call):
+                fields = {"exits": {}, "npcs": [], "items": []}
+                fields.update(
+                    (kw.arg, ast.literal_eval(kw.value)) for kw in value_node.keywords
+                )
+                table[key] = fields
+            else:
+                table[key] = ast.literal_eval(value_node)
+        tables[wanted[names[0]]] = table
+    return tables, duplicates
+
+
+def _collect_relationships():
+    """Collect the initial relationship table."""
+    from src.relationships import RelationshipManager
+
+    return {
+        "relationships": {
+            name: rel.trust for name, rel in RelationshipManager().relationships.items()
+        }
+    }
+
+
+def _collect_dialogue_trees():
+    """Collect the text of every dialogue tree."""
+    from src.dialogue_system import DialogueManager
+
+    return {
+        "dialogue_trees": {
+            npc: {
+                node_id: {
+                    "text": node.text,
+                    "choices": [choice.text for choice in node.choices],
+                }
+                for node_id, node in tree.nodes.items()
+            }
+            for npc, tree in DialogueManager().trees.items()
+        }
+    }
+
+
+def _collect_mystery():
+    """Collect the victim, suspects and evidence links."""
+    from src.mystery_plot import MysteryPlot
+
+    mystery = MysteryPlot()
+    return {
+        "victim": mystery.victim.name,
+        "suspects": {
+            name: {"motive": s.motive, "alibi": s.alibi, "claim": s.alibi_claim}
+            for name, s in mystery.suspects.items()
+        },
+        "sightings": [list(sighting) for sighting in mystery.sightings],
+        "evidence_links": {
+            key: list(names) for key, names in mystery.evidence_links.items()
+        },
+        "evidence_clears": {
+            key: list(names) for key, names in mystery.evidence_clears.items()
+        },
+    }
+
+
+def _collect_events():
+    """Collect the events and what triggers them."""
+    from src.events import EventManager
+
+    return {
+        "events": [
+            {
+                "id": event.event_id,
+                "description": event.description,
+                "period": getattr(event, "time_period", None),
+                "day": getattr(event, "day", None),
+                "depends_on": list(event.depends_on),
+            }
+            for event in EventManager().events
+        ]
+    }
+
+
+def _collect_endings():
+    """Collect the ending titles and text."""
+    from src.endings import EndingsManager
+
+    return {
+        "endings": {
+            ending.ending_id: {"title": ending.title, "description": ending.description}
+            for ending in EndingsManager().endings
+        }
+    }
+
+
+# Modules whose content is built by code: module -> collector
+_CODE_COLLECTORS = {
+    "relationships.py": _collect_relationships,
+    "dialogue_system.py": _collect_dialogue_trees,
+    "mystery_plot.py": _collect_mystery,
+    "events.py": _collect_events,
+    "endings.py": _collect_endings,
+}
+
+
+def validate(sources):
+    """Cross-check the authored content.
+
+    Args:
+        sources: Dict produced by collect_sources
+
+    Returns:
+        list: Problem descriptions (empty when the content is consistent)
+    """
+    from src.events import TRUST_PREFIX, fact_source
+    from src.schedules import TIME_PERIODS
+
+    problems = []
+    locations = sources["locations"]
+
+    # Map: every exit leads somewhere and every location can be reached
+    entrances = {key: [] for key in locations}
+    for key, location in locations.items():
+        for exit_name, target in location["exits"].items():
+            if target in entrances:
+                entrances[target].append(key)
+            else:
+                problems.append(
+                    f"{key}: exit '{exit_name}' leads to unknown location '{target}'"
+                )
+    for key, sources_in in entrances.items():
+        if not sources_in and key != START_LOCATION:
+            problems.append(f"{key}: no exit leads into this location")
+    reachable = _reachable(locations, START_LOCATION)
+    for key in locations:
+        if key not in reachable and entrances[key]:
+            problems.append(f"{key}: cannot be reached from {START_LOCATION}")
+
+    # People: everyone placed in the world is known to the other systems
+    roster = sources["relationships"]
+    placed = {npc for location in locations.values() for npc in location["npcs"]}
+    for npc in sorted(placed | set(sources["schedules"])):
+        if npc not in roster:
+            problems.append(f"{npc}: no relationship entry")
+        if npc.lower() not in sources["npc_descriptions"]:
+            problems.append(f"{npc}: no examine description")
+    known = placed | set(roster)
+    lowered = {npc.lower() for npc in known}
+    for table in ("npc_descriptions", "npc_dialogues"):
+        for key in sources[table]:
+            if key not in lowered:
+                problems.append(f"{table}: '{key}' is not a known NPC")
+    for npc in sources["dialogue_trees"]:
+        if npc not in known:
+            problems.append(f"dialogue tree for unknown NPC '{npc}'")
+    for npc in sources["suspects"]:
+        if npc not in known:
+            problems.append(f"suspect '{npc}' never appears in the world")
+    for evidence, npcs in sources["evidence_links"].items():
+        for npc in npcs:
+            if npc not in sources["suspects"]:
+                problems.append(
+                    f"evidence '{evidence}' points at '{npc}', who is not a suspect"
+                )
+    for evidence, npcs in sources["evidence_clears"].items():
+        if evidence not in sources["evidence_links"]:
+            problems.append(f"evidence_clears: '{evidence}' is not key evidence")
+        for npc in npcs:
+            if npc not in sources["suspects"]:
+                problems.append(
+                    f"evidence '{evidence}' clears '{npc}', who is not a suspect"
+                )
+    intervals = [
+        (npc, s["claim"]) for npc, s in sources["suspects"].items() if s.get("claim")
+    ]
+    intervals += [(npc, rest) for npc, *rest in sources["sightings"]]
+    for npc, (location, start, end, *_) in intervals:
+        if npc not in known:
+            problems.append(f"sighting of unknown NPC '{npc}'")
+        if location not in locations:
+            problems.append(f"{npc}: seen at unknown location '{location}'")
+        try:
+            if clock_minutes(end) < clock_minutes(start):
+                problems.append(
+                    f"{npc}: seen at {location} from {start} to earlier {end}"
+                )
+        except ValueError:
+            problems.append(f"{npc}: bad time '{start}'-'{end}' at {location}")
+
+    # Schedules
+    for npc, schedule in sources["schedules"].items():
+        for location in schedule.values():
+            if location is not None and location not in locations:
+                problems.append(f"{npc}: scheduled at unknown location '{location}'")
+        missing = [period for period in TIME_PERIODS if period not in schedule]
+        if missing:
+            problems.append(f"{npc}: no schedule for {', '.join(missing)}")
+
+    # Items
+    placed_items = {
+        item for location in locations.values() for item in location["items"]
+    }
+    for item in sorted(placed_items):
+        if item not in sources["item_examinations"]:
+            problems.append(f"item '{item}' has no examine text")
+
+    # Aliases: no key written twice, no dangling target, no clash between tables
+    for filename, duplicates in sources["duplicate_keys"].items():
+        for table, key, line in duplicates:
+            problems.append(
+                f"{table}: key '{key}' is repeated ({filename}, line {line})"
+            )
+    for alias, npc in sources["npc_aliases"].items():
+        if npc not in known:
+            problems.append(f"NPC alias '{alias}' points at unknown NPC '{npc}'")
+        if alias in sources["item_aliases"]:
+            problems.append(f"alias '{alias}' names both an NPC and an item")
+        if npc.lower() in lowered and alias in lowered and alias != npc.lower():
+            problems.append(f"NPC alias '{alias}' is another NPC's full name")
+    for alias, item in sources["item_aliases"].items():
+        if item not in placed_items:
+            problems.append(f"item alias '{alias}' points at unknown item '{item}'")
+
+    # Events
+    seen_events = set()
+    for event in sources["events"]:
+        if event["id"] in seen_events:
+            problems.append(f"event '{event['id']}' is defined twice")
+        seen_events.add(event["id"])
+        if event["day"] is not None and (
+            event["period"] not in TIME_PERIODS or event["day"] < 1
+        ):
+            problems.append(f"event '{event['id']}' has an invalid time")
+        for fact in event["depends_on"]:
+            if fact_source(fact) is None:
+                problems.append(
+                    f"event '{event['id']}' depends on unknown fact '{fact}'"
+                )
+            elif (
+                fact.startswith(TRUST_PREFIX)
+                and fact[len(TRUST_PREFIX) :] not in roster
+            ):
+                problems.append(
+                    f"event '{event['id']}' depends on trust of unknown NPC"
+                )
+
+    problems.extend(_spelling_problems(sources, known))
+    return problems
+
+
+def _reachable(locations, start):
+    """Find the locations reachable from a start by following exits.
+
+    Args:
+        locations: Location data keyed by location key
+        start: Start location key
+
+    Returns:
+        set: Reachable location keys
+    """
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        for target in locations[queue.popleft()]["exits"].values():
+            if target in locations and target not in seen:
+                seen.add(target)
+                queue.append(target)
+    return seen
+
+
+def _spelling_problems(sources, npcs):
+    """Flag names that are one letter away from a character's surname.
+
+    Args:
+        sources: Dict produced by collect_sources
+        npcs: Set of known NPC names
+
+    Returns:
+        list: Problem descriptions
+    """
+    surnames = {name.split()[-1] for name in npcs if len(name.split()) > 1}
+    surnames.add(sources["victim"].split()[-1])
+
+    texts = [sources["victim"]]
+    texts += [loc["description"] for loc in sources["locations"].values()]
+    texts += sources["item_examinations"].values()
+    texts += sources["npc_descriptions"].values()
+    texts += sources["npc_dialogues"].values()
+    texts += [s["alibi"] for s in sources["suspects"].values()]
+    texts += [s["motive"] for s in sources["suspects"].values()]
+    texts += [event["description"] for event in sources["events"]]
+    texts += [ending["description"] for ending in sources["endings"].values()]
+    texts += [
+        node["text"]
+        for nodes in sources["dialogue_trees"].values()
+        for node in nodes.values()
+    ]
+    texts += list(npcs)
+    words = {
+        word.strip(".,;:'\"!?()—-")
+        for text in texts
+        for word in text.split()
+        if word[:1].isupper()
+    }
+
+    problems = []
+    for surname in sorted(surnames):
+        for word in sorted(words):
+            if word in (surname, surname + "s") or len(word) < 4:
+                continue
+            if word in surnames and word < surname:
+                continue  # Two surnames: report the pair once
+            if _one_edit_apart(word, surname):
+                problems.append(f"'{word}' looks like a misspelling of '{surname}'")
+    return problems
+
+
+def _one_edit_apart(a, b):
+    """Check whether two words differ by exactly one insertion, deletion or
+    substitution.
+
+    Args:
+        a: First word
+        b: Second word
+
+    Returns:
+        bool
+    """
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1 :] == b[i + 1 :]
+    return a[i:] == b[i + 1 :]
+
+
+def compile_content(sources, fingerprint):
+    """Build the indexed bundle and its string table from validated sources.
+
+    Only the literal tables go into the bundle; the code-built content is
+    read from its modules when the game runs.
+
+    Args:
+        sources: Dict produced by collect_sources
+        fingerprint: Source fingerprint to stamp on the bundle
+
+    Returns:
+        tuple: (bundle dict, dict of string key to text)
+    """
+    strings = {}
+
+    def intern(key, text):
+        """Store a text under a key and return the key (None for no text)."""
+        if text is None:
+            return None
+        strings[key] = text
+        return key
+
+    locations = {}
+    for key, location in sources["locations"].items():
+        locations[key] = dict(
+            location,
+            description=intern(f"location:{key}", location["description"]),
+            entrances=[],
+        )
+    for key, location in sources["locations"].items():
+        for target in location["exits"].values():
+            if target in locations:
+                locations[target]["entrances"].append(key)
+
+    npcs = {name: {"locations": []} for name in sources["schedules"]}
+    for key, location in sources["locations"].items():
+        for name in location["npcs"]:
+            npcs.setdefault(name, {"locations": []})
+            npcs[name]["locations"].append(key)
+    for name, entry in npcs.items():
+        lowered = name.lower()
+        entry["description"] = intern(
+            f"npc:{name}:description", sources["npc_descriptions"].get(lowered)
+        )
+        entry["dialogue"] = intern(
+            f"npc:{name}:dialogue", sources["npc_dialogues"].get(lowered)
+        )
+
+    items = {}
+    for item, text in sources["item_examinations"].items():
+        items[item] = {"examine": intern(f"examine:{item}", text), "locations": []}
+    for key, location in sources["locations"].items():
+        for item in location["items"]:
+            items.setdefault(item, {"examine": None, "locations": []})
+            items[item]["locations"].append(key)
+
+    # Every spelling the player may type resolves in one lookup
+    npc_aliases = {name.lower(): name for name in npcs}
+    npc_aliases.update(sources["npc_aliases"])
+
+    bundle = {
+        "format": BUNDLE_FORMAT,
+        "fingerprint": fingerprint,
+        "start": START_LOCATION,
+        "locations": locations,
+        "location_names": {loc["name"].lower(): key for key, loc in locations.items()},
+        "npcs": npcs,
+        "npc_aliases": npc_aliases,
+        "items": items,
+        "item_aliases": sources["item_aliases"],
+    }
+    return bundle, strings
+
+
+def build_bundle(path=BUNDLE_PATH, strings_path=STRINGS_PATH):
+    """Validate the content and write the bundle and its string table.
+
+    Args:
+        path: Bundle file
+        strings_path: String table file
+
+    Returns:
+        WorldBundle: The content that was written
+
+    Raises:
+        ContentError: If validation finds problems (nothing is written)
+    """
+    sources = collect_sources()
+    problems = validate(sources)
+    if problems:
+        raise ContentError(problems)
+
+    fingerprint = source_fingerprint()
+    bundle, strings = compile_content(sources, fingerprint)
+    write_string_table(strings_path, strings, stamp=fingerprint)
+    path = Path(path)
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(
+        json.dumps(bundle, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+    )
+    temporary.replace(path)
+    return WorldBundle(bundle, strings)
+
+
+def load_bundle(path=BUNDLE_PATH, strings_path=STRINGS_PATH):
+    """Load a bundle written by build_bundle and map its string table.
+
+    Args:
+        path: Bundle file
+        strings_path: String table file
+
+    Returns:
+        WorldBundle or None: None if a file is missing, from another
+        format or built from different sources
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        strings = StringTable(strings_path)
+    except (OSError, ValueError):
+        return None
+    fingerprint = source_fingerprint()
+    if (
+        data.get("format") != BUNDLE_FORMAT
+        or data.get("fingerprint") != fingerprint
+        or strings.stamp != fingerprint
+    ):
+        strings.close()
+        return None
+    return WorldBundle(data, strings)
+
+
+def check_content():
+    """Collect and validate the content, then compile it in memory.
+
+    Used when the bundle is missing or out of date; nothing is written.
+
+    Returns:
+        WorldBundle
+
+    Raises:
+        ContentError: If validation finds problems
+    """
+    sources = collect_sources()
+    problems = validate(sources)
+    if problems:
+        raise ContentError(problems)
+    return WorldBundle(*compile_content(sources, source_fingerprint()))
+
+
+_content = None
+
+
+def get_content():
+    """Get the world content, loading the bundle on first use.
+
+    Falls back to check_content when the bundle is missing or out of
+    date, so content the build would reject never runs.
+
+    Returns:
+        WorldBundle
+
+    Raises:
+        ContentError: If the bundle is stale and the content is invalid
+    """
+    global _content
+    if _content is None:
+        _content = load_bundle() or check_content()
+    return _content
+
+
+def set_content(content):
+    """Replace the world content used from now on.
+
+    Args:
+        content: WorldBundle
+    """
+    global _content
+    _content = content
+
+
+if __name__ == "__main__":
+    try:
+        built = build_bundle()
+    except ContentError as error:
+        for problem in error.problems:
+            print(f"❌ {problem}")
+        print(f"\n❌ Build failed: {len(error.problems)} content problem(s)")
+        sys.exit(1)
+    print(
+        f"✅ Wrote {BUNDLE_PATH.name} and {STRINGS_PATH.name}: "
+        f"{len(built.locations)} locations, {len(built.npcs)} NPCs, "
+        f"{len(built.items)} items, {len(built.strings)} strings"
+    )
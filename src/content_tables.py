@@ -0,0 +1,246 @@
+"""
+Content Tables - NPC and item aliases and text
+
+Authoring sources only: the game never imports this module. The content
+compiler (python -m src.content) reads the tables from the source,
+validates them and compiles them into the world bundle the game loads.
+"""
+
+# NPC name mappings for first-name shortcuts
+NPC_NAME_MAP = {
+    # Full names
+    "r. daneel olivaw": "R. Daneel Olivaw",
+    "daneel": "R. Daneel Olivaw",
+    "r daneel": "R. Daneel Olivaw",
+    "olivaw": "R. Daneel Olivaw",
+    "julius enderby": "Julius Enderby",
+    "julius": "Julius Enderby",
+    "enderby": "Julius Enderby",
+    "commissioner": "Julius Enderby",
+    "records clerk": "Records Clerk",
+    "clerk": "Records Clerk",
+    "vince barrett": "Vince Barrett",
+    "vince": "Vince Barrett",
+    "barrett": "Vince Barrett",
+    "r. sammy": "R. Sammy",
+    "sammy": "R. Sammy",
+    "r sammy": "R. Sammy",
+    "han fastolfe": "Han Fastolfe",
+    "han": "Han Fastolfe",
+    "fastolfe": "Han Fastolfe",
+    "dr. anthony gerrigel": "Dr. Anthony Gerrigel",
+    "anthony": "Dr. Anthony Gerrigel",
+    "gerrigel": "Dr. Anthony Gerrigel",
+    "dr gerrigel": "Dr. Anthony Gerrigel",
+    "francis clousarr": "Francis Clousarr",
+    "clousarr": "Francis Clousarr",
+    "jessie baley": "Jessie Baley",
+    "jessie": "Jessie Baley",
+    "ben baley": "Ben Baley",
+    "ben": "Ben Baley",
+    "bentley": "Ben Baley",
+    # Earlier spelling of the family name
+    "jessie bailey": "Jessie Baley",
+    "ben bailey": "Ben Baley",
+}
+
+# Item aliases for natural-language commands ("pick up the broken glasses")
+ITEM_ALIASES = {
+    "glasses": "eyeglass_evidence",
+    "eyeglasses": "eyeglass_evidence",
+    "broken glasses": "eyeglass_evidence",
+    "broken eyeglasses": "eyeglass_evidence",
+    "repair case": "eyeglass_evidence",
+    "files": "case_files",
+    "case file": "case_files",
+    "device": "communication_device",
+    "communicator": "communication_device",
+    "evidence markers": "forensic_evidence",
+    "samples": "forensic_evidence",
+    "effects": "personal_effects",
+    "belongings": "personal_effects",
+    "records": "citizen_records",
+    "database": "citizen_records",
+    "rations": "nutrition_pack",
+    "food": "nutrition_pack",
+    "ration": "nutrition_pack",
+}
+
+# What the detective sees when examining an item
+ITEM_EXAMINATIONS = {
+    "notebook": (
+        "Your worn detective's notebook, filled with years of observations and cases."
+    ),
+    "communication_device": (
+        "A sleek communication device. You can contact the station from here."
+    ),
+    "case_files": (
+        "Official case files. They contain details about recent incidents in the city."
+    ),
+    "forensic_evidence": (
+        "Evidence markers and biological samples. Whoever did this left traces."
+    ),
+    "personal_effects": (
+        "Belongings of the victim. A wedding ring, a photo, personal mementos."
+    ),
+    "citizen_records": (
+        "Vast databases of every citizen in the Caves. Where do you start?"
+    ),
+    "nutrition_pack": "Standard nutrition rations. Efficient, but utterly flavorless.",
+    "eyeglass_evidence": """A pair of eyeglasses in a repair case. The lenses are clearly broken — shattered 
+in a pattern consistent with impact trauma. The metal frames show signs of stress. 
+These glasses are definitely not new — they're being repaired. 
+                
+You notice fragments of glass that could be tested forensically. 
+This might be connected to the crime scene.""",
+}
+
+# Descriptions shown when examining an NPC, keyed by lowercase name
+NPC_DESCRIPTIONS = {
+    "r. daneel olivaw": (
+        "A humanoid robot with a smooth, plastic face and penetrating electronic eyes. "
+        "Despite being a robot, there's something almost human about him."
+    ),
+    "julius enderby": (
+        "The Commissioner — an imposing man in uniform with keen eyes. He commands "
+        "authority and expects results."
+    ),
+    "desk officer": (
+        "A hardened veteran of the police force, weathered by years of service."
+    ),
+    "neighbor": "An ordinary citizen going about their daily life.",
+    "city official": (
+        "A bureaucrat in formal attire, always busy with official business."
+    ),
+    "street vendor": "Someone selling goods in the plaza, trying to make a living.",
+    "administrator": "A professional, efficient and polite.",
+    "records clerk": "A tired-looking person who has spent years managing data.",
+    "dispensary attendant": "An employee mindlessly restocking nutrition dispensers.",
+    "scene officer": "A forensic officer still collecting evidence.",
+    "jessie baley": (
+        "Jessie Baley — your wife. Warm, practical, and quietly proud of your work. "
+        "She worries about the long hours and keeps the household steady."
+    ),
+    "ben baley": (
+        "Ben Baley — your young son. Energetic, curious, and fascinated by robots. He "
+        "loves asking questions and getting distracted easily."
+    ),
+    "vince barrett": (
+        "A junior officer with a bitter expression. He lost his position when robots "
+        "were integrated into the department."
+    ),
+    "r. sammy": (
+        "A service robot with efficient movements. His optical sensors track "
+        "everything with mechanical precision."
+    ),
+    "han fastolfe": (
+        "A well-dressed stranger with an air of quiet authority. He carries himself "
+        "with the bearing of someone accustomed to spacer technology."
+    ),
+    "dr. anthony gerrigel": (
+        "A distinguished scientist surrounded by robotics equipment and research data. "
+        "His expression is thoughtful and measured."
+    ),
+    "francis clousarr": (
+        "A thin, intense man behind detention glass. His eyes burn with conviction and "
+        "resentment toward robots."
+    ),
+}
+
+# Opening lines when talking to an NPC, keyed by lowercase name
+NPC_DIALOGUES = {
+    "r. daneel olivaw": """
+        R. Daneel Olivaw regards you with those unblinking robotic eyes.
+        
+        "Good morning, Detective. I am R. Daneel Olivaw, a humanoid robot
+        from the Outer Regions. I have been assigned as your partner in
+        this investigation. I hope my presence will not be... problematic.
+        I am designed to follow the Three Laws of Robotics, which ensures
+        I will protect human life."
+        
+        How do you respond?
+        """,
+    "julius enderby": """
+        The Commissioner leans back in his chair, his face stern.
+        
+        "Listen here, detective. I know you're not happy about working
+        with a robot. But the Outer Regions have demanded it. There's
+        been a murder with political implications. We need to solve this
+        quickly and carefully. The robot stays with you."
+        
+        He eyes you coldly. The matter is not up for discussion.
+        """,
+    "records clerk": """
+        The clerk looks up from their work, exhausted.
+        
+        "Welcome to Records. Do you need citizen information? Birth records?
+        Employment history? Everything about every person in these caves
+        is filed here. It's all... so much data."
+        
+        What information do you seek?
+        """,
+    "vince barrett": """
+        Vince looks at you with barely concealed frustration.
+        
+        "Another investigation where the robots get all the attention, huh?
+        Used to be, we did the real work. Now they show up and take credit
+        for the deductions. Just watch — that Daneel will solve it and
+        we'll all look bad for needing the help."
+        
+        He turns away bitterly.
+        """,
+    "r. sammy": """
+        R. Sammy's optical sensors pulse with pale blue light.
+        
+        "Detective. My data analysis is complete. Dr. Roj Nemennuh Sarton
+        was a significant figure in robotics research. The circumstances
+        of his death suggest involvement by someone with motive and opportunity.
+        I stand ready to assist in deductive analysis."
+        
+        The robot speaks with mechanical precision.
+        """,
+    "han fastolfe": """
+        Han regards you with composed interest.
+        
+        "Detective. I knew of Roj Sarton through his published research.
+        He was attempting something ambitious — proving that humans and robots
+        could work together seamlessly. His death is a tragedy for that vision.
+        I wonder if someone feared what his success might mean."
+        
+        He pauses meaningfully.
+        """,
+    "dr. anthony gerrigel": """
+        Dr. Gerrigel looks up from his workstation, concern in his eyes.
+        
+        "Roj and I collaborated frequently. He was exploring questions about
+        robot consciousness and human-robot partnership. His latest work...
+        it was groundbreaking. Perhaps too groundbreaking for some people."
+        
+        He adjusts his glasses thoughtfully.
+        """,
+    "francis clousarr": """
+        Francis leans forward, his voice sharp and bitter.
+        
+        "You want to know if I did it? I didn't. But I'm glad he's dead.
+        Sarton spent his life making machines that take human jobs, human lives,
+        human dignity. Maybe someone else agreed with me more forcefully."
+        
+        His fists clench against the detention glass.
+        """,
+    "jessie baley": """
+        Jessie looks up from a small pile of personal effects, smiling when she sees you.
+
+        "Hello, love," she says softly. "Are you all right? You look tired. Don't forget we have dinner at seven — Ben has been asking about your robot partner."
+
+        She reaches for your hand, steady and familiar. "Be careful out there."
+
+        """,
+    "ben baley": """
+        Ben bounces in place, eyes wide with curiosity.
+
+        "Is that the robot?" he asks, pointing toward R. Daneel. "Can I see how it walks? Can it play with me?"
+
+        He fidgets, then leans in conspiratorially: "Do robots eat?"
+
+        """,
+}
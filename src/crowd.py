@@ -0,0 +1,349 @@
+"""
+Crowd Simulation - Ambient citizens in the City's busiest halls
+
+Requires NumPy. Without it the crowds are simply disabled and the game
+runs unchanged.
+"""
+
+import copy
+
+from src.utils import CopyOnWrite
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+# Venue -> number of simulated citizens
+CROWD_VENUES = {
+    "central_plaza": 20000,
+    "food_dispensary": 5000,
+}
+
+HALL_SIZE = 100.0  # Side of a venue's floor, in metres
+WALK_SPEED = 1.3  # Metres per second
+TURN_SECONDS = 60.0  # Simulated time per game turn
+MAX_CATCH_UP_TURNS = 10  # Skipped turns replayed as one longer step
+MEDIEVALIST_LEANING = -0.3  # Leaning below this counts as Medievalist
+CANVASS_RADIUS = 5.0  # Metres around the detective that can be questioned
+
+SIGHTINGS = {
+    "medievalist": [
+        (
+            "Spacer business, that killing. I saw men in boots meeting by the "
+            "ration counters - Clousarr was doing the talking."
+        ),
+        (
+            "The robots are behind it, mark my words. One of them was pushing "
+            "through here the morning it happened."
+        ),
+    ],
+    "neutral": [
+        (
+            "I keep my head down. There was a crowd at the Spacetown gate "
+            "that morning, more than usual."
+        ),
+        (
+            "The strips were jammed toward the Commissioner's sector early "
+            "that day. Somebody important was in a hurry."
+        ),
+    ],
+    "robot_friendly": [
+        (
+            "A service robot - R. Sammy, I think - walked through carrying "
+            "a parcel toward headquarters. Robots don't usually carry things "
+            "for themselves."
+        ),
+        (
+            "I saw a man in glasses stumble near the Spacetown gate. He "
+            "couldn't see a thing without them."
+        ),
+    ],
+}
+
+
+def crowds_available():
+    """Check whether the crowd simulation can run.
+
+    Returns:
+        bool: True if NumPy is installed
+    """
+    return np is not None
+
+
+class Crowd:
+    """Anonymous citizens in one venue, stored as NumPy arrays.
+
+    Each citizen has a position and destination on the venue floor, a
+    faction leaning (-1 Medievalist .. +1 robot-friendly) and a mood
+    (0 agitated .. 1 calm). A step moves everyone at once and relaxes
+    moods towards a baseline pulled down by the local agitation.
+    """
+
+    def __init__(self, venue, size, seed):
+        """Initialize a crowd.
+
+        Args:
+            venue: Location key
+            size: Number of citizens
+            seed: Random seed
+        """
+        self.venue = venue
+        self.rng = np.random.default_rng(seed)
+        # Coordinates are kept as separate contiguous arrays per axis
+        self.x = self._random_coordinates(size)
+        self.y = self._random_coordinates(size)
+        self.destination_x = self._random_coordinates(size)
+        self.destination_y = self._random_coordinates(size)
+        self.leaning = self.rng.random(size, dtype=np.float32) * 2 - 1
+        self.mood = self.rng.random(size, dtype=np.float32)
+        self.agitation = 0.0
+        self.ticks = 0
+
+        # Scratch buffers reused by every step
+        self._heading_x = np.empty(size, dtype=np.float32)
+        self._heading_y = np.empty(size, dtype=np.float32)
+        self._scale = np.empty(size, dtype=np.float32)
+        self._noise = np.empty(size, dtype=np.float32)
+
+    def __len__(self):
+        """Number of citizens."""
+        return len(self.mood)
+
+    def __copy__(self):
+        """Copy the citizens and random state; scratch buffers are shared.
+
+        Returns:
+            Crowd: Copy that can be stepped on its own
+        """
+        clone = object.__new__(Crowd)
+        clone.__dict__.update(self.__dict__)
+        clone.rng = copy.deepcopy(self.rng)
+        for name in ("x", "y", "destination_x", "destination_y", "leaning", "mood"):
+            setattr(clone, name, getattr(self, name).copy())
+        return clone
+
+    def _random_coordinates(self, count):
+        """Draw uniform coordinates on the venue floor.
+
+        Args:
+            count: Number of coordinates
+
+        Returns:
+            ndarray: float32 coordinates
+        """
+        coordinates = self.rng.random(count, dtype=np.float32)
+        coordinates *= HALL_SIZE
+        return coordinates
+
+    def step(self, seconds=TURN_SECONDS):
+        """Advance the crowd by one vectorized step.
+
+        Everything is computed in place on whole arrays; only citizens
+        that arrive are touched individually, to pick a new destination.
+
+        Args:
+            seconds: Simulated time covered by the step
+        """
+        hx, hy, scale, noise = (
+            self._heading_x,
+            self._heading_y,
+            self._scale,
+            self._noise,
+        )
+        np.subtract(self.destination_x, self.x, out=hx)
+        np.subtract(self.destination_y, self.y, out=hy)
+
+        # scale = min(travel / distance, 1): the fraction of the way covered
+        np.hypot(hx, hy, out=scale)
+        np.maximum(scale, np.float32(1e-6), out=scale)
+        np.divide(np.float32(WALK_SPEED * seconds), scale, out=scale)
+        np.minimum(scale, np.float32(1), out=scale)
+        hx *= scale
+        hy *= scale
+        self.x += hx
+        self.y += hy
+
+        # Citizens that reached their destination pick a new one
+        arrived = np.flatnonzero(scale == 1)
+        if len(arrived):
+            self.destination_x[arrived] = self._random_coordinates(len(arrived))
+            self.destination_y[arrived] = self._random_coordinates(len(arrived))
+
+        # Moods drift towards calm, less so for those who share the
+        # grievance when the hall is agitated
+        baseline = noise
+        if self.agitation:
+            np.negative(self.leaning, out=baseline)
+            np.maximum(baseline, 0, out=baseline)
+            baseline *= np.float32(-self.agitation)
+            baseline += np.float32(0.7)
+        else:
+            baseline.fill(0.7)
+        baseline -= self.mood
+        baseline *= np.float32(0.1)
+        self.mood += baseline
+        self.rng.standard_normal(out=noise, dtype=np.float32)
+        noise *= np.float32(0.02)
+        self.mood += noise
+        np.clip(self.mood, 0, 1, out=self.mood)
+        self.ticks += 1
+
+    def summary(self):
+        """Summarize the crowd for location descriptions.
+
+        Returns:
+            dict: count, mean mood and Medievalist share
+        """
+        return {
+            "count": len(self),
+            "mood": float(self.mood.mean()),
+            "medievalist": float((self.leaning < MEDIEVALIST_LEANING).mean()),
+        }
+
+    def describe(self):
+        """Describe the crowd in one line.
+
+        Returns:
+            str: Description
+        """
+        summary = self.summary()
+        if summary["mood"] > 0.6:
+            mood = "calm and shuffling"
+        elif summary["mood"] > 0.4:
+            mood = "restless"
+        else:
+            mood = "angry and jostling"
+        return (
+            f"👥 Crowd: about {summary['count']:,} citizens, {mood}. "
+            f"{summary['medievalist']:.0%} mutter Medievalist slogans."
+        )
+
+    def canvass(self, point=None):
+        """Find the most cooperative citizen near a point.
+
+        Args:
+            point: (x, y) on the venue floor (defaults to the centre)
+
+        Returns:
+            tuple or None: (index, leaning, mood), or None if nobody is close
+        """
+        if point is None:
+            point = (HALL_SIZE / 2, HALL_SIZE / 2)
+        dx = self.x - np.float32(point[0])
+        dy = self.y - np.float32(point[1])
+        near = np.flatnonzero(dx * dx + dy * dy <= CANVASS_RADIUS**2)
+        if len(near) == 0:
+            return None
+        witness = near[np.argmax(self.mood[near])]
+        return int(witness), float(self.leaning[witness]), float(self.mood[witness])
+
+
+class CrowdManager(CopyOnWrite):
+    """Owns the crowds of a session and ticks the ones near the player.
+
+    A venue's crowd is only created the first time the player comes near
+    it, so sessions that never visit a venue pay nothing for it. A fork
+    copies a crowd's arrays only when it steps the crowd.
+    """
+
+    COW_FIELDS = ("crowds", "skipped")
+    COW_ITEMS = ("crowds",)
+
+    def __init__(self, seed=1954, venues=None):
+        """Initialize the manager.
+
+        Args:
+            seed: Base random seed
+            venues: Dict of venue key to crowd size (defaults to CROWD_VENUES)
+        """
+        self.seed = seed
+        self.venues = CROWD_VENUES if venues is None else venues
+        self.crowds = {}
+        self.skipped = {}
+
+    def tick(self, location_key, exits):
+        """Advance one game turn.
+
+        Only crowds at or next to the player's location are simulated.
+        Turns a crowd missed are replayed as one longer step when the
+        player comes back, up to MAX_CATCH_UP_TURNS.
+
+        Args:
+            location_key: Player's location
+            exits: Exits of the player's location (dict of name to key)
+
+        Returns:
+            list: Venues that were stepped
+        """
+        skipped = self.own("skipped")
+        for venue in skipped:
+            skipped[venue] += 1
+        if not crowds_available():
+            return []
+
+        stepped = []
+        for venue in {location_key, *exits.values()}:
+            crowd = self.get(venue)
+            if crowd is None:
+                continue
+            turns = min(skipped[venue], MAX_CATCH_UP_TURNS)
+            self.own_item("crowds", venue).step(TURN_SECONDS * turns)
+            skipped[venue] = 0
+            stepped.append(venue)
+        return sorted(stepped)
+
+    def get(self, location_key):
+        """Get the crowd at a location, creating it on first use.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            Crowd or None: None if the location has no crowd or NumPy is
+            not installed
+        """
+        crowd = self.crowds.get(location_key)
+        if crowd is None and crowds_available() and location_key in self.venues:
+            offset = sorted(self.venues).index(location_key)
+            crowd = Crowd(location_key, self.venues[location_key], self.seed + offset)
+            self.own("crowds")[location_key] = crowd
+            self.own("skipped")[location_key] = 1
+        return crowd
+
+    def set_agitation(self, location_key, agitation):
+        """Set how stirred up a venue is (e.g. a robot walked in).
+
+        Args:
+            location_key: Venue key
+            agitation: 0 (calm) .. 1 (riot)
+        """
+        crowd = self.crowds.get(location_key)
+        if crowd is not None and crowd.agitation != agitation:
+            self.own_item("crowds", location_key).agitation = agitation
+
+    def sighting(self, location_key):
+        """Get what a bystander at a venue saw.
+
+        Args:
+            location_key: Venue key
+
+        Returns:
+            str or None: Sighting text, or None if there is no one to ask
+        """
+        crowd = self.get(location_key)
+        if crowd is None:
+            return None
+        found = crowd.canvass()
+        if found is None:
+            return None
+        index, leaning, _ = found
+        if leaning < MEDIEVALIST_LEANING:
+            group = "medievalist"
+        elif leaning > -MEDIEVALIST_LEANING:
+            group = "robot_friendly"
+        else:
+            group = "neutral"
+        lines = SIGHTINGS[group]
+        return lines[index % len(lines)]
@@ -0,0 +1,184 @@
+"""
+Deduction Engine - Track which suspects still fit the recorded facts
+
+Each fact (a piece of evidence found, an alibi verified) is applied once
+and only touches the suspects it names, so recording a fact costs the
+same however many suspects the case has.
+"""
+
+import bisect
+
+from src.utils import CopyOnWrite
+
+
+class DeductionEngine(CopyOnWrite):
+    """Incrementally narrows the suspect list.
+
+    A suspect stays a candidate until a fact rules them out: evidence that
+    clears them, or verified alibis that together cover the whole window
+    in which the murder happened. Found evidence that implicates a
+    candidate adds to their support.
+    """
+
+    COW_FIELDS = (
+        "candidates",
+        "eliminated",
+        "support",
+        "implicates",
+        "clears",
+        "evidence_of",
+        "found",
+        "open_leads",
+        "cover",
+    )
+    COW_ITEMS = ("evidence_of", "cover")
+
+    def __init__(self, window):
+        """Initialize the engine.
+
+        Args:
+            window: (start, end) of the time of death in minutes after midnight
+        """
+        self.window = window
+        self.candidates = set()
+        self.eliminated = {}  # Suspect -> reason, in the order ruled out
+        self.support = {}  # Suspect -> found evidence implicating them
+        self.implicates = {}  # Evidence -> suspects it points at
+        self.clears = {}  # Evidence -> suspects it rules out
+        self.evidence_of = {}  # Suspect -> evidence that would implicate them
+        self.found = set()
+        self.open_leads = {}  # Unfound evidence -> candidates it implicates
+        self.cover = {}  # Suspect -> merged (start, end) alibi intervals
+
+    def add_suspect(self, name):
+        """Add a suspect who has not been ruled out.
+
+        Args:
+            name: Suspect name
+        """
+        if name in self.support:
+            return
+        self.own("candidates").add(name)
+        self.own("support")[name] = 0
+        self.own("evidence_of")[name] = []
+        self.own("cover")[name] = []
+
+    def add_evidence(self, evidence, implicates, clears=()):
+        """Add a piece of evidence that has not been found yet.
+
+        Args:
+            evidence: Evidence name
+            implicates: Suspects the evidence points at
+            clears: Suspects the evidence rules out
+        """
+        self.own("implicates")[evidence] = tuple(implicates)
+        self.own("clears")[evidence] = tuple(clears)
+        for name in implicates:
+            self.add_suspect(name)
+            self.own_item("evidence_of", name).append(evidence)
+        for name in clears:
+            self.add_suspect(name)
+        self.own("open_leads")[evidence] = sum(
+            1 for name in implicates if name in self.candidates
+        )
+
+    def record_evidence(self, evidence):
+        """Apply a found piece of evidence.
+
+        Args:
+            evidence: Evidence name
+
+        Returns:
+            list: Suspects ruled out by it
+        """
+        if evidence in self.found or evidence not in self.implicates:
+            return []
+        self.own("found").add(evidence)
+        del self.own("open_leads")[evidence]
+        support = self.own("support")
+        for name in self.implicates[evidence]:
+            support[name] += 1
+        return [
+            name
+            for name in self.clears[evidence]
+            if self.eliminate(name, f"cleared by {evidence.replace('_', ' ')}")
+        ]
+
+    def record_alibi(self, name, start, end):
+        """Apply a verified alibi interval.
+
+        Args:
+            name: Suspect name
+            start: Start of the verified interval in minutes
+            end: End of the verified interval in minutes
+
+        Returns:
+            bool: Whether the suspect's verified alibis now cover the time of death
+        """
+        self.add_suspect(name)
+        intervals = self.own_item("cover", name)
+        i = bisect.bisect_left(intervals, (start, end))
+        # Merge with any overlapping or touching neighbours
+        if i > 0 and intervals[i - 1][1] >= start:
+            i -= 1
+            start = intervals[i][0]
+            end = max(end, intervals[i][1])
+            del intervals[i]
+        while i < len(intervals) and intervals[i][0] <= end:
+            end = max(end, intervals[i][1])
+            del intervals[i]
+        intervals.insert(i, (start, end))
+
+        covered = start <= self.window[0] and end >= self.window[1]
+        if covered:
+            self.eliminate(name, "alibi covers the time of death")
+        return covered
+
+    def eliminate(self, name, reason):
+        """Rule a suspect out.
+
+        Args:
+            name: Suspect name
+            reason: Why they were ruled out
+
+        Returns:
+            bool: Whether they were still a candidate
+        """
+        if name not in self.candidates:
+            return False
+        self.own("candidates").discard(name)
+        self.own("eliminated")[name] = reason
+        open_leads = self.own("open_leads")
+        for evidence in self.evidence_of[name]:
+            if evidence in open_leads:
+                open_leads[evidence] -= 1
+        return True
+
+    def ranked_candidates(self):
+        """Get the remaining candidates, best supported first.
+
+        Returns:
+            list: (name, support) tuples
+        """
+        return sorted(
+            ((name, self.support[name]) for name in self.candidates),
+            key=lambda entry: (-entry[1], entry[0]),
+        )
+
+    def splitting_evidence(self):
+        """Find unfound evidence that would separate the remaining candidates.
+
+        Evidence splits them when it implicates some candidates but not all.
+
+        Returns:
+            list: (evidence, implicated candidates) tuples
+        """
+        total = len(self.candidates)
+        return [
+            (
+                evidence,
+                [name for name in self.implicates[evidence] if name in self.candidates],
+            )
+            for evidence, count in self.open_leads.items()
+            if 0 < count < total
+        ]
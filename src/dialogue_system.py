@@ -103,29 +103,29 @@ class DialogueManager:
         self.trees["R. Daneel Olivaw"] = self._create_daneel_dialogue()
         self.trees["Records Clerk"] = self._create_clerk_dialogue()
 
-        # Jessie Bailey - family dialogue (original content inspired by family concerns)
-        jessie = DialogueTree("Jessie Bailey")
+        # Jessie Baley - family dialogue (original content inspired by family concerns)
+        jessie = DialogueTree("Jessie Baley")
         j_start = DialogueNode(
-            "Jessie Bailey",
+            "Jessie Baley",
             """Jessie looks anxious but relieved to see you. 'We're all worried,' she says.""",
         )
         j_start.add_choice(DialogueChoice("Ask how she's holding up.", relationship_impact=5))
         j_start.add_choice(DialogueChoice("Ask about family routines.", relationship_impact=3))
         j_start.add_choice(DialogueChoice("Offer reassurance.", relationship_impact=10))
         jessie.add_node("start", j_start)
-        self.trees["Jessie Bailey"] = jessie
+        self.trees["Jessie Baley"] = jessie
 
-        # Ben Bailey - short, age-appropriate dialogue
-        ben = DialogueTree("Ben Bailey")
+        # Ben Baley - short, age-appropriate dialogue
+        ben = DialogueTree("Ben Baley")
         b_start = DialogueNode(
-            "Ben Bailey",
+            "Ben Baley",
             """Ben looks up, clutching a small model rocket. 'Hi,' he says, watching you closely.""",
         )
         b_start.add_choice(DialogueChoice("Ask about the rocket.", relationship_impact=8))
         b_start.add_choice(DialogueChoice("Ask how he's feeling.", relationship_impact=5))
         b_start.add_choice(DialogueChoice("Offer to play a quick game.", relationship_impact=10))
         ben.add_node("start", b_start)
-        self.trees["Ben Bailey"] = ben
+        self.trees["Ben Baley"] = ben
 
         # Vince Barrett - colleague who lost position to robot
         vince = DialogueTree("Vince Barrett")
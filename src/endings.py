@@ -1,7 +1,36 @@
 """
 Multiple Endings System - Different endings based on player choices
+
+Ending conditions are tests on a small feature vector describing how the
+case closed. They are compiled once into a decision table: for each
+feature, every possible value maps to a bitmask of the endings whose
+test it passes, with bits in priority order. Deciding an ending ANDs one
+mask per feature and takes the lowest bit, so it costs the same however
+the conditions are written.
 """
 
+import bisect
+
+# Features an ending can test, in the order of a feature vector:
+#   correct  - whether the accusation named the killer
+#   killer   - who the killer is
+#   evidence - key evidence found
+#   points   - investigation points
+#   period   - time of day
+#   day      - day of the investigation
+#   wrongly_accused - whether an innocent suspect stands accused
+FEATURES = (
+    "correct",
+    "killer",
+    "evidence",
+    "points",
+    "period",
+    "day",
+    "wrongly_accused",
+)
+# Features tested against (low, high) ranges; the others against a value
+NUMERIC_FEATURES = {"evidence", "points", "day"}
+
 
 class Ending:
     """Represents a game ending."""
@@ -13,7 +42,9 @@ class Ending:
             ending_id: Unique ending ID
             title: Ending title
             description: Ending story
-            conditions: Function that checks if this ending is reached
+            conditions: Dict of feature name -> value it must equal, or
+                (low, high) range it must fall in, low inclusive and high
+                exclusive, None for no bound
             score_bonus: Points awarded for this ending
         """
         self.ending_id = ending_id
@@ -30,6 +61,7 @@ class EndingsManager:
         """Initialize endings manager."""
         self.endings = []
         self._create_endings()
+        self._compile()
 
     def _create_endings(self):
         """Create all possible endings."""
@@ -54,10 +86,7 @@ But privately, the Spacers remain unsatisfied. Enderby was supposed to serve
 their cause. Instead, he faces prison. They depart Earth, their mission incomplete.
 
 You have truly solved The Caves of Steel—but at the cost of galactic expansion.""",
-                lambda p, gs, mp: (
-                    mp.check_solution("Julius Enderby")["correct"]
-                    and sum(1 for v in mp.key_evidence.values() if v) >= 4
-                ),
+                {"correct": True, "killer": "Julius Enderby", "evidence": (4, None)},
                 score_bonus=500,
             )
         )
@@ -89,11 +118,7 @@ The Spacers board their ship. Enderby receives a quiet promotion.
 Earth enters a new era of human-robot cooperation.
 
 Your conscience remains troubled. Justice compromised for progress.""",
-                lambda p, gs, mp: (
-                    mp.check_solution("Julius Enderby")["correct"]
-                    and sum(1 for v in mp.key_evidence.values() if v) >= 2
-                    and sum(1 for v in mp.key_evidence.values() if v) < 4
-                ),
+                {"correct": True, "killer": "Julius Enderby", "evidence": (2, 4)},
                 score_bonus=300,
             )
         )
@@ -114,10 +139,7 @@ Your partnership with R. Daneel has also proven that humans and robots can
 work together effectively.
 
 The case is closed.""",
-                lambda p, gs, mp: (
-                    mp.check_solution(mp.actual_killer)["correct"]
-                    and p.investigation_points >= 50
-                ),
+                {"correct": True, "points": (50, None)},
                 score_bonus=300,
             )
         )
@@ -137,10 +159,7 @@ Years later, you still wonder if true justice was served, or if you simply
 condemned the most likely suspect. The case remains a blemish on your record.
 
 The case is closed... but at what cost?""",
-                lambda p, gs, mp: (
-                    mp.check_solution(mp.actual_killer)["correct"]
-                    and p.investigation_points < 50
-                ),
+                {"correct": True, "points": (None, 50)},
                 score_bonus=150,
             )
         )
@@ -165,7 +184,7 @@ appeared sound, but the conclusion was incorrect. I suggest introspection."
 Your career is over. The real murderer walks free.
 
 THE WORST ENDING.""",
-                lambda p, gs, mp: not mp.check_solution(mp.actual_killer)["correct"],
+                {"correct": False, "wrongly_accused": True},
                 score_bonus=0,
             )
         )
@@ -189,15 +208,127 @@ You spend the rest of your career on desk duty, wondering about the
 murder that got away.
 
 THE CASE REMAINS UNSOLVED.""",
-                lambda p, gs, mp: (
-                    gs.time_period == "night"
-                    and gs.day >= 3
-                    and p.investigation_points < 30
-                ),
+                {"correct": False, "wrongly_accused": False},
                 score_bonus=50,
             )
         )
 
+    def _compile(self):
+        """Compile the ending conditions into the decision table."""
+        # Highest score first; ties keep the order the endings were written in
+        self.ranked = sorted(self.endings, key=lambda e: -e.score_bonus)
+        everyone = (1 << len(self.ranked)) - 1
+        self.value_table = []  # (feature index, value -> mask, other values' mask)
+        self.range_table = []  # (feature index, cut points, mask per interval)
+        for index, feature in enumerate(FEATURES):
+            tests = [ending.conditions.get(feature) for ending in self.ranked]
+            if all(test is None for test in tests):
+                continue
+            if feature in NUMERIC_FEATURES:
+                self.range_table.append((index, *self._compile_ranges(tests, everyone)))
+            else:
+                self.value_table.append((index, *self._compile_values(tests, everyone)))
+
+    @staticmethod
+    def _compile_ranges(tests, everyone):
+        """Compile range tests on one numeric feature.
+
+        Args:
+            tests: (low, high) or None per ranked ending
+            everyone: Mask of all endings
+
+        Returns:
+            tuple: (cut points, mask for each interval between them)
+        """
+        cuts = sorted(
+            {bound for test in tests if test for bound in test if bound is not None}
+        )
+        masks = []
+        # Interval 0 holds values below the first cut, interval i values
+        # from cuts[i - 1] up to the next cut
+        for i in range(len(cuts) + 1):
+            mask = everyone
+            for bit, test in enumerate(tests):
+                if test is None:
+                    continue
+                low, high = test
+                if i == 0:
+                    passes = low is None
+                else:
+                    value = cuts[i - 1]
+                    above = low is None or value >= low
+                    passes = above and (high is None or value < high)
+                if not passes:
+                    mask &= ~(1 << bit)
+            masks.append(mask)
+        return cuts, masks
+
+    @staticmethod
+    def _compile_values(tests, everyone):
+        """Compile equality tests on one feature.
+
+        Args:
+            tests: Required value or None per ranked ending
+            everyone: Mask of all endings
+
+        Returns:
+            tuple: (value -> mask, mask for any other value)
+        """
+        other = everyone
+        for bit, test in enumerate(tests):
+            if test is not None:
+                other &= ~(1 << bit)
+        masks = {}
+        for bit, test in enumerate(tests):
+            if test is not None:
+                masks[test] = masks.get(test, other) | (1 << bit)
+        return masks, other
+
+    @staticmethod
+    def features(player, game_state, mystery_plot):
+        """Describe how the case stands as a feature vector.
+
+        The case closes on an accusation that names the killer, or
+        unsolved when the deadline passes, so a solved case counts as a
+        correct accusation. An unsolved case ends on whoever stands
+        accused by then.
+
+        Args:
+            player: Player object
+            game_state: GameState object
+            mystery_plot: MysteryPlot object
+
+        Returns:
+            tuple: Values in FEATURES order
+        """
+        return (
+            game_state.case_solved,
+            mystery_plot.actual_killer,
+            mystery_plot.evidence_count,
+            player.investigation_points,
+            game_state.time_period,
+            game_state.day,
+            mystery_plot.wrongly_accused,
+        )
+
+    def decide(self, features):
+        """Find the ending a feature vector reaches.
+
+        Args:
+            features: Tuple of values in FEATURES order
+
+        Returns:
+            Ending or None
+        """
+        mask = -1
+        for index, masks, other in self.value_table:
+            mask &= masks.get(features[index], other)
+        for index, cuts, masks in self.range_table:
+            mask &= masks[bisect.bisect_right(cuts, features[index])]
+        if not mask:
+            return None
+        return self.ranked[(mask & -mask).bit_length() - 1]
+
     def check_ending(self, player, game_state, mystery_plot):
         """Check which ending conditions are met.
 
@@ -209,14 +340,20 @@ THE CASE REMAINS UNSOLVED.""",
         Returns:
             Ending or None
         """
-        for ending in sorted(self.endings, key=lambda e: e.score_bonus, reverse=True):
-            try:
-                if ending.conditions(player, game_state, mystery_plot):
-                    return ending
-            except Exception:
-                continue
+        return self.decide(self.features(player, game_state, mystery_plot))
+
+    @staticmethod
+    def final_score(ending, player):
+        """Work out the score a game finished with.
+
+        Args:
+            ending: Ending object
+            player: Player object
 
-        return None
+        Returns:
+            int: Investigation points plus the ending's bonus
+        """
+        return player.investigation_points + ending.score_bonus
 
     def display_ending(self, ending, player):
         """Display an ending to the player.
@@ -228,7 +365,7 @@ THE CASE REMAINS UNSOLVED.""",
         Returns:
             str: Formatted ending
         """
-        final_score = player.investigation_points + ending.score_bonus
+        final_score = self.final_score(ending, player)
 
         # Personalize any references to 'Detective' in the ending text
         try:
@@ -1,53 +1,246 @@
 """
-Time-Based Events System - Events that trigger at specific times
+Game Events System - Events triggered by the time or the state of the case
+
+Timed events wait in a heap keyed by the minute of the game clock they
+are due at, so a turn only looks at the earliest. Other events have a
+trigger: a predicate over named facts about the game (the evidence
+found, trust with an NPC...) together with the facts it reads. After
+each turn the manager finds the facts that changed, looking only at
+objects whose version counter moved, and evaluates just the events that
+read one of them.
 """
 
+import heapq
+
+from src.schedules import period_start
+from src.utils import CopyOnWrite
+
+# Fact name -> (source, reader). The source names the Versioned object
+# whose version covers the fact, the reader gets the value from it.
+FACTS = {
+    "day": ("game_state", lambda game_state: game_state.day),
+    "time_period": ("game_state", lambda game_state: game_state.time_period),
+    "visited": (
+        "game_state",
+        lambda game_state: frozenset(game_state.visited_locations),
+    ),
+    "location": ("player", lambda player: player.current_location),
+    "points": ("player", lambda player: player.investigation_points),
+    "inventory": ("player", lambda player: tuple(player.inventory)),
+    "clues": ("player", lambda player: len(player.clues_found)),
+    "evidence": ("mystery", lambda mystery: mystery.evidence_count),
+    "puzzles": ("puzzles", lambda puzzles: puzzles.solved_count),
+}
+# "trust:<NPC name>" facts hold the trust of that NPC
+TRUST_PREFIX = "trust:"
+
+
+def fact_source(fact):
+    """Find where a fact is read from.
+
+    Args:
+        fact: Fact name
+
+    Returns:
+        tuple: (source name, reader), or None for an unknown fact
+    """
+    if fact.startswith(TRUST_PREFIX):
+        return fact, lambda relationship: relationship.trust
+    return FACTS.get(fact)
+
+
+def _source(name, player, game_state):
+    """Get the object a source name refers to.
+
+    Args:
+        name: Source name
+        player: Player object
+        game_state: GameState object
+
+    Returns:
+        Versioned object, or None for an NPC without a relationship
+    """
+    if name == "player":
+        return player
+    if name == "game_state":
+        return game_state
+    if name == "mystery":
+        return game_state.mystery
+    if name == "puzzles":
+        return game_state.puzzle_manager
+    return game_state.relationships.relationships.get(name[len(TRUST_PREFIX) :])
+
+
+class FactWatcher(CopyOnWrite):
+    """Reads facts and reports which changed since the last read.
+
+    Facts are only read from sources whose version moved, so a check
+    costs one version lookup per source plus the facts that changed.
+    """
+
+    COW_FIELDS = ("seen", "values")
+
+    def __init__(self, facts=()):
+        """Initialize the watcher.
 
-class TimedEvent:
-    """Represents an event that occurs at a specific game time."""
+        Args:
+            facts: Names of the facts to watch
+        """
+        self.sources = {}  # Source name -> ((fact name, reader), ...)
+        self.seen = {}  # Source name -> (object, version) when last read
+        self.values = {}  # Fact name -> value when last read
+        self.watch(facts)
 
-    def __init__(self, event_id, description, time_period, day, action=None):
-        """Initialize a timed event.
+    def watch(self, facts):
+        """Start watching more facts.
+
+        Args:
+            facts: Fact names; ones already watched are skipped
+        """
+        sources = dict(self.sources)
+        for fact in facts:
+            source, reader = fact_source(fact)
+            if any(fact == watched for watched, _ in sources.get(source, ())):
+                continue
+            sources[source] = sources.get(source, ()) + ((fact, reader),)
+            # Read the source again so the new fact gets a value
+            if source in self.seen:
+                del self.own("seen")[source]
+        self.sources = sources
+
+    def changed(self, player, game_state):
+        """Read the facts whose source changed since the last check.
+
+        Args:
+            player: Player object
+            game_state: GameState object
+
+        Returns:
+            set: Names of the facts with a new value
+        """
+        changed = set()
+        for name, readers in self.sources.items():
+            source = _source(name, player, game_state)
+            stamp = (source, source.version) if source is not None else None
+            if self.seen.get(name) == stamp:
+                continue
+            self.own("seen")[name] = stamp
+            for fact, reader in readers:
+                value = reader(source) if source is not None else None
+                if fact not in self.values or self.values[fact] != value:
+                    self.own("values")[fact] = value
+                    changed.add(fact)
+        return changed
+
+
+class GameEvent:
+    """Represents an event that occurs when the game reaches some state."""
+
+    def __init__(self, event_id, description, condition=None, depends_on=(), when=None):
+        """Initialize an event.
 
         Args:
             event_id: Unique event ID
             description: What happens
-            time_period: When it happens (morning, afternoon, evening, night)
-            day: Which day (1, 2, 3, etc.)
-            action: Function to call when event triggers
+            condition: Function of a fact name -> value dict that checks
+                whether the event happens, or None
+            depends_on: Names of the facts the condition reads
+            when: Dict of fact name -> value each must equal, or None
         """
         self.event_id = event_id
         self.description = description
-        self.time_period = time_period
-        self.day = day
-        self.action = action
+        self.condition = condition
+        self.when = dict(when or {})
+        self.depends_on = tuple(self.when) + tuple(
+            fact for fact in depends_on if fact not in self.when
+        )
         self.triggered = False
 
-    def should_trigger(self, current_day, current_time):
+    def should_trigger(self, facts):
         """Check if this event should trigger.
 
         Args:
-            current_day: Current game day
-            current_time: Current time period
+            facts: Fact name -> current value
 
         Returns:
             bool: Whether event should trigger
         """
-        return (
-            current_day == self.day
-            and current_time == self.time_period
-            and not self.triggered
-        )
+        if self.triggered:
+            return False
+        for fact, value in self.when.items():
+            if facts[fact] != value:
+                return False
+        return self.condition is None or self.condition(facts)
+
+
+class TimedEvent(GameEvent):
+    """Represents an event that occurs at a specific game time."""
+
+    def __init__(self, event_id, description, time_period, day, action=None):
+        """Initialize a timed event.
+
+        Args:
+            event_id: Unique event ID
+            description: What happens
+            time_period: When it happens (morning, afternoon, evening, night)
+            day: Which day (1, 2, 3, etc.)
+            action: Function to call when event triggers
+        """
+        super().__init__(event_id, description)
+        self.time_period = time_period
+        self.day = day
+        self.at = period_start(day, time_period)  # Game clock minute it is due
+        self.action = action
 
 
-class EventManager:
-    """Manages all timed events in the game."""
+class EventManager(CopyOnWrite):
+    """Manages all game events."""
+
+    COW_FIELDS = ("events", "events_log", "schedule")
+    COW_ITEMS = ("events",)
+    FORK_FIELDS = ("watcher",)
 
     def __init__(self):
         """Initialize event manager."""
         self.events = []
         self._create_events()
         self.events_log = []
+        # (due minute, event index) of the timed events still to come
+        self.schedule = [
+            (event.at, index)
+            for index, event in enumerate(self.events)
+            if isinstance(event, TimedEvent)
+        ]
+        heapq.heapify(self.schedule)
+        self.watcher = FactWatcher()
+        self._index()
+
+    def _index(self):
+        """Index the events by the facts they read, and the facts by source.
+
+        Events with a condition are listed under every fact it reads.
+        Events with only required values are filed under those values, so
+        a change looks up the few events matching the new values.
+        """
+        self.positions = {
+            event.event_id: index for index, event in enumerate(self.events)
+        }
+        self.watchers = {}  # Fact name -> indices of the events to evaluate
+        self.keyed = {}  # Facts -> their required values -> event indices
+        self.keyed_by_fact = {}  # Fact name -> keyed fact tuples using it
+        for index, event in enumerate(self.events):
+            self.watcher.watch(event.depends_on)
+            if not event.depends_on:
+                continue
+            if event.condition is not None or not event.when:
+                for fact in event.depends_on:
+                    self.watchers.setdefault(fact, []).append(index)
+                continue
+            facts = tuple(sorted(event.when))
+            values = tuple(event.when[fact] for fact in facts)
+            self.keyed.setdefault(facts, {}).setdefault(values, []).append(index)
+            for fact in facts:
+                self.keyed_by_fact.setdefault(fact, set()).add(facts)
 
     def _create_events(self):
         """Create all timed events."""
@@ -135,30 +328,150 @@ class EventManager:
             )
         )
 
-    def get_triggered_events(self, current_day, current_time):
+        # Events driven by the investigation itself
+        self.events.append(
+            GameEvent(
+                "scene_examined",
+                (
+                    "Standing in Sarton's dome, you notice the Spacers watching "
+                    "your every move."
+                ),
+                lambda facts: "crime_scene" in facts["visited"],
+                ("visited",),
+            )
+        )
+
+        self.events.append(
+            GameEvent(
+                "case_building",
+                (
+                    "R. Daneel observes: 'We now hold enough evidence to make an "
+                    "accusation, partner.'"
+                ),
+                lambda facts: facts["evidence"] >= 3,
+                ("evidence",),
+            )
+        )
+
+        self.events.append(
+            GameEvent(
+                "commissioner_cold",
+                (
+                    "Commissioner Enderby stops taking your calls. Word is he wants "
+                    "you off the case."
+                ),
+                lambda facts: facts["trust:Julius Enderby"] < -25,
+                ("trust:Julius Enderby",),
+            )
+        )
+
+    def add_event(self, event_id, description, time_period, day):
+        """Add an event, such as one from a generated case.
+
+        Args:
+            event_id: Unique event ID
+            description: What happens
+            time_period: When it happens (morning, afternoon, evening, night)
+            day: Which day (1, 2, 3, etc.)
+        """
+        event = TimedEvent(event_id, description, time_period, day)
+        self.own("events").append(event)
+        heapq.heappush(self.own("schedule"), (event.at, len(self.events) - 1))
+        self._index()
+
+    def next_event_time(self):
+        """Get when the next timed event is due.
+
+        Returns:
+            int or None: Game clock minute, or None if none are left
+        """
+        return self.schedule[0][0] if self.schedule else None
+
+    def restore(self, events_log, clock):
+        """Set which events occurred, as when loading a game.
+
+        Events the log does not name are pending again, even if they fired
+        later in this session. Timed events due before the clock are
+        dropped even if the log does not name them, so an old save does not
+        replay them all at once.
+
+        Args:
+            events_log: IDs of the events that occurred
+            clock: Game clock minute
+        """
+        occurred = set(events_log)
+        for index, event in enumerate(self.events):
+            if event.triggered != (event.event_id in occurred):
+                self.own_item("events", index).triggered = event.event_id in occurred
+        self.events_log = [
+            event_id for event_id in events_log if event_id in self.positions
+        ]
+        self.schedule = [
+            (event.at, index)
+            for index, event in enumerate(self.events)
+            if isinstance(event, TimedEvent)
+            and not event.triggered
+            and event.at >= clock
+        ]
+        heapq.heapify(self.schedule)
+        # Read every fact afresh so conditions are checked against the
+        # loaded state
+        self.watcher = FactWatcher(
+            fact for event in self.events for fact in event.depends_on
+        )
+
+    def get_triggered_events(self, player, game_state):
         """Get all events that should trigger now.
 
+        Timed events come first, in the order they fell due. Of the other
+        events, only those reading a fact that changed are evaluated.
+
         Args:
-            current_day: Current game day
-            current_time: Current time period
+            player: Player object
+            game_state: GameState object
 
         Returns:
             list: Events that should trigger
         """
         triggered = []
-        for event in self.events:
-            if event.should_trigger(current_day, current_time):
-                event.triggered = True
-                triggered.append(event)
-                self.events_log.append(event.event_id)
+        while self.schedule and self.schedule[0][0] <= game_state.clock:
+            _, index = heapq.heappop(self.own("schedule"))
+            self._trigger(index, triggered)
+
+        candidates = set()
+        keyed = set()
+        changed = self.watcher.changed(player, game_state)
+        facts = self.watcher.values
+        for fact in changed:
+            candidates.update(self.watchers.get(fact, ()))
+            keyed.update(self.keyed_by_fact.get(fact, ()))
+        for names in keyed:
+            values = tuple(facts[name] for name in names)
+            candidates.update(self.keyed[names].get(values, ()))
+
+        for index in sorted(candidates):
+            if self.events[index].should_trigger(facts):
+                self._trigger(index, triggered)
 
         return triggered
 
+    def _trigger(self, index, triggered):
+        """Mark an event as occurred and log it.
+
+        Args:
+            index: Event index
+            triggered: List to add the event to
+        """
+        event = self.own_item("events", index)
+        event.triggered = True
+        triggered.append(event)
+        self.own("events_log").append(event.event_id)
+
     def display_event(self, event):
         """Display an event to the player.
 
         Args:
-            event: TimedEvent to display
+            event: GameEvent to display
 
         Returns:
             str: Formatted event display
@@ -180,7 +493,8 @@ class EventManager:
         Returns:
             bool: Whether event has been triggered
         """
-        return event_id in self.events_log
+        index = self.positions.get(event_id)
+        return index is not None and self.events[index].triggered
 
     def get_events_log(self):
         """Get a summary of all events that have occurred.
@@ -193,8 +507,6 @@ class EventManager:
 
         log = "📋 EVENT LOG:\n"
         for event_id in self.events_log:
-            event = next((e for e in self.events if e.event_id == event_id), None)
-            if event:
-                log += f"  • {event.description}\n"
+            log += f"  • {self.events[self.positions[event_id]].description}\n"
 
         return log
@@ -2,30 +2,65 @@
 Game Engine - Core loop and command processing
 """
 
-from src.locations import LOCATIONS
+import io
+import re
+import sys
+import textwrap
+import time
+from contextlib import redirect_stdout
+
+from src.achievements import AchievementTracker
 from src.commands import CommandProcessor
-from src.utils import clear_screen, print_separator
+from src.leaderboard import format_runs
+from src.mystery_plot import CASE_MINUTES
+from src.schedules import period_start
+from src.utils import clear_screen
 from src.save_system import SaveSystem
 
+# Commands in a pipeline are separated by ';' or by newlines
+PIPELINE_SEPARATOR = re.compile(r"[;\n]")
+
 
 class GameEngine:
     """Main game engine that handles the core game loop."""
 
-    def __init__(self, player, game_state, save_dir=None):
+    def __init__(
+        self, player, game_state, save_dir=None, watch_content=False, leaderboard=None
+    ):
         """Initialize the game engine.
 
         Args:
             player: Player object
             game_state: GameState object
             save_dir: Optional custom save directory path
+            watch_content: Reload edited content files while the game runs
+            leaderboard: Leaderboard to record the game and its
+                achievements in, or None to keep no records
         """
         self.player = player
         self.game_state = game_state
         self.command_processor = CommandProcessor(player, game_state)
+        self.leaderboard = leaderboard
+        self.achievements = None
+        if leaderboard is not None:
+            self.achievements = AchievementTracker(leaderboard)
+            self.command_processor.records = self.achievements
         self.save_system = SaveSystem(save_dir)
         self.running = True
         self.demo_mode = False  # Flag to indicate if running in demo mode
 
+        # Rendered location blocks: location key -> (location version, text)
+        self.location_render_cache = {}
+        # (location key, version) last drawn in full, None forces a redraw
+        self.last_rendered = None
+
+        self.content_watcher = None
+        if watch_content:
+            from src.hot_reload import ContentWatcher
+
+            self.content_watcher = ContentWatcher()
+            self.content_watcher.start()
+
     def run(self):
         """Main game loop."""
         self.display_welcome()
@@ -37,6 +72,13 @@ class GameEngine:
             try:
                 self.display_current_location()
                 command = self.get_player_input()
+                self._note_redraw_request(command)
+
+                if self.is_pipeline(command):
+                    self.run_pipeline(command)
+                    if not self.running:
+                        break
+                    continue
 
                 if command.lower() in ["quit", "exit", "q"]:
                     self.quit_game()
@@ -52,14 +94,14 @@ class GameEngine:
 
                 self.command_processor.process(command)
 
-                # Check if case is solved
-                if self.game_state.case_solved:
+                # Check if the case is closed: solved, or out of time
+                if self.game_state.case_closed:
                     self.display_case_conclusion()
                     break
 
                 # Check for time events (every few turns advance time)
                 # This happens after player actions
-                self._check_for_events()
+                self._end_turn()
 
             except KeyboardInterrupt:
                 print("\n\nGame interrupted. Goodbye!")
@@ -68,6 +110,136 @@ class GameEngine:
                 print(f"\nAn error occurred: {e}")
                 print("Please try another command.\n")
 
+    @staticmethod
+    def is_pipeline(command_string):
+        """Check whether input holds more than one command.
+
+        Args:
+            command_string: Raw player input
+
+        Returns:
+            bool: True if the input is a ';' or newline separated batch
+        """
+        return PIPELINE_SEPARATOR.search(command_string) is not None
+
+    @staticmethod
+    def split_pipeline(command_string):
+        """Split a command batch into individual commands.
+
+        Args:
+            command_string: Raw player input
+
+        Returns:
+            list: Non-empty command strings in order
+        """
+        return [
+            part.strip()
+            for part in PIPELINE_SEPARATOR.split(command_string)
+            if part.strip()
+        ]
+
+    def run_pipeline(self, command_string):
+        """Run a batch of commands, updating the world once.
+
+        Commands execute in order with their output buffered, and the batch
+        stops at the first failed command, at a command that prompts for
+        input, or when the game ends. Buffered output is written in one
+        flush and events are checked once for the whole batch, but every
+        executed command counts as a turn, as it would typed on its own.
+
+        Args:
+            command_string: Raw player input, e.g. "take all; go corridor"
+
+        Returns:
+            int: Number of commands executed
+        """
+        commands = self.split_pipeline(command_string)
+        buffer = io.StringIO()
+        executed = 0
+
+        for command in commands:
+            if executed:
+                # The last command is counted when the batch ends
+                self.game_state.count_turn()
+            executed += 1
+            if self._needs_input(command):
+                # Prompts must reach the terminal, so flush before running
+                self._flush_output(buffer)
+                self._run_pipeline_command(command)
+                break
+
+            with redirect_stdout(buffer):
+                succeeded = self._run_pipeline_command(command)
+            if not succeeded:
+                break
+
+        skipped = commands[executed:]
+        if skipped and self.running:
+            buffer.write(f"⏭️  Skipped: {'; '.join(skipped)}\n\n")
+
+        if self.running:
+            with redirect_stdout(buffer):
+                self._end_turn()
+
+        self._flush_output(buffer)
+        return executed
+
+    def _needs_input(self, command):
+        """Check whether a pipeline command will prompt the player.
+
+        Args:
+            command: Single command string
+
+        Returns:
+            bool: True if the command reads from stdin
+        """
+        if command.lower() in ["load", "l"]:
+            return True
+        return self.command_processor.needs_input(command)
+
+    def _run_pipeline_command(self, command):
+        """Execute one command from a pipeline.
+
+        Args:
+            command: Single command string
+
+        Returns:
+            bool: True if the pipeline should continue
+        """
+        if command.lower() in ["quit", "exit", "q"]:
+            self.quit_game()
+            return False
+
+        if command.lower() in ["save", "s"]:
+            self.save_game()
+            return True
+
+        if command.lower() in ["load", "l"]:
+            self.load_game()
+            return True
+
+        succeeded = self.command_processor.process(command)
+
+        if self.game_state.case_closed:
+            self.display_case_conclusion()
+            return False
+
+        return succeeded
+
+    @staticmethod
+    def _flush_output(buffer):
+        """Write buffered pipeline output in a single flush.
+
+        Args:
+            buffer: StringIO holding pending output
+        """
+        output = buffer.getvalue()
+        if output:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+        buffer.seek(0)
+        buffer.truncate()
+
     def run_demo(self, commands):
         """Run a scripted demo using a list of command strings.
 
@@ -95,6 +267,7 @@ class GameEngine:
             # Show location and run command
             self.display_current_location()
             print(f"\n> (demo) {cmd}\n")
+            self._note_redraw_request(cmd)
             try:
                 if cmd.lower() in ["quit", "exit", "q"]:
                     self.quit_game()
@@ -111,11 +284,11 @@ class GameEngine:
                 # Update command processor demo mode flag
                 self.command_processor.demo_mode = self.demo_mode
                 self.command_processor.process(cmd)
-                if self.game_state.case_solved:
+                if self.game_state.case_closed:
                     self.display_case_conclusion()
                     break
 
-                self._check_for_events()
+                self._end_turn()
             except Exception as e:
                 print(f"Demo error: {e}")
 
@@ -140,27 +313,92 @@ class GameEngine:
         input("Press Enter to begin...")
         clear_screen()
 
-    def display_current_location(self):
-        """Display information about the current location."""
-        location = LOCATIONS.get(self.player.current_location)
+    def display_current_location(self, force=False):
+        """Display information about the current location.
+
+        The full location block is only drawn when the player has moved or
+        the location's contents changed since it was last drawn; otherwise
+        a one-line prompt is shown.
+
+        Args:
+            force: Draw the full block even if nothing changed
+        """
+        world = self.game_state.world
+        location_key = self.player.current_location
+        location = world.get_location(location_key)
         if not location:
-            print(f"ERROR: Unknown location '{self.player.current_location}'")
+            print(f"ERROR: Unknown location '{location_key}'")
             return
 
-        print_separator()
-        print(f"\n📍 {location.name.upper()}\n")
-        print(location.description)
+        state = (location_key, world.location_version(location_key))
+        if state == self.last_rendered and not force:
+            print(f"\n📍 {location.name}\n")
+            return
 
-        if location.exits:
-            print(f"\n🚪 Exits: {', '.join(location.exits.keys())}")
+        self.last_rendered = state
+        print(self.render_location(location_key), end="")
 
-        if location.npcs:
-            print(f"\n👤 People: {', '.join(location.npcs)}")
+        # The crowd changes every turn, so it is not part of the cached block
+        crowd = world.crowds.get(location_key)
+        if crowd is not None:
+            print(f"{crowd.describe()}\n")
 
-        if location.items:
-            print(f"\n📦 Items: {', '.join(location.items)}")
+    def render_location(self, location_key):
+        """Render the full description block for a location.
 
-        print()
+        Rendered text is cached per authored location and reused until
+        the location's version in the world overlay changes. Generated
+        sector rooms are rendered fresh so the cache stays bounded.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            str: Formatted location block
+        """
+        world = self.game_state.world
+        version = world.location_version(location_key)
+        cached = self.location_render_cache.get(location_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        location = world.get_location(location_key)
+        description = (
+            self.command_processor.content.location_description(location_key)
+            or location.description
+        )
+        parts = [
+            f"\n{'─' * 60}\n\n",
+            f"\n📍 {location.name.upper()}\n\n",
+            textwrap.dedent(description).strip("\n") + "\n",
+        ]
+
+        exits = world.exits_at(location_key)
+        if exits:
+            parts.append(f"\n🚪 Exits: {', '.join(exits.keys())}\n")
+
+        npcs = world.npcs_at(location_key)
+        if npcs:
+            parts.append(f"\n👤 People: {', '.join(npcs)}\n")
+
+        items = world.items_at(location_key)
+        if items:
+            parts.append(f"\n📦 Items: {', '.join(items)}\n")
+
+        parts.append("\n")
+        text = "".join(parts)
+        if not world.is_generated(location_key):
+            self.location_render_cache[location_key] = (version, text)
+        return text
+
+    def _note_redraw_request(self, command):
+        """Force a full location redraw after a 'look' command.
+
+        Args:
+            command: Raw player input
+        """
+        if self.command_processor.parse(command)[0] == "look":
+            self.last_rendered = None
 
     def get_player_input(self):
         """Get and return player input."""
@@ -221,7 +459,11 @@ class GameEngine:
         self.player.inventory = player_data["inventory"]
         self.player.energy = player_data["energy"]
         self.player.investigation_points = player_data["investigation_points"]
-        self.player.met_characters = set(player_data["met_characters"])
+        # Resolving through the aliases upgrades names from older saves
+        self.player.met_characters = {
+            self.command_processor.resolve_npc_name(name)
+            for name in player_data["met_characters"]
+        }
         self.player.clues_found = player_data["clues_found"]
 
     def _restore_game_state(self, game_state_data):
@@ -238,11 +480,63 @@ class GameEngine:
         self.game_state.events_triggered = set(game_state_data["events_triggered"])
         self.game_state.visited_locations = set(game_state_data["visited_locations"])
         self.game_state.npc_states = game_state_data["npc_states"]
+        case = game_state_data.get("case")
+        if case != self.game_state.mystery.case:
+            self.game_state.start_case(case, place_items=False)
+        self.game_state.world.restore(game_state_data.get("world", {}))
+        self.game_state.world.set_time(self.game_state.day, self.game_state.time_period)
+        # Saves from before the minute clock start at their period
+        clock = game_state_data.get(
+            "clock", period_start(self.game_state.day, self.game_state.time_period)
+        )
+        self.game_state.clock = clock
+        self.game_state.turns = game_state_data.get("turns", 0)
+        self.game_state.mystery.time_remaining = max(0, CASE_MINUTES - clock)
+        self.game_state.event_manager.restore(
+            game_state_data.get("events_log", []), clock
+        )
+
+    def _end_turn(self):
+        """Run the world updates that follow each player turn."""
+        self.game_state.count_turn()
+        if self.content_watcher is not None:
+            self._apply_content_update()
+        self.game_state.world.tick_crowds(self.player.current_location)
+        self._check_for_events()
+
+    def _apply_content_update(self):
+        """Swap in content the watcher has finished reloading, if any."""
+        from src.hot_reload import apply_update
+
+        update, rejected = self.content_watcher.take()
+        if rejected:
+            print("\n⚠️  Content reload rejected:")
+            for problem in rejected:
+                print(f"   - {problem}")
+            print()
+        if update is None:
+            return
+
+        started = time.perf_counter()
+        report = apply_update(update, [(self.player, self.game_state)])
+        swap_ms = (time.perf_counter() - started) * 1000
+        if update.changed:
+            print(
+                f"\n🔄 Content reloaded from {', '.join(update.changed)} "
+                f"(compiled in {update.compile_ms:.1f} ms, swapped in {swap_ms:.1f} ms)"
+            )
+        for line in report:
+            print(f"   ⚠️  {line}")
+        if update.restart_needed:
+            print(
+                f"   ℹ️  Restart to apply changes to {', '.join(update.restart_needed)}"
+            )
+        print()
 
     def _check_for_events(self):
         """Check and display any triggered events."""
         events = self.game_state.event_manager.get_triggered_events(
-            self.game_state.day, self.game_state.time_period
+            self.player, self.game_state
         )
 
         for event in events:
@@ -259,21 +553,68 @@ class GameEngine:
             elif event.event_id == "time_pressure":
                 self.player.energy = max(0, self.player.energy - 20)
 
+        self._check_achievements()
+
+    def _check_achievements(self):
+        """Announce achievements the last turn unlocked."""
+        if self.achievements is None:
+            return
+        for achievement in self.achievements.update(self.player, self.game_state):
+            print(
+                f"\n🏆 Achievement unlocked: {achievement.title} - "
+                f"{achievement.description}\n"
+            )
+
     def display_case_conclusion(self):
         """Display the case conclusion and ending."""
+        self.game_state.count_turn()  # The command that closed the case
+        self.game_state.mystery.history.flush()
+        if not self.game_state.case_solved:
+            print(
+                "\n⏰ Time is up. The Spacers are leaving Earth, "
+                "and the case closes.\n"
+            )
+        self._check_achievements()
         ending = self.game_state.endings_manager.check_ending(
             self.player, self.game_state, self.game_state.mystery
         )
 
         if ending:
             print(self.game_state.endings_manager.display_ending(ending, self.player))
+            self._record_run(ending)
         else:
             print("\n❌ Case could not be resolved properly.\n")
 
         self.running = False
 
+    def _record_run(self, ending):
+        """Put a finished game on the leaderboard and show where it placed.
+
+        Args:
+            ending: Ending reached
+        """
+        if self.leaderboard is None:
+            return
+        difficulty = self.game_state.difficulty
+        run_id = self.leaderboard.record(
+            self.player.name,
+            self.game_state.endings_manager.final_score(ending, self.player),
+            ending.ending_id,
+            difficulty,
+            self.game_state.turns,
+            self.game_state.clock,
+        )
+        print(f"\n🏆 TOP DETECTIVES ({difficulty.capitalize()})\n")
+        print(
+            format_runs(
+                self.leaderboard.top(5, difficulty=difficulty), highlight=run_id
+            )
+        )
+        print()
+
     def quit_game(self):
         """Handle game quit."""
+        self.game_state.mystery.history.flush()
         print("\nThank you for playing The Caves of Steel!")
         try:
             name = self.player.name
@@ -2,27 +2,51 @@
 GameState class - Tracks the state of the game world
 """
 
+from datetime import datetime
+from pathlib import Path
+
 from src.mystery_plot import MysteryPlot
 from src.relationships import RelationshipManager
 from src.events import EventManager
 from src.endings import EndingsManager
 from src.puzzles import PuzzleManager
 from src.dialogue_system import DialogueManager
+from src.schedules import DAY_START, TIME_PERIODS, clock_period, period_start
+from src.utils import CopyOnWrite, Versioned, format_clock
+from src.world import WorldState
+
+
+class GameState(Versioned, CopyOnWrite):
+    """Manages the overall state of the game world.
 
+    ``fork()`` gives a what-if copy of the session. Endings and dialogue
+    trees never change during play and are shared outright.
+    """
 
-class GameState:
-    """Manages the overall state of the game world."""
+    COW_FIELDS = ("events_triggered", "npc_states", "visited_locations")
+    FORK_FIELDS = (
+        "mystery",
+        "relationships",
+        "event_manager",
+        "puzzle_manager",
+        "world",
+    )
 
-    def __init__(self, difficulty="normal"):
+    def __init__(self, difficulty="normal", case=None):
         """Initialize game state.
 
         Args:
             difficulty: Game difficulty (easy, normal, hard)
+            case: Generated case from src.case_generator, or None for the
+                authored case
         """
         self.difficulty = difficulty
+        self.clock = 0  # Minutes since 06:00 on day 1
+        self.turns = 0
         self.time_period = "morning"  # morning, afternoon, evening, night
         self.day = 1
         self.case_solved = False
+        self.case_generation = 0  # Bumped whenever a case replaces the last
         self.partner_assigned = False
         self.partner_name = "R. Daneel Olivaw"
 
@@ -38,6 +62,76 @@ class GameState:
         self.endings_manager = EndingsManager()
         self.puzzle_manager = PuzzleManager()
         self.dialogue_manager = DialogueManager()
+        self.world = WorldState()
+        self.hint_planner = None  # Built on the first partner hint
+        self.history_dir = None  # Where each case's full history is kept
+        if case is not None:
+            self.start_case(case)
+
+    def start_case(self, case, place_items=True):
+        """Switch to a different case.
+
+        Args:
+            case: Generated case, or None for the authored case
+            place_items: Whether to put the case's items into the world
+                (not needed when the world is restored from a save)
+        """
+        self.mystery.history.flush()
+        self.mystery = MysteryPlot(case)
+        self.event_manager = EventManager()
+        self.hint_planner = None
+        self.case_generation += 1
+        self._spill_history()
+        if case is None:
+            return
+        for event in case["events"]:
+            self.event_manager.add_event(
+                event["id"], event["description"], event["period"], event["day"]
+            )
+        if place_items:
+            for lead in case["evidence"]:
+                if lead["item"]:
+                    self.world.add_item(lead["location"], lead["item"])
+
+    def keep_history(self, directory):
+        """Keep the full investigation history of each case on disk.
+
+        Entries that fall out of memory are appended to a file per case.
+
+        Args:
+            directory: Folder for the history files
+        """
+        self.history_dir = Path(directory)
+        self._spill_history()
+
+    def _spill_history(self):
+        """Point the current case's history at a new file, if histories are kept."""
+        if self.history_dir is None:
+            return
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        name = f"history_{stamp}_{self.case_generation}.jsonl"
+        self.mystery.history.spill_path = self.history_dir / name
+
+    @property
+    def case_closed(self):
+        """Whether the case is over: solved, or out of time.
+
+        Returns:
+            bool: True once the killer is named or the deadline passes
+        """
+        return self.case_solved or self.mystery.time_remaining == 0
+
+    def fork(self):
+        """Make a copy-on-write fork of the session state.
+
+        Returns:
+            GameState: Fork; its hint planner is built afresh when needed,
+                and its history is kept in memory only
+        """
+        clone = super().fork()
+        clone.hint_planner = None
+        clone.history_dir = None
+        return clone
 
     def trigger_event(self, event_name):
         """Trigger a game event.
@@ -45,7 +139,8 @@ class GameState:
         Args:
             event_name: Name of the event to trigger
         """
-        self.events_triggered.add(event_name)
+        self.own("events_triggered").add(event_name)
+        self.touch()
 
     def is_event_triggered(self, event_name):
         """Check if an event has been triggered.
@@ -66,9 +161,24 @@ class GameState:
             state_key: State key
             value: State value
         """
-        if npc_name not in self.npc_states:
-            self.npc_states[npc_name] = {}
-        self.npc_states[npc_name][state_key] = value
+        states = self.own("npc_states")
+        # A new dict per change, so forks can share the old one
+        states[npc_name] = {**states.get(npc_name, {}), state_key: value}
+        self.touch()
+
+    def visit_location(self, location_key):
+        """Record a visit to a location.
+
+        Args:
+            location_key: Location key
+        """
+        self.world.enter(location_key)
+        if self.world.is_generated(location_key):
+            # Generated rooms are unbounded; only authored ones are recorded
+            return
+        if location_key not in self.visited_locations:
+            self.own("visited_locations").add(location_key)
+            self.touch()
 
     def get_npc_state(self, npc_name, state_key, default=None):
         """Get state for an NPC.
@@ -85,16 +195,51 @@ class GameState:
             return default
         return self.npc_states[npc_name].get(state_key, default)
 
+    def count_turn(self):
+        """Count a player turn.
+
+        The count goes straight into __dict__: no render depends on it, so
+        it should not invalidate cached output.
+        """
+        self.__dict__["turns"] += 1
+
+    def advance_clock(self, minutes, record=False):
+        """Let game time pass.
+
+        The day and time period follow the clock, and the same minutes
+        come off the case deadline.
+
+        Args:
+            minutes: Minutes that pass
+            record: Whether to note the time in the investigation history
+        """
+        if minutes <= 0:
+            return
+        self.clock += minutes
+        day, period = clock_period(self.clock)
+        if day != self.day or period != self.time_period:
+            self.day = day
+            self.time_period = period
+            self.world.set_time(day, period)
+        self.mystery.advance_time(minutes, record)
+
     def advance_time(self):
-        """Advance time in the game."""
-        periods = ["morning", "afternoon", "evening", "night"]
-        current_index = periods.index(self.time_period)
+        """Advance time to the start of the next time period."""
+        current_index = TIME_PERIODS.index(self.time_period)
 
         if current_index == 3:  # night -> morning of next day
-            self.day += 1
-            self.time_period = "morning"
+            start = period_start(self.day + 1, "morning")
         else:
-            self.time_period = periods[current_index + 1]
+            start = period_start(self.day, TIME_PERIODS[current_index + 1])
+        self.advance_clock(start - self.clock, record=True)
+
+    def clock_time(self):
+        """Get the time of day on the game clock.
+
+        Returns:
+            str: Time such as "14:45"
+        """
+        return format_clock(DAY_START + self.clock)
 
     def get_summary(self):
         """Get a summary of the current game state.
@@ -104,7 +249,7 @@ class GameState:
         """
         summary = f"""
         ┌─ GAME STATE ───────────────────────────┐
-        │ Day: {self.day} ({self.time_period.capitalize()})
+        │ Day: {self.day} ({self.time_period.capitalize()}, {self.clock_time()})
         │ Case Solved: {'Yes' if self.case_solved else 'No'}
         │ Partner Assigned: {'Yes' if self.partner_assigned else 'No'}
         │ Events Triggered: {len(self.events_triggered)}
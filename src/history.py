@@ -0,0 +1,190 @@
+"""
+Investigation History - Bounded log of what the detective has done
+
+Entries are compact records (kind, subject, case minute, value); text is
+only written when an entry is shown. Recent entries live in a fixed-size
+ring, and each suspect or piece of evidence keeps its own bounded list
+so a busy clock cannot push them out of reach. Entries that fall off the
+ring can be spilled to an append-only file holding the full history.
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+
+from src.utils import CopyOnWrite
+
+# Entries kept in memory, overall and per subject
+RECENT_ENTRIES = 64
+# Spilled entries written to disk in one go
+SPILL_BATCH = 32
+
+# Kinds of history entry
+TIME_ADVANCED = "time"  # value: minutes advanced
+TIME_EXPIRED = "expired"
+QUESTIONED = "questioned"
+ALIBI_VERIFIED = "alibi"
+EVIDENCE_FOUND = "evidence"
+BLOCKED = "blocked"  # value: the kind of action a lock prevented
+BRANCH = "branch"  # subject: the choice made
+
+
+class HistoryEntry:
+    """One thing that happened in the investigation."""
+
+    __slots__ = ("at", "kind", "seq", "subject", "value")
+
+    def __init__(self, seq, kind, subject, at, value=None):
+        """Initialize an entry.
+
+        Args:
+            seq: Position in the whole history, from 0
+            kind: One of the kinds above
+            subject: Suspect, evidence or choice the entry is about, or None
+            at: Case minute it happened at
+            value: Extra detail for the kind
+        """
+        self.seq = seq
+        self.kind = kind
+        self.subject = subject
+        self.at = at
+        self.value = value
+
+    def to_list(self):
+        """Pack the entry for the spill file.
+
+        Returns:
+            list: [seq, kind, subject, at, value]
+        """
+        return [self.seq, self.kind, self.subject, self.at, self.value]
+
+
+class HistoryLog(CopyOnWrite):
+    """Bounded, indexed investigation history.
+
+    Entries never change, so forks share them and only copy the ring and
+    the per-subject lists they add to.
+    """
+
+    COW_FIELDS = ("recent_entries", "by_subject", "_spilled")
+    COW_ITEMS = ("by_subject",)
+
+    def __init__(self, capacity=RECENT_ENTRIES, spill_path=None):
+        """Initialize an empty log.
+
+        Args:
+            capacity: Entries kept in memory, overall and per subject
+            spill_path: File to append entries that fall off the ring, or
+                None to let them go
+        """
+        self.capacity = capacity
+        self.recent_entries = deque(maxlen=capacity)
+        self.by_subject = {}
+        self.total = 0
+        self.spill_path = Path(spill_path) if spill_path else None
+        self._spilled = []
+
+    def __len__(self):
+        """Number of entries ever added."""
+        return self.total
+
+    def add(self, kind, subject, at, value=None, related=()):
+        """Add an entry.
+
+        Args:
+            kind: Kind of entry
+            subject: Suspect, evidence or choice, or None
+            at: Case minute
+            value: Extra detail
+            related: Other subjects to index the entry under
+
+        Returns:
+            HistoryEntry: The new entry
+        """
+        entry = HistoryEntry(self.total, kind, subject, at, value)
+        self.total += 1
+        recent_entries = self.own("recent_entries")
+        if len(recent_entries) == self.capacity and self.spill_path:
+            spilled = self.own("_spilled")
+            spilled.append(recent_entries[0])
+            if len(spilled) >= SPILL_BATCH:
+                self.flush()
+        recent_entries.append(entry)
+        for key in (subject, *related) if subject is not None else related:
+            if key in self.by_subject:
+                self.own_item("by_subject", key).append(entry)
+            else:
+                self.own("by_subject")[key] = deque([entry], maxlen=self.capacity)
+        return entry
+
+    def fork(self):
+        """Make a copy-on-write fork.
+
+        The fork keeps its history in memory only, so two forks never
+        append to the same spill file.
+
+        Returns:
+            HistoryLog: Fork
+        """
+        clone = super().fork()
+        clone.spill_path = None
+        clone._spilled = []
+        return clone
+
+    def recent(self, count):
+        """Get the latest entries.
+
+        Args:
+            count: How many
+
+        Returns:
+            list: Entries, oldest first
+        """
+        start = max(0, len(self.recent_entries) - count)
+        return [self.recent_entries[i] for i in range(start, len(self.recent_entries))]
+
+    def about(self, subject, kind=None):
+        """Get the latest entries about a suspect or piece of evidence.
+
+        A suspect's entries include the evidence found against them.
+
+        Args:
+            subject: Suspect name or evidence key
+            kind: Only entries of this kind
+
+        Returns:
+            list: Entries, oldest first
+        """
+        entries = self.by_subject.get(subject, ())
+        return [entry for entry in entries if kind is None or entry.kind == kind]
+
+    def flush(self):
+        """Append spilled entries to the spill file."""
+        if not self._spilled or not self.spill_path:
+            return
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spill_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(entry.to_list()) + "\n" for entry in self._spilled)
+        self._spilled = []
+
+    def all_entries(self, subject=None):
+        """Read the whole history, from the spill file and memory.
+
+        Without a spill file only the entries still in memory are known.
+
+        Args:
+            subject: Only entries with this subject
+
+        Yields:
+            HistoryEntry: Entries, oldest first
+        """
+        self.flush()
+        if self.spill_path and self.spill_path.exists():
+            with open(self.spill_path, encoding="utf-8") as f:
+                for line in f:
+                    entry = HistoryEntry(*json.loads(line))
+                    if subject is None or entry.subject == subject:
+                        yield entry
+        for entry in self.recent_entries:
+            if subject is None or entry.subject == subject:
+                yield entry
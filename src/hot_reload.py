@@ -0,0 +1,244 @@
+"""
+Hot Reload - Apply edited content to live sessions without restarting
+
+A background thread watches the content modules. When one changes it
+re-reads only that module's tables, validates the whole content and
+compiles a new bundle, all off the game loop. The game loop then picks
+the finished update up between commands and swaps it in.
+"""
+
+import os
+import threading
+import time
+
+from src.content import (
+    LITERAL_TABLES,
+    SOURCE_DIR,
+    SOURCE_MODULES,
+    START_LOCATION,
+    WorldBundle,
+    collect_sources,
+    compile_content,
+    get_content,
+    set_content,
+    source_fingerprint,
+    validate,
+)
+from src.locations import LOCATIONS, Location
+from src.schedules import NPC_SCHEDULES
+from src.transit import reset_city_network
+
+POLL_SECONDS = 1.0
+
+
+class ContentUpdate:
+    """A validated content bundle waiting to be swapped in."""
+
+    def __init__(self, content, sources, changed, restart_needed, compile_ms):
+        """Initialize an update.
+
+        Args:
+            content: New WorldBundle
+            sources: Sources it was compiled from
+            changed: Modules that were re-read
+            restart_needed: Changed modules that cannot be applied live
+            compile_ms: Time spent reading, validating and compiling
+        """
+        self.content = content
+        self.sources = sources
+        self.changed = changed
+        self.restart_needed = restart_needed
+        self.compile_ms = compile_ms
+
+
+class ContentWatcher:
+    """Watches the content modules and prepares updates in the background.
+
+    Only the literal tables (locations, aliases and text in content_tables.py,
+    schedules) are re-read live. Content built by code (relationships,
+    dialogue trees, mystery, events, endings) lives in per-session objects,
+    so changes there are reported as needing a restart.
+    """
+
+    def __init__(self, poll_seconds=POLL_SECONDS):
+        """Initialize the watcher.
+
+        Args:
+            poll_seconds: Interval between checks of the module files
+        """
+        self.poll_seconds = poll_seconds
+        self.sources = None
+        self.mtimes = self._stat()
+        self.rejected = []  # Problems of the last update that failed validation
+        self._ready = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start watching on a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._watch, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the watcher thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self):
+        """Poll the module files until stopped."""
+        while not self._stop.wait(self.poll_seconds):
+            self.check()
+
+    def _stat(self):
+        """Get the modification time of every content module.
+
+        Returns:
+            dict: Module filename to mtime in nanoseconds
+        """
+        mtimes = {}
+        for name in SOURCE_MODULES:
+            try:
+                mtimes[name] = os.stat(SOURCE_DIR / name).st_mtime_ns
+            except OSError:
+                mtimes[name] = None
+        return mtimes
+
+    def check(self):
+        """Look for changed modules once and prepare an update.
+
+        Returns:
+            bool: True if a new update is ready
+        """
+        mtimes = self._stat()
+        changed = [name for name in SOURCE_MODULES if mtimes[name] != self.mtimes[name]]
+        if not changed:
+            return False
+        self.mtimes = mtimes
+
+        started = time.perf_counter()
+        if self.sources is None:
+            self.sources = collect_sources()
+        live = [name for name in changed if name in LITERAL_TABLES]
+        restart_needed = [name for name in changed if name not in LITERAL_TABLES]
+        try:
+            sources = collect_sources(live, previous=self.sources)
+        except (OSError, SyntaxError, ValueError) as error:
+            with self._lock:
+                self.rejected = [f"cannot read {', '.join(live)}: {error}"]
+            return False
+        problems = validate(sources)
+        if problems:
+            with self._lock:
+                self.rejected = problems
+            return False
+
+        bundle, strings = compile_content(sources, source_fingerprint())
+        update = ContentUpdate(
+            WorldBundle(bundle, strings),
+            sources,
+            live,
+            restart_needed,
+            (time.perf_counter() - started) * 1000,
+        )
+        self.sources = sources
+        with self._lock:
+            self._ready = update
+            self.rejected = []
+        return True
+
+    def take(self):
+        """Collect the prepared update and any rejection.
+
+        Returns:
+            tuple: (ContentUpdate or None, list of rejection problems)
+        """
+        with self._lock:
+            update, self._ready = self._ready, None
+            rejected, self.rejected = self.rejected, []
+        return update, rejected
+
+
+def apply_update(update, sessions):
+    """Swap in a content update and remap live sessions.
+
+    Everything here is a reference swap or a small rebuild; the expensive
+    work already happened on the watcher thread.
+
+    Args:
+        update: ContentUpdate from ContentWatcher.take
+        sessions: List of (player, game_state) pairs to keep running
+
+    Returns:
+        list: Report lines describing what was remapped or lost
+    """
+    from src.commands import CommandProcessor
+
+    old = get_content()
+    new = update.content
+    set_content(new)
+    CommandProcessor.use_content(new)
+    CommandProcessor.parser.clear_cache()
+
+    removed = [key for key in LOCATIONS if key not in new.locations]
+    if "locations.py" in update.changed:
+        for key in removed:
+            del LOCATIONS[key]
+        for key, fields in update.sources["locations"].items():
+            LOCATIONS[key] = Location(**fields)
+        reset_city_network()
+    if "npc_schedules.py" in update.changed:
+        NPC_SCHEDULES.clear()
+        NPC_SCHEDULES.update(update.sources["schedules"])
+
+    report = []
+    for player, game_state in sessions:
+        report += _remap_session(player, game_state, old, new, removed)
+    return report
+
+
+def _remap_session(player, game_state, old, new, removed):
+    """Point one session's references at the new content.
+
+    Args:
+        player: Player
+        game_state: GameState
+        old: WorldBundle before the reload
+        new: WorldBundle after the reload
+        removed: Location keys that no longer exist
+
+    Returns:
+        list: Report lines
+    """
+    report = []
+    world = game_state.world
+    for key in world.reload_content(removed):
+        report.append(f"Items left at removed location '{key}' are gone")
+
+    location_key = player.current_location
+    if location_key in removed:
+        # A location that was renamed keeps its display name
+        name = old.locations[location_key]["name"]
+        target = new.data["location_names"].get(name.lower(), START_LOCATION)
+        player.current_location = target
+        report.append(
+            f"You were at removed location '{location_key}'; moved to '{target}'"
+        )
+
+    for item in player.inventory:
+        if item not in new.items:
+            report.append(f"'{item}' in your inventory is no longer defined")
+
+    met = set()
+    for npc in player.met_characters:
+        resolved = new.resolve_npc(npc)
+        if resolved is None:
+            report.append(f"'{npc}' is no longer a known character")
+            resolved = npc
+        met.add(resolved)
+    if met != player.met_characters:
+        player.met_characters = met
+    return report
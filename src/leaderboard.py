@@ -0,0 +1,194 @@
+"""
+Leaderboard - Finished games and unlocked achievements, kept on disk
+
+Runs live in a SQLite table indexed by score within each difficulty and
+within each ending, so a top-k query reads only the k rows it returns
+however many games have been recorded. From the command line:
+    python -m src.leaderboard [--difficulty LEVEL] [--ending ENDING] [--top K]
+"""
+
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from src.save_system import SaveSystem
+
+DB_PATH = SaveSystem.DEFAULT_SAVE_DIR.parent / "leaderboard.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    ending TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    turns INTEGER NOT NULL,
+    minutes INTEGER NOT NULL,
+    finished TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC, turns);
+CREATE INDEX IF NOT EXISTS runs_by_difficulty ON runs (difficulty, score DESC, turns);
+CREATE INDEX IF NOT EXISTS runs_by_ending ON runs (ending, score DESC, turns);
+CREATE TABLE IF NOT EXISTS achievements (
+    achievement TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    unlocked TEXT NOT NULL
+);
+"""
+
+# Columns of a run, in the order queries return them
+RUN_COLUMNS = (
+    "id",
+    "name",
+    "score",
+    "ending",
+    "difficulty",
+    "turns",
+    "minutes",
+    "finished",
+)
+
+
+class Leaderboard:
+    """Local record of finished games and achievements."""
+
+    def __init__(self, path=DB_PATH):
+        """Open the leaderboard, creating it if needed.
+
+        Args:
+            path: Database file (str or Path), or ":memory:"
+        """
+        if path != ":memory:":
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(path))
+        self.connection.executescript(SCHEMA)
+
+    def record(self, name, score, ending, difficulty, turns, minutes):
+        """Record a finished game.
+
+        Args:
+            name: Detective name
+            score: Final score
+            ending: Ending ID
+            difficulty: Difficulty level
+            turns: Turns played
+            minutes: Game minutes the investigation took
+
+        Returns:
+            int: ID of the run
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs "
+                "(name, score, ending, difficulty, turns, minutes, finished) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    name,
+                    score,
+                    ending,
+                    difficulty,
+                    turns,
+                    minutes,
+                    datetime.now().isoformat(timespec="seconds"),
+                ),
+            )
+        return cursor.lastrowid
+
+    def top(self, limit=10, difficulty=None, ending=None):
+        """Get the best runs, fewest turns first among equal scores.
+
+        Args:
+            limit: Most runs to return
+            difficulty: Only runs at this difficulty
+            ending: Only runs that reached this ending
+
+        Returns:
+            list: Runs as tuples in RUN_COLUMNS order
+        """
+        query = f"SELECT {', '.join(RUN_COLUMNS)} FROM runs"
+        params = []
+        # One filter at a time can follow its index in score order
+        if difficulty is not None:
+            query += " INDEXED BY runs_by_difficulty WHERE difficulty = ?"
+            params.append(difficulty)
+            if ending is not None:
+                query += " AND ending = ?"
+                params.append(ending)
+        elif ending is not None:
+            query += " INDEXED BY runs_by_ending WHERE ending = ?"
+            params.append(ending)
+        query += " ORDER BY score DESC, turns LIMIT ?"
+        params.append(limit)
+        return self.connection.execute(query, params).fetchall()
+
+    def unlock(self, achievement, name):
+        """Record an achievement as unlocked.
+
+        Args:
+            achievement: Achievement ID
+            name: Detective who unlocked it
+
+        Returns:
+            bool: True if it was not unlocked before
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO achievements (achievement, name, unlocked) "
+                "VALUES (?, ?, ?)",
+                (achievement, name, datetime.now().isoformat(timespec="seconds")),
+            )
+        return cursor.rowcount == 1
+
+    def unlocked(self):
+        """Get the achievements unlocked so far.
+
+        Returns:
+            set: Achievement IDs
+        """
+        return {
+            row[0]
+            for row in self.connection.execute("SELECT achievement FROM achievements")
+        }
+
+    def close(self):
+        """Close the database."""
+        self.connection.close()
+
+
+def format_runs(runs, highlight=None):
+    """Lay out runs as a ranked table.
+
+    Args:
+        runs: Runs in RUN_COLUMNS order
+        highlight: Run ID to mark, or None
+
+    Returns:
+        str: One line per run
+    """
+    lines = []
+    for rank, run in enumerate(runs, 1):
+        run_id, name, score, ending, difficulty, turns, minutes, _ = run
+        marker = "▶" if run_id == highlight else " "
+        lines.append(
+            f" {marker}{rank:>3}. {name:<20} {score:>5} pts  {ending:<20} "
+            f"{difficulty:<7} {turns:>4} turns  {minutes // 60}h{minutes % 60:02d}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    options = {}
+    for flag in ("--difficulty", "--ending", "--top"):
+        if flag in sys.argv:
+            options[flag] = sys.argv[sys.argv.index(flag) + 1]
+    board = Leaderboard()
+    runs = board.top(
+        int(options.get("--top", 10)),
+        options.get("--difficulty"),
+        options.get("--ending"),
+    )
+    print("\n🏆 LEADERBOARD\n")
+    print(format_runs(runs) if runs else "   No finished games yet.")
+    print()
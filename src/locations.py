@@ -35,7 +35,7 @@ LOCATIONS = {
         a constant background presence.
         """,
         exits={"corridor": "corridor_residential"},
-        npcs=["R. Daneel Olivaw", "Jessie Bailey", "Ben Bailey"],
+        npcs=["R. Daneel Olivaw", "Jessie Baley", "Ben Baley"],
         items=["notebook", "communication_device"],
     ),
     "corridor_residential": Location(
@@ -51,6 +51,7 @@ LOCATIONS = {
             "quarters": "bedroom",
             "plaza": "central_plaza",
             "administrative": "administrative_section",
+            "crime_scene": "crime_scene",
         },
         npcs=["Neighbor"],
         items=[],
@@ -69,6 +70,7 @@ LOCATIONS = {
             "administrative": "administrative_section",
             "police": "police_headquarters",
             "food_dispensary": "food_dispensary",
+            "spacetown": "spacetown",
         },
         npcs=["City Official", "Street Vendor"],
         items=[],
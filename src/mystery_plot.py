@@ -2,11 +2,37 @@
 Mystery Plot System - Complete murder mystery with suspects and motives
 """
 
+from src.deduction import DeductionEngine
+from src.history import (
+    ALIBI_VERIFIED,
+    BLOCKED,
+    BRANCH,
+    EVIDENCE_FOUND,
+    QUESTIONED,
+    TIME_ADVANCED,
+    TIME_EXPIRED,
+    HistoryLog,
+)
+from src.schedules import DAY_MINUTES
+from src.timeline import CLAIM, EVENT, SIGHTING, Timeline
+from src.utils import CopyOnWrite, Versioned, clock_minutes
+
+# Minutes until the Spacers leave Earth: the Commissioner's deadline, the
+# morning after day 3 on the game clock
+CASE_MINUTES = 3 * DAY_MINUTES
+
+BRANCH_DESCRIPTIONS = {
+    "trust_spacers": "Branch: Trusted Spacers. Clousarr and spacer_conspiracy locked.",
+    "pursue_medievalists": (
+        "Branch: Pursued Medievalists. Fastolfe and r_sammy_transport locked."
+    ),
+}
+
 
 class Suspect:
     """Represents a murder suspect."""
 
-    def __init__(self, name, motive, alibi, guilty=False):
+    def __init__(self, name, motive, alibi, guilty=False, alibi_claim=None):
         """Initialize a suspect.
 
         Args:
@@ -14,11 +40,14 @@ class Suspect:
             motive: Why they might have done it
             alibi: Their alibi (can be false)
             guilty: Whether they're actually guilty
+            alibi_claim: (location, "HH:MM", "HH:MM") the alibi places them
+                at, or None if it names no place
         """
         self.name = name
         self.motive = motive
         self.alibi = alibi
         self.guilty = guilty
+        self.alibi_claim = alibi_claim
         self.questioned = False
         self.alibis_verified = False
 
@@ -50,6 +79,10 @@ class VictimProfile:
         self.occupation = "Robotics Specialist (Spacer)"
         self.last_seen = "Spacetown at 14:30"
         self.time_of_death = "between 14:45 and 16:00"
+        self.death_window = (clock_minutes("14:45"), clock_minutes("16:00"))
+        self.last_seen_at = ("spacetown", "14:30")
+        # Being seen here during the death window is no alibi
+        self.scene = ("crime_scene", "spacetown")
         self.cause_of_death = "Blaster wound"
         self.motive_info = "Victim of a conspiracy involving Earth and Spacer factions"
         self.significance = (
@@ -58,11 +91,27 @@ class VictimProfile:
         )
 
 
-class MysteryPlot:
+class MysteryPlot(Versioned, CopyOnWrite):
     """Manages the complete murder mystery."""
 
-    def __init__(self):
-        """Initialize the mystery plot."""
+    # The case's tables, victim and timeline never change once built
+    COW_FIELDS = (
+        "suspects",
+        "key_evidence",
+        "evidence_against_count",
+        "locked_suspects",
+        "locked_evidence",
+    )
+    COW_ITEMS = ("suspects",)
+    FORK_FIELDS = ("history", "deduction")
+
+    def __init__(self, case=None):
+        """Initialize the mystery plot.
+
+        Args:
+            case: Generated case from src.case_generator, or None for the
+                authored case
+        """
         self.victim = VictimProfile()
         self.suspects = self._create_suspects()
         self.factions = self._create_factions()
@@ -88,19 +137,227 @@ class MysteryPlot:
             "spacer_conspiracy": ["Han Fastolfe"],
             "broken_glasses_found": ["Julius Enderby"],
         }
-        self.time_remaining = 1440  # Minutes until Spacers leave Earth (24 hours, canon-accurate)
+        # Evidence that rules suspects out as the killer
+        self.evidence_clears = {
+            "r_sammy_transport": ["R. Sammy"],  # First Law: carrier, not killer
+            # Robots wear no glasses
+            "broken_glasses_found": ["R. Daneel Olivaw", "R. Sammy"],
+        }
+        # Investigate topic -> (evidence, item it needs, evidence it needs first)
+        self.topics = {
+            "eyeglasses": ("broken_glasses_found", "eyeglass_evidence", None),
+            "enderby": ("enderby_medievalist", None, None),
+            "sammy": ("r_sammy_transport", None, None),
+            "spacer_conspiracy": ("spacer_conspiracy", None, None),
+        }
+        # Witnessed or logged whereabouts: (person, location, from, to, source)
+        self.sightings = [
+            (
+                "Records Clerk",
+                "records_office",
+                "14:00",
+                "17:00",
+                "Records Office access log",
+            ),
+            (
+                "Administrator",
+                "administrative_section",
+                "13:30",
+                "15:30",
+                "Budget meeting minutes",
+            ),
+            (
+                "R. Daneel Olivaw",
+                "police_headquarters",
+                "14:45",
+                "16:00",
+                "Elijah Baley",
+            ),
+            ("Julius Enderby", "commissioner_office", "12:00", "14:20", "Desk Officer"),
+            ("Julius Enderby", "commissioner_office", "15:40", "18:00", "Desk Officer"),
+            ("R. Sammy", "central_plaza", "14:05", "14:25", "Street Vendor"),
+            ("Han Fastolfe", "spacetown", "14:00", "17:00", "Spacer staff"),
+        ]
+        self.time_remaining = CASE_MINUTES
         self.case_breakthrough = False
-        self.history = []  # Investigation action log
+        self.accused = None  # Suspect the last accusation named
+        self.history = HistoryLog()  # Investigation action log
         self.locked_suspects = set()  # Suspects locked by choices
         self.locked_evidence = set()  # Evidence locked by choices
+        self.case = case
+        self.leads = {}  # Investigate topic -> lead of a generated case
+        self.item_examinations = {}  # Examine text for items a generated case places
+        if case is not None:
+            self._apply_case(case)
+
+        # Found evidence as a bitset with its popcount kept alongside, plus a
+        # reverse index from each suspect to the evidence bits naming them
+        self.evidence_bits = {name: 1 << i for i, name in enumerate(self.key_evidence)}
+        self.evidence_mask = 0
+        self.evidence_count = 0
+        self.suspect_evidence = {}
+        for evidence_name, suspects in self.evidence_links.items():
+            for suspect_name in suspects:
+                self.suspect_evidence[suspect_name] = (
+                    self.suspect_evidence.get(suspect_name, 0)
+                    | self.evidence_bits[evidence_name]
+                )
+        self.evidence_against_count = dict.fromkeys(self.suspect_evidence, 0)
+        self.questioned_count = 0
+        self.verified_count = 0
+        self.timeline = self._create_timeline()
+        self.deduction = self._create_deduction()
+
+    def _log(self, kind, subject=None, value=None, related=()):
+        """Add an entry to the investigation history.
+
+        Args:
+            kind: Kind of entry (see src.history)
+            subject: Suspect, evidence or choice it is about
+            value: Extra detail for the kind
+            related: Suspects the entry also concerns
+        """
+        self.history.add(
+            kind, subject, CASE_MINUTES - self.time_remaining, value, related
+        )
+        self.touch()
+
+    def describe(self, entry):
+        """Put a history entry into words.
 
-    def advance_time(self, minutes):
-        """Advance time and check for expiration."""
+        Args:
+            entry: HistoryEntry
+
+        Returns:
+            str: History text
+        """
+        kind, subject = entry.kind, entry.subject
+        if kind == TIME_ADVANCED:
+            remaining = CASE_MINUTES - entry.at
+            return f"Time advanced by {entry.value} min. Remaining: {remaining} min."
+        if kind == TIME_EXPIRED:
+            return "Time expired! Investigation forced to end."
+        if kind == QUESTIONED:
+            return f"Questioned {subject}."
+        if kind == ALIBI_VERIFIED:
+            return f"Alibi verified for {subject}."
+        if kind == EVIDENCE_FOUND:
+            linked = self.evidence_links.get(subject, [])
+            implicated = ", ".join(linked) if linked else "unknown"
+            return f"Found evidence: {subject} (implicates: {implicated})"
+        if kind == BLOCKED:
+            what = "evidence" if entry.value == EVIDENCE_FOUND else "suspect"
+            action = {
+                ALIBI_VERIFIED: "verify alibi for",
+                QUESTIONED: "question",
+                EVIDENCE_FOUND: "record evidence",
+            }[entry.value]
+            return f"Cannot {action} {subject}: {what} is locked."
+        return BRANCH_DESCRIPTIONS.get(subject, f"Branch: {subject}.")
+
+    def advance_time(self, minutes, record=True):
+        """Advance time and check for expiration.
+
+        Args:
+            minutes: Minutes that passed
+            record: Whether to note the time in the history; the small
+                cost of each command is not
+        """
+        if self.time_remaining == 0:
+            return
         self.time_remaining = max(0, self.time_remaining - minutes)
-        self.history.append(f"Time advanced by {minutes} min. Remaining: {self.time_remaining} min.")
+        if record:
+            self._log(TIME_ADVANCED, value=minutes)
         if self.time_remaining == 0:
-            self.history.append("Time expired! Investigation forced to end.")
-            # Could trigger a forced ending here
+            self._log(TIME_EXPIRED)
+
+    def _create_deduction(self):
+        """Create the deduction engine for the suspects and evidence.
+
+        Returns:
+            DeductionEngine: Engine with every suspect still a candidate
+        """
+        engine = DeductionEngine(self.victim.death_window)
+        for name in self.suspects:
+            engine.add_suspect(name)
+        for evidence_name, implicated in self.evidence_links.items():
+            engine.add_evidence(
+                evidence_name, implicated, self.evidence_clears.get(evidence_name, ())
+            )
+        return engine
+
+    def _apply_case(self, case):
+        """Replace the authored case with a generated one.
+
+        The victim and the cast stay; who did it, why, the alibis, the
+        sightings and the evidence come from the case.
+
+        Args:
+            case: Case dict from src.case_generator
+        """
+        self.actual_killer = case["killer"]
+        self.murder_motive = case["murder_motive"]
+        for name, suspect in self.suspects.items():
+            details = case["suspects"][name]
+            suspect.motive = details["motive"]
+            suspect.alibi = details["alibi"]
+            suspect.alibi_claim = tuple(details["claim"]) if details["claim"] else None
+            suspect.guilty = name == self.actual_killer
+        self.sightings = [tuple(sighting) for sighting in case["sightings"]]
+
+        self.key_evidence = {}
+        self.evidence_links = {}
+        self.evidence_clears = {}
+        self.topics = {}
+        for lead in case["evidence"]:
+            self.key_evidence[lead["id"]] = False
+            self.evidence_links[lead["id"]] = list(lead["implicates"])
+            if lead["clears"]:
+                self.evidence_clears[lead["id"]] = list(lead["clears"])
+            self.leads[lead["topic"]] = lead
+            self.topics[lead["topic"]] = (lead["id"], lead["item"], lead["requires"])
+            if lead["item"]:
+                self.item_examinations[lead["item"]] = lead["examine"]
+
+    def _create_timeline(self):
+        """Create the timeline of the murder day.
+
+        Returns:
+            Timeline: Claims, sightings and the murder itself
+        """
+        timeline = Timeline()
+        for suspect in self.suspects.values():
+            if suspect.alibi_claim:
+                location, start, end = suspect.alibi_claim
+                timeline.add(
+                    clock_minutes(start),
+                    clock_minutes(end),
+                    CLAIM,
+                    suspect.name,
+                    location,
+                )
+        for name, location, start, end, source in self.sightings:
+            timeline.add(
+                clock_minutes(start),
+                clock_minutes(end),
+                SIGHTING,
+                name,
+                location,
+                source,
+            )
+
+        location, seen = self.victim.last_seen_at
+        timeline.add(
+            clock_minutes(seen),
+            clock_minutes(seen),
+            SIGHTING,
+            self.victim.name,
+            location,
+            "Spacetown gate log",
+        )
+        start, end = self.victim.death_window
+        timeline.add(start, end, EVENT, f"Murder of {self.victim.name}", "crime_scene")
+        return timeline
 
     def _create_factions(self):
         """Create all political factions.
@@ -141,24 +398,28 @@ class MysteryPlot:
                 motive="Secret Medievalist; intended to kill R. Daneel Olivaw to strike against robot presence",
                 alibi="Claims he was in his office all afternoon (FALSE — he was in Spacetown)",
                 guilty=True,  # THE ACTUAL KILLER
+                alibi_claim=("commissioner_office", "12:00", "18:00"),
             ),
             "Records Clerk": Suspect(
                 name="Records Clerk",
                 motive="Had a data access dispute with Sarton",
                 alibi="Verifiable — was processing files with witnesses",
                 guilty=False,
+                alibi_claim=("records_office", "14:00", "17:00"),
             ),
             "Administrator": Suspect(
                 name="Administrator",
                 motive="Professional rivalry over robotics research funding",
                 alibi="Verifiable — attended budget meeting until 15:30",
                 guilty=False,
+                alibi_claim=("administrative_section", "13:30", "15:30"),
             ),
             "R. Daneel Olivaw": Suspect(
                 name="R. Daneel Olivaw",
                 motive="Robots appear suspicious due to victim's robot research",
                 alibi="Provably with Baley during time of death",
                 guilty=False,
+                alibi_claim=("police_headquarters", "14:45", "16:00"),
             ),
             "Francis Clousarr": Suspect(
                 name="Francis Clousarr",
@@ -171,6 +432,7 @@ class MysteryPlot:
                 motive="Professional conflict with Sarton over research approach",
                 alibi="At Spacetown with limited staff",
                 guilty=False,
+                alibi_claim=("spacetown", "14:00", "17:00"),
             ),
             "R. Sammy": Suspect(
                 name="R. Sammy",
@@ -205,7 +467,7 @@ class MysteryPlot:
 
     def verify_alibi(self, suspect_name):
         if suspect_name in self.locked_suspects:
-            self.history.append(f"Cannot verify alibi for {suspect_name}: suspect is locked.")
+            self._log(BLOCKED, suspect_name, ALIBI_VERIFIED)
             return False
         """Mark a suspect's alibi as verified.
 
@@ -219,16 +481,23 @@ class MysteryPlot:
         if not suspect:
             return False
 
-        suspect.alibis_verified = True
-        self.history.append(f"Alibi verified for {suspect_name}.")
+        if not suspect.alibis_verified:
+            self.own_item("suspects", suspect_name).alibis_verified = True
+            self.verified_count += 1
+        self._log(ALIBI_VERIFIED, suspect_name)
 
-        # Strong alibis rule out suspects
-        solid_alibis = ["Administrator", "Records Clerk", "R. Daneel Olivaw"]
-        return suspect_name in solid_alibis
+        # Only sightings away from the scene count, and only if they
+        # account for the whole time of death
+        start, end = self.victim.death_window
+        for lo, hi in self.timeline.coverage(
+            suspect_name, start, end, self.victim.scene
+        ):
+            self.deduction.record_alibi(suspect_name, lo, hi)
+        return not self.timeline.gaps(suspect_name, start, end, self.victim.scene)
 
     def question_suspect(self, suspect_name):
         if suspect_name in self.locked_suspects:
-            self.history.append(f"Cannot question {suspect_name}: suspect is locked.")
+            self._log(BLOCKED, suspect_name, QUESTIONED)
             return
         """Mark a suspect as questioned.
 
@@ -237,12 +506,14 @@ class MysteryPlot:
         """
         suspect = self.suspects.get(suspect_name)
         if suspect:
-            suspect.questioned = True
-            self.history.append(f"Questioned {suspect_name}.")
+            if not suspect.questioned:
+                self.own_item("suspects", suspect_name).questioned = True
+                self.questioned_count += 1
+            self._log(QUESTIONED, suspect_name)
 
     def record_evidence(self, evidence_name):
         if evidence_name in self.locked_evidence:
-            self.history.append(f"Cannot record evidence {evidence_name}: evidence is locked.")
+            self._log(BLOCKED, evidence_name, EVIDENCE_FOUND)
             return
         """Record discovery of key evidence.
 
@@ -250,21 +521,54 @@ class MysteryPlot:
             evidence_name: Key from evidence dict
         """
         if evidence_name in self.key_evidence:
-            self.key_evidence[evidence_name] = True
-            linked = self.evidence_links.get(evidence_name, [])
-            self.history.append(f"Found evidence: {evidence_name} (implicates: {', '.join(linked) if linked else 'unknown'})")
+            bit = self.evidence_bits[evidence_name]
+            if not self.evidence_mask & bit:
+                self.own("key_evidence")[evidence_name] = True
+                self.evidence_mask |= bit
+                self.evidence_count += 1
+                against = self.own("evidence_against_count")
+                for suspect_name in self.evidence_links.get(evidence_name, []):
+                    against[suspect_name] += 1
+                self.deduction.record_evidence(evidence_name)
+            self._log(
+                EVIDENCE_FOUND,
+                evidence_name,
+                related=self.evidence_links.get(evidence_name, ()),
+            )
+
+    def has_evidence(self, evidence_name):
+        """Check whether a piece of key evidence has been found.
+
+        Args:
+            evidence_name: Key from evidence dict
+
+        Returns:
+            bool: Whether it was found
+        """
+        return bool(self.evidence_mask & self.evidence_bits.get(evidence_name, 0))
+
+    def evidence_against(self, suspect_name):
+        """Count the found evidence that implicates a suspect.
+
+        Args:
+            suspect_name: Name of the suspect
+
+        Returns:
+            int: Number of found evidence items linked to them
+        """
+        return self.evidence_against_count.get(suspect_name, 0)
 
     def branch_choice(self, choice):
         """Branch investigation based on player choice."""
         # Example: lock/unlock suspects/evidence based on choice
         if choice == "trust_spacers":
-            self.locked_suspects.add("Francis Clousarr")
-            self.locked_evidence.add("spacer_conspiracy")
-            self.history.append("Branch: Trusted Spacers. Clousarr and spacer_conspiracy locked.")
+            self.own("locked_suspects").add("Francis Clousarr")
+            self.own("locked_evidence").add("spacer_conspiracy")
+            self._log(BRANCH, choice)
         elif choice == "pursue_medievalists":
-            self.locked_suspects.add("Han Fastolfe")
-            self.locked_evidence.add("r_sammy_transport")
-            self.history.append("Branch: Pursued Medievalists. Fastolfe and r_sammy_transport locked.")
+            self.own("locked_suspects").add("Han Fastolfe")
+            self.own("locked_evidence").add("r_sammy_transport")
+            self._log(BRANCH, choice)
 
     def can_accuse(self, player):
         """Check if player has enough evidence to make an accusation.
@@ -276,10 +580,34 @@ class MysteryPlot:
             tuple: (can_accuse, required_clues_remaining)
         """
         # Need at least 3 evidence points to accuse
-        evidence_found = sum(1 for v in self.key_evidence.values() if v)
-        can_accuse = evidence_found >= 3
+        can_accuse = self.evidence_count >= 3
+
+        return can_accuse, max(0, 3 - self.evidence_count)
+
+    def accuse(self, accused_name):
+        """Accuse someone of the murder.
+
+        An accusation of a suspect stands until another is made, so a
+        wrong one still sends its suspect to trial if time runs out.
+
+        Args:
+            accused_name: Name of the accused person
+
+        Returns:
+            dict: Result of check_solution
+        """
+        if accused_name in self.suspects:
+            self.accused = accused_name
+        return self.check_solution(accused_name)
 
-        return can_accuse, max(0, 3 - evidence_found)
+    @property
+    def wrongly_accused(self):
+        """Whether the accusation standing names someone innocent.
+
+        Returns:
+            bool: True if the accused suspect had no part in the murder
+        """
+        return self.accused is not None and not self.suspects[self.accused].guilty
 
     def check_solution(self, accused_name):
         """Check if player's accusation is correct.
@@ -328,9 +656,12 @@ class MysteryPlot:
         Returns:
             str: Formatted mystery summary
         """
-        evidence_count = sum(1 for v in self.key_evidence.values() if v)
-        ruled_out = [s.name for s in self.suspects.values() if s.alibis_verified and not s.guilty]
-        timeline = '\n'.join(self.history[-5:]) if self.history else 'No actions yet.'
+        ruled_out = list(self.deduction.eliminated)
+        suspect_total = len(self.suspects)
+        recent = self.history.recent(5)
+        timeline = (
+            "\n".join(map(self.describe, recent)) if recent else "No actions yet."
+        )
         summary = f"""
         ╔═════════════════════════════════════════╗
         ║          MURDER INVESTIGATION           ║
@@ -338,9 +669,9 @@ class MysteryPlot:
         ║ Victim: {self.victim.name}
         ║ Cause: {self.victim.cause_of_death}
         ║ Time: {self.victim.time_of_death}
-        ║ Suspects Questioned: {sum(1 for s in self.suspects.values() if s.questioned)}/7
-        ║ Alibis Verified: {sum(1 for s in self.suspects.values() if s.alibis_verified)}/7
-        ║ Evidence Found: {evidence_count}/5
+        ║ Suspects Questioned: {self.questioned_count}/{suspect_total}
+        ║ Alibis Verified: {self.verified_count}/{suspect_total}
+        ║ Evidence Found: {self.evidence_count}/{len(self.key_evidence)}
         ║ Time Until Spacers Leave: {self.time_remaining} min
         ║ Ruled Out: {', '.join(ruled_out) if ruled_out else 'None'}
         ║ Locked Suspects: {', '.join(self.locked_suspects) if self.locked_suspects else 'None'}
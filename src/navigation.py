@@ -0,0 +1,79 @@
+"""
+Navigation - Reachability checks over the authored location exit graph
+
+Routing itself lives in src.transit, over the session's live world.
+From the command line:
+    python -m src.navigation
+"""
+
+from collections import deque
+
+from src.locations import LOCATIONS
+
+
+def reachable_from(start, locations=None):
+    """Find every location that can be walked to from a starting point.
+
+    Args:
+        start: Starting location key
+        locations: Dict of location key to Location (defaults to LOCATIONS)
+
+    Returns:
+        set: Reachable location keys, the start included
+    """
+    locations = LOCATIONS if locations is None else locations
+    reached = {start}
+    queue = deque([start])
+    while queue:
+        location = locations.get(queue.popleft())
+        if location is None:
+            continue
+        for neighbor in location.exits.values():
+            if neighbor in locations and neighbor not in reached:
+                reached.add(neighbor)
+                queue.append(neighbor)
+    return reached
+
+
+def locations_without_entrance(locations=None):
+    """List locations that no exit leads to.
+
+    Args:
+        locations: Dict of location key to Location (defaults to LOCATIONS)
+
+    Returns:
+        list: Sorted location keys
+    """
+    locations = LOCATIONS if locations is None else locations
+    entered = {
+        target for location in locations.values() for target in location.exits.values()
+    }
+    return sorted(key for key in locations if key not in entered)
+
+
+def reachability_report(start="bedroom", locations=None):
+    """Summarize which locations the player can reach.
+
+    Args:
+        start: Starting location key
+        locations: Dict of location key to Location (defaults to LOCATIONS)
+
+    Returns:
+        str: Formatted report
+    """
+    locations = LOCATIONS if locations is None else locations
+    reachable = reachable_from(start, locations)
+    unreachable = sorted(key for key in locations if key not in reachable)
+    no_entrance = locations_without_entrance(locations)
+
+    report = f"\n🗺️ REACHABILITY FROM {start}:\n"
+    report += f"  Reachable: {len(locations) - len(unreachable)}/{len(locations)}\n"
+    if unreachable:
+        report += f"  Unreachable: {', '.join(unreachable)}\n"
+    if no_entrance:
+        report += f"  No exit leads to: {', '.join(no_entrance)}\n"
+    return report
+
+
+if __name__ == "__main__":
+    print(reachability_report())
@@ -0,0 +1,67 @@
+"""
+NPC Schedule Table - Where each character is at each time of day
+
+Authored content: src.schedules builds the presence index from it and
+the content compiler validates it (python -m src.content).
+"""
+
+# NPC -> {period: location key or None (off the map)}. A (day, period) key
+# overrides the daily routine on that day. NPCs without a schedule stay
+# where the locations place them.
+NPC_SCHEDULES = {
+    "R. Daneel Olivaw": {
+        "morning": "bedroom",
+        "afternoon": "commissioner_office",
+        "evening": "robot_division",
+        "night": "bedroom",
+    },
+    "Jessie Baley": {
+        "morning": "bedroom",
+        "afternoon": "food_dispensary",
+        "evening": "bedroom",
+        "night": "bedroom",
+    },
+    "Ben Baley": {
+        "morning": "bedroom",
+        "afternoon": "central_plaza",
+        "evening": "bedroom",
+        "night": "bedroom",
+    },
+    "Julius Enderby": {
+        "morning": "commissioner_office",
+        "afternoon": "commissioner_office",
+        "evening": "police_headquarters",
+        "night": None,
+    },
+    "Vince Barrett": {
+        "morning": "police_headquarters",
+        "afternoon": "police_headquarters",
+        "evening": "food_dispensary",
+        "night": None,
+    },
+    "R. Sammy": {
+        "morning": "robot_division",
+        "afternoon": "police_headquarters",
+        "evening": "robot_division",
+        "night": "robot_division",
+    },
+    "Han Fastolfe": {
+        "morning": "spacetown",
+        "afternoon": "spacetown",
+        "evening": "spacetown",
+        "night": "spacetown",
+        (2, "afternoon"): "commissioner_office",
+    },
+    "Street Vendor": {
+        "morning": "central_plaza",
+        "afternoon": "central_plaza",
+        "evening": "central_plaza",
+        "night": None,
+    },
+    "Records Clerk": {
+        "morning": "records_office",
+        "afternoon": "records_office",
+        "evening": None,
+        "night": None,
+    },
+}
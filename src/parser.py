@@ -0,0 +1,266 @@
+"""
+Command Parser - Natural-language command parsing with a memoized parse cache
+"""
+
+from functools import lru_cache
+
+from src.locations import LOCATIONS
+
+# Words that carry no meaning for command resolution
+ARTICLES = {"a", "an", "the", "some", "my", "this", "that", "these", "those"}
+
+PREPOSITIONS = {
+    "to",
+    "at",
+    "with",
+    "into",
+    "in",
+    "on",
+    "onto",
+    "toward",
+    "towards",
+    "from",
+    "inside",
+    "over",
+}
+
+# Verb phrases mapped to the canonical command they stand for.
+# Multi-word phrases are matched before single words.
+VERB_SYNONYMS = {
+    "pick up": "take",
+    "pick": "take",
+    "grab": "take",
+    "collect": "take",
+    "take": "take",
+    "get": "take",
+    "put down": "drop",
+    "drop": "drop",
+    "discard": "drop",
+    "go": "go",
+    "move": "go",
+    "walk": "go",
+    "head": "go",
+    "enter": "go",
+    "look at": "examine",
+    "look": "look",
+    "examine": "examine",
+    "inspect": "examine",
+    "check": "examine",
+    "study": "examine",
+    "x": "examine",
+    "talk": "talk",
+    "speak": "talk",
+    "chat": "talk",
+    "question": "talk",
+    "interrogate": "talk",
+    "accuse": "accuse",
+    "arrest": "accuse",
+    "play": "play",
+    "comfort": "comfort",
+    "console": "comfort",
+}
+
+# What kind of entity each canonical verb expects as its object
+VERB_TARGETS = {
+    "take": "item",
+    "drop": "inventory",
+    "go": "exit",
+    "examine": "thing",
+    "talk": "npc",
+    "play": "npc",
+    "comfort": "npc",
+    "accuse": "suspect",
+}
+
+
+class CommandParser:
+    """Parses free-form player input into (command, argument) pairs.
+
+    Entity-bearing commands are resolved against the locations, NPC aliases
+    and item aliases. Parse results are memoized in a bounded LRU keyed by
+    the normalized input and the location context, so repeated phrasings
+    skip the grammar entirely.
+    """
+
+    def __init__(self, npc_aliases, item_aliases, cache_size=512):
+        """Initialize the parser.
+
+        Args:
+            npc_aliases: Dict of lowercase alias to canonical NPC name
+            item_aliases: Dict of lowercase alias to item key
+            cache_size: Maximum number of memoized parses
+        """
+        self.npc_aliases = npc_aliases
+        self.item_aliases = item_aliases
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse)
+
+    def parse(self, command_string, context):
+        """Parse a command string.
+
+        Args:
+            command_string: Raw player input
+            context: Hashable location context tuple of (location key,
+                exit pairs, NPCs, items, inventory items)
+
+        Returns:
+            tuple: (command, args); command is "" for empty input
+        """
+        parts = command_string.split(maxsplit=1)
+        if not parts:
+            return "", ""
+
+        first = parts[0].lower()
+        if first not in VERB_SYNONYMS:
+            # Not a grammar verb: keep the argument text (and its case) as-is
+            return first, parts[1] if len(parts) > 1 else ""
+
+        normalized = " ".join(command_string.lower().split())
+        return self._parse_cached(normalized, context)
+
+    def cache_info(self):
+        """Get statistics for the parse cache.
+
+        Returns:
+            CacheInfo: hits, misses, maxsize and currsize
+        """
+        return self._parse_cached.cache_info()
+
+    def clear_cache(self):
+        """Drop all memoized parses."""
+        self._parse_cached.cache_clear()
+
+    def _parse(self, normalized, context):
+        """Parse a normalized command (uncached).
+
+        Args:
+            normalized: Lowercase input with collapsed whitespace
+            context: Location context tuple
+
+        Returns:
+            tuple: (command, args)
+        """
+        tokens = normalized.split()
+        verb_phrase = " ".join(tokens[:2])
+        if len(tokens) > 1 and verb_phrase in VERB_SYNONYMS:
+            verb, rest = VERB_SYNONYMS[verb_phrase], tokens[2:]
+        else:
+            verb, rest = VERB_SYNONYMS[tokens[0]], tokens[1:]
+
+        if verb == "look" and rest and rest[0] not in ("around", "about"):
+            # "look glasses" / "look in the case" mean examine
+            verb = "examine"
+
+        words = [w for w in rest if w not in ARTICLES and w not in PREPOSITIONS]
+        phrase = " ".join(words)
+
+        target = VERB_TARGETS.get(verb)
+        if target is None or not phrase:
+            return verb, phrase
+
+        _, exits, npcs, items, inventory = context
+        if target == "exit":
+            resolved = self._resolve_exit(phrase, exits)
+        elif target == "item":
+            resolved = self._resolve_item(phrase, items)
+        elif target == "inventory":
+            resolved = self._resolve_item(phrase, inventory)
+        elif target == "thing":
+            resolved = self._resolve_item(phrase, items + inventory)
+            if resolved is None:
+                resolved = self._resolve_npc(phrase, npcs)
+                resolved = resolved.lower() if resolved else None
+        elif target == "npc":
+            resolved = self._resolve_npc(phrase, npcs)
+            resolved = resolved.lower() if resolved else None
+        else:
+            resolved = self.npc_aliases.get(phrase)
+
+        return verb, resolved or phrase
+
+    def _resolve_exit(self, phrase, exits):
+        """Resolve a phrase to an exit key of the current location.
+
+        Args:
+            phrase: Cleaned target phrase
+            exits: Tuple of (exit_key, destination_key) pairs
+
+        Returns:
+            str or None: Exit key
+        """
+        matches = []
+        for exit_key, destination in exits:
+            location = LOCATIONS.get(destination)
+            names = {
+                exit_key,
+                exit_key.replace("_", " "),
+                destination,
+                destination.replace("_", " "),
+            }
+            if location:
+                names.add(location.name.lower())
+            if phrase in names:
+                return exit_key
+            if any(_contains_words(name, phrase) for name in names):
+                matches.append(exit_key)
+        return matches[0] if len(matches) == 1 else None
+
+    def _resolve_item(self, phrase, candidates):
+        """Resolve a phrase to one of the candidate item keys.
+
+        Args:
+            phrase: Cleaned target phrase
+            candidates: Tuple of item keys available to the command
+
+        Returns:
+            str or None: Item key
+        """
+        if phrase == "all":
+            return phrase
+
+        alias = self.item_aliases.get(phrase)
+        if alias in candidates:
+            return alias
+
+        matches = []
+        for item in candidates:
+            spaced = item.lower().replace("_", " ")
+            if phrase in (item.lower(), spaced):
+                return item
+            if _contains_words(spaced, phrase):
+                matches.append(item)
+        return matches[0] if len(set(matches)) == 1 else None
+
+    def _resolve_npc(self, phrase, present):
+        """Resolve a phrase to the canonical name of an NPC.
+
+        Args:
+            phrase: Cleaned target phrase
+            present: Tuple of NPC names at the current location
+
+        Returns:
+            str or None: Canonical NPC name
+        """
+        canonical = self.npc_aliases.get(phrase)
+        if canonical:
+            return canonical
+
+        matches = []
+        for npc in present:
+            if phrase == npc.lower():
+                return npc
+            if _contains_words(npc.lower(), phrase):
+                matches.append(npc)
+        return matches[0] if len(matches) == 1 else None
+
+
+def _contains_words(name, phrase):
+    """Check whether a phrase appears as whole words inside a name.
+
+    Args:
+        name: Lowercase candidate name
+        phrase: Lowercase phrase
+
+    Returns:
+        bool: True if every word of the phrase is found in order
+    """
+    return f" {phrase} " in f" {name} "
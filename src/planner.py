@@ -0,0 +1,249 @@
+"""
+Hint Planner - R. Daneel's search for the next productive step
+
+The game is abstracted to what matters for the endings: where the
+player stands, which case items they carry, which evidence is found and
+whether their record reaches the score the better endings ask for.
+Trust levels are left out: no ending or action depends on them.
+
+A breadth-first search over that graph finds the shortest way to the
+best ending still reachable. Every state on the chosen path remembers
+its distance and next step, so following a hint lands on a state that
+already has its answer.
+"""
+
+from collections import deque
+
+# Investigation points the record-based endings look at
+POINTS_GOAL = 50
+
+
+class HintPlanner:
+    """Plans toward the best reachable ending for one case and map."""
+
+    def __init__(self, game_state, content):
+        """Initialize the planner.
+
+        Args:
+            game_state: GameState of the session
+            content: WorldBundle with the map
+        """
+        self.game_state = game_state
+        self.content = content
+        self.mystery = game_state.mystery
+        topics = self.mystery.topics
+        self.items = sorted({item for _, item, _ in topics.values() if item})
+        self.item_bits = {item: 1 << i for i, item in enumerate(self.items)}
+        self.evidence_bits = {
+            evidence: 1 << i for i, (evidence, _, _) in enumerate(topics.values())
+        }
+        self.memo = {}  # (state, goal) -> (distance, action, next state)
+        self.item_places = {}
+
+    def abstract_state(self, player):
+        """Reduce the live session to a planner state.
+
+        Args:
+            player: Player
+
+        Returns:
+            tuple: (location, inventory bits, evidence bits, points reached)
+        """
+        inventory = 0
+        for item in self.items:
+            if item in player.inventory:
+                inventory |= self.item_bits[item]
+        evidence = 0
+        for evidence_name, bit in self.evidence_bits.items():
+            if self.mystery.has_evidence(evidence_name):
+                evidence |= bit
+        points = int(player.investigation_points >= POINTS_GOAL)
+        return player.current_location, inventory, evidence, points
+
+    def _place_items(self, player):
+        """Find where each case item not being carried lies.
+
+        Plans made before an item turned up somewhere new are dropped.
+
+        Args:
+            player: Player
+        """
+        world = self.game_state.world
+        for key in self.content.locations:
+            for item in world.items_at(key):
+                if item in self.item_bits and self.item_places.get(item) != key:
+                    self.item_places[item] = key
+                    self.memo.clear()
+
+    def _moves(self, state, puzzles_left):
+        """List the moves out of a state.
+
+        Args:
+            state: Planner state
+            puzzles_left: Unsolved puzzle ids
+
+        Yields:
+            tuple: (action, next state)
+        """
+        location, inventory, evidence, points = state
+        place = self.content.locations.get(location)
+        if place is None:
+            return
+        for exit_name, target in place["exits"].items():
+            if target in self.content.locations:
+                yield ("go", exit_name, target), (target, inventory, evidence, points)
+        for item, item_location in self.item_places.items():
+            bit = self.item_bits[item]
+            if item_location == location and not inventory & bit:
+                yield ("take", item), (location, inventory | bit, evidence, points)
+        for topic, (evidence_name, item, requires) in self.mystery.topics.items():
+            bit = self.evidence_bits[evidence_name]
+            if evidence & bit or evidence_name in self.mystery.locked_evidence:
+                continue
+            if item and not inventory & self.item_bits[item]:
+                continue
+            if requires and not evidence & self.evidence_bits[requires]:
+                continue
+            yield ("investigate", topic), (location, inventory, evidence | bit, points)
+        if not points and puzzles_left:
+            yield ("puzzle", puzzles_left[0]), (location, inventory, evidence, 1)
+
+    def _ending(self, evidence_count, points):
+        """Score the ending an accusation would bring.
+
+        Args:
+            evidence_count: Evidence found
+            points: Whether the points goal is reached
+
+        Returns:
+            Ending or None
+        """
+        features = (
+            True,  # An accusation of the killer
+            self.mystery.actual_killer,
+            evidence_count,
+            POINTS_GOAL if points else 0,
+            self.game_state.time_period,
+            self.game_state.day,
+            False,  # The killer stands accused
+        )
+        return self.game_state.endings_manager.decide(features)
+
+    def _goals(self, state, puzzles_left):
+        """List the endings an accusation could bring, best first.
+
+        Args:
+            state: Planner state
+            puzzles_left: Unsolved puzzle ids
+
+        Returns:
+            list: (evidence needed, points needed, Ending) tuples, each
+                with the least evidence and points that bring the ending
+        """
+        _, _, evidence, points = state
+        found = evidence.bit_count()
+        reachable = found + sum(
+            1
+            for evidence_name, _, _ in self.mystery.topics.values()
+            if not evidence & self.evidence_bits[evidence_name]
+            and evidence_name not in self.mystery.locked_evidence
+        )
+        goals = {}
+        for needed in range(max(3, found), reachable + 1):
+            for points_needed in ((0, 1) if puzzles_left or points else (0,)):
+                ending = self._ending(needed, points_needed or points)
+                if ending and ending.ending_id not in goals:
+                    goals[ending.ending_id] = (needed, points_needed, ending)
+        return sorted(goals.values(), key=lambda goal: -goal[2].score_bonus)
+
+    def plan(self, player):
+        """Find the next step toward the best reachable ending.
+
+        Args:
+            player: Player
+
+        Returns:
+            tuple: (action, distance, Ending, following actions) or None if
+                no ending can be reached from here
+        """
+        if self.mystery.time_remaining == 0:
+            return None
+        self._place_items(player)
+        puzzles = self.game_state.puzzle_manager.puzzles
+        puzzles_left = [pid for pid, puzzle in puzzles.items() if not puzzle.solved]
+        state = self.abstract_state(player)
+        for needed, points_needed, ending in self._goals(state, puzzles_left):
+            key = (state, needed, points_needed)
+            if key not in self.memo:
+                self._search(state, needed, points_needed, puzzles_left)
+            if self.memo[key] is not None:
+                distance, action, _ = self.memo[key]
+                return action, distance, ending, self._follow(key)
+        return None
+
+    def _search(self, start, needed, points_needed, puzzles_left):
+        """Breadth-first search from a state to an accusation that meets the goal.
+
+        Memoizes every state on the path found, or the start as a dead end.
+
+        Args:
+            start: Planner state
+            needed: Evidence needed
+            points_needed: Points goal needed
+            puzzles_left: Unsolved puzzle ids
+
+        Returns:
+            bool: Whether a path exists
+        """
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            state = queue.popleft()
+            _, _, evidence, points = state
+            if evidence.bit_count() >= needed and points >= points_needed:
+                self._remember(state, parents, needed, points_needed)
+                return True
+            for action, following in self._moves(state, puzzles_left):
+                if following not in parents:
+                    parents[following] = (state, action)
+                    queue.append(following)
+        self.memo[(start, needed, points_needed)] = None
+        return False
+
+    def _remember(self, goal, parents, needed, points_needed):
+        """Store the distance and next step of every state on a path.
+
+        Args:
+            goal: State where the accusation can be made
+            parents: BFS parent links
+            needed: Evidence needed
+            points_needed: Points goal needed
+        """
+        self.memo[(goal, needed, points_needed)] = (1, ("accuse",), None)
+        distance = 1
+        state = goal
+        while parents[state] is not None:
+            previous, action = parents[state]
+            distance += 1
+            self.memo[(previous, needed, points_needed)] = (
+                distance,
+                action,
+                (state, needed, points_needed),
+            )
+            state = previous
+
+    def _follow(self, key):
+        """List the actions after the first along a memoized path.
+
+        Args:
+            key: Memo key to start from
+
+        Returns:
+            list: Actions
+        """
+        actions = []
+        following = self.memo[key][2]
+        while following is not None:
+            _, action, following = self.memo[following]
+            actions.append(action)
+        return actions
@@ -2,10 +2,14 @@
 Player class - Represents the player character
 """
 
+from src.utils import CopyOnWrite, Versioned
 
-class Player:
+
+class Player(Versioned, CopyOnWrite):
     """Represents the player character."""
 
+    COW_FIELDS = ("inventory", "met_characters", "clues_found")
+
     def __init__(self, name, starting_location, difficulty="normal"):
         """Initialize the player.
 
@@ -30,10 +34,9 @@ class Player:
             item: Item name
             quantity: Quantity to add
         """
-        if item in self.inventory:
-            self.inventory[item] += quantity
-        else:
-            self.inventory[item] = quantity
+        inventory = self.own("inventory")
+        inventory[item] = inventory.get(item, 0) + quantity
+        self.touch()
 
     def remove_item(self, item, quantity=1):
         """Remove item from inventory.
@@ -48,11 +51,13 @@ class Player:
         if item not in self.inventory:
             return False
 
-        if self.inventory[item] <= quantity:
-            del self.inventory[item]
+        inventory = self.own("inventory")
+        if inventory[item] <= quantity:
+            del inventory[item]
         else:
-            self.inventory[item] -= quantity
+            inventory[item] -= quantity
 
+        self.touch()
         return True
 
     def has_item(self, item):
@@ -66,6 +71,21 @@ class Player:
         """
         return item in self.inventory and self.inventory[item] > 0
 
+    def clear_inventory(self):
+        """Remove every item from the inventory."""
+        self.own("inventory").clear()
+        self.touch()
+
+    def meet_character(self, npc_name):
+        """Record that the player has met an NPC.
+
+        Args:
+            npc_name: Canonical NPC name
+        """
+        if npc_name not in self.met_characters:
+            self.own("met_characters").add(npc_name)
+            self.touch()
+
     def add_clue(self, clue):
         """Record a clue found during investigation.
 
@@ -73,7 +93,7 @@ class Player:
             clue: Clue description
         """
         if clue not in self.clues_found:
-            self.clues_found.append(clue)
+            self.own("clues_found").append(clue)
             self.investigation_points += 10
 
     def get_status(self):
@@ -0,0 +1,382 @@
+"""
+Procedural Sectors - Deterministic city sectors streamed in chunks
+"""
+
+import re
+from collections import OrderedDict
+
+from src.locations import Location
+
+CHUNK_SIZE = 8  # Rooms per chunk side
+DEFAULT_SEED = 1954
+MAX_CHUNKS = 25  # Chunks kept in memory (a 5x5 block)
+
+ROOM_KEY = re.compile(r"^sector_(-?\d+)_(-?\d+)$")
+
+# Authored location -> (exit name, sector coordinates) leading into the sectors
+SECTOR_GATES = {"corridor_residential": ("sectors", (0, 0))}
+
+DIRECTIONS = {
+    "north": (0, -1),
+    "south": (0, 1),
+    "east": (1, 0),
+    "west": (-1, 0),
+}
+
+SECTOR_NAMES = [
+    "Williamsburg",
+    "Jersey",
+    "Long Island",
+    "Bronx",
+    "Queens",
+    "Newark",
+    "Hudson",
+    "Yonkers",
+    "Flatbush",
+    "Riverside",
+]
+
+ROOM_DESCRIPTIONS = {
+    "corridor": [
+        """
+        A featureless corridor lit by the even glow of the walls. Citizens
+        stream past in both directions without a glance at one another.
+        """,
+        """
+        A service corridor where ventilation ducts run along the ceiling.
+        The air smells faintly of yeast from the food vats below.
+        """,
+        """
+        A busy junction of walkways. Signs point the way to the nearest
+        strips, Personals and community kitchens.
+        """,
+    ],
+    "apartment": [
+        """
+        A row of identical apartment doors. Behind one of them a family
+        argues about ration points in muffled voices.
+        """,
+        """
+        A quiet residential block. Children's drawings are taped beside a
+        door, the only color in the gray hallway.
+        """,
+        """
+        A cramped apartment landing. A Personal's entrance marks the end
+        of the hall and a queue has formed in front of it.
+        """,
+    ],
+    "plaza": [
+        """
+        A small sector plaza under a high, vaulted ceiling. Crowds gather
+        around a news screen reporting on the latest Spacer visit.
+        """,
+        """
+        An open plaza with benches arranged around an artificial fountain.
+        A robot sweeps the floor while citizens eye it with suspicion.
+        """,
+    ],
+}
+
+GATE_DESCRIPTION = """
+        A wide access gate where the residential corridors open onto the
+        endless sectors of the City. Corridors branch away in every
+        direction, and a sign points back to the residential corridor.
+        """
+
+
+def _mix(seed, x, y, salt):
+    """Hash integers into a well-distributed 32-bit value.
+
+    Args:
+        seed: World seed
+        x: X coordinate
+        y: Y coordinate
+        salt: Distinguishes independent decisions at the same coordinates
+
+    Returns:
+        int: Deterministic hash
+    """
+    h = seed * 0x9E3779B1 + x * 0x85EBCA77 + y * 0xC2B2AE3D + salt * 0x27D4EB2F
+    h &= 0xFFFFFFFF
+    h ^= h >> 15
+    h = (h * 0x2C1B3C6D) & 0xFFFFFFFF
+    h ^= h >> 12
+    h = (h * 0x297A2D39) & 0xFFFFFFFF
+    h ^= h >> 15
+    return h
+
+
+def room_key(x, y):
+    """Get the location key of a sector room.
+
+    Args:
+        x: X coordinate
+        y: Y coordinate
+
+    Returns:
+        str: Location key
+    """
+    return f"sector_{x}_{y}"
+
+
+def parse_room_key(location_key):
+    """Get the coordinates of a sector room key.
+
+    Args:
+        location_key: Location key
+
+    Returns:
+        tuple or None: (x, y), or None if the key is not a sector room
+    """
+    match = ROOM_KEY.match(location_key)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+class SectorGenerator:
+    """Generates sector rooms on demand from a seed.
+
+    Rooms are produced a chunk at a time and kept in a bounded LRU; an
+    evicted chunk is simply regenerated the next time it is needed, so
+    memory stays flat however far the player walks. Each chunk also
+    indexes its rooms by kind for neighbor queries.
+    """
+
+    def __init__(self, seed=DEFAULT_SEED, max_chunks=MAX_CHUNKS):
+        """Initialize the generator.
+
+        Args:
+            seed: World seed
+            max_chunks: Maximum number of chunks kept in memory
+        """
+        self.seed = seed
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()  # (cx, cy) -> {"rooms": ..., "kinds": ...}
+        self.chunks_generated = 0
+
+    def get_location(self, location_key):
+        """Get a sector room, generating its chunk if needed.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            Location or None: None if the key is not a sector room
+        """
+        coords = parse_room_key(location_key)
+        if coords is None:
+            return None
+        return self._chunk(*self.chunk_of(*coords))["rooms"][location_key]
+
+    def is_generated(self, location_key):
+        """Check whether a key names a procedural room.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            bool: True for sector rooms
+        """
+        return parse_room_key(location_key) is not None
+
+    def gate_exits(self, location_key):
+        """Get the exits an authored location gains into the sectors.
+
+        Args:
+            location_key: Authored location key
+
+        Returns:
+            dict: Exit name to sector room key
+        """
+        gate = SECTOR_GATES.get(location_key)
+        if gate is None:
+            return {}
+        exit_name, (x, y) = gate
+        return {exit_name: room_key(x, y)}
+
+    def approach(self, location_key, radius=1):
+        """Stream in the chunks around a room the player has entered.
+
+        Args:
+            location_key: Location key
+            radius: Chunks to load on each side of the room's chunk
+        """
+        coords = parse_room_key(location_key)
+        if coords is None:
+            return
+        cx, cy = self.chunk_of(*coords)
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                self._chunk(cx + dx, cy + dy)
+        # Keep the player's own chunk the most recently used
+        self.chunks.move_to_end((cx, cy))
+
+    def neighbors(self, location_key, radius=1):
+        """Find the sector rooms within a square radius of a room.
+
+        Args:
+            location_key: Sector room key
+            radius: Distance in rooms along each axis
+
+        Returns:
+            list: Room keys, excluding the room itself
+        """
+        coords = parse_room_key(location_key)
+        if coords is None:
+            return []
+        x, y = coords
+        return [
+            room_key(x + dx, y + dy)
+            for dy in range(-radius, radius + 1)
+            for dx in range(-radius, radius + 1)
+            if dx or dy
+        ]
+
+    def nearest(self, location_key, kind, max_radius=2):
+        """Find the closest room of a given kind.
+
+        Chunks are searched in rings around the room's chunk using their
+        per-kind index.
+
+        Args:
+            location_key: Sector room key
+            kind: Room kind ("corridor", "apartment" or "plaza")
+            max_radius: Maximum chunk ring to search
+
+        Returns:
+            str or None: Room key
+        """
+        coords = parse_room_key(location_key)
+        if coords is None:
+            return None
+        x, y = coords
+        cx, cy = self.chunk_of(x, y)
+
+        best, best_distance = None, None
+        for ring in range(max_radius + 1):
+            for dy in range(-ring, ring + 1):
+                for dx in range(-ring, ring + 1):
+                    if max(abs(dx), abs(dy)) != ring:
+                        continue
+                    for key in self._chunk(cx + dx, cy + dy)["kinds"].get(kind, ()):
+                        kx, ky = parse_room_key(key)
+                        distance = abs(kx - x) + abs(ky - y)
+                        if key != location_key and (
+                            best_distance is None or distance < best_distance
+                        ):
+                            best, best_distance = key, distance
+            # Rooms in the next ring are at least ring * CHUNK_SIZE + 1 away
+            if best_distance is not None and best_distance <= ring * CHUNK_SIZE + 1:
+                break
+        return best
+
+    @staticmethod
+    def chunk_of(x, y):
+        """Get the chunk coordinates containing a room.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            tuple: (cx, cy)
+        """
+        return x // CHUNK_SIZE, y // CHUNK_SIZE
+
+    def _chunk(self, cx, cy):
+        """Get a chunk from the LRU, generating it on a miss.
+
+        Args:
+            cx: Chunk X coordinate
+            cy: Chunk Y coordinate
+
+        Returns:
+            dict: {"rooms": key -> Location, "kinds": kind -> [keys]}
+        """
+        chunk = self.chunks.get((cx, cy))
+        if chunk is not None:
+            self.chunks.move_to_end((cx, cy))
+            return chunk
+
+        chunk = self._generate_chunk(cx, cy)
+        self.chunks[(cx, cy)] = chunk
+        self.chunks_generated += 1
+        if len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return chunk
+
+    def _generate_chunk(self, cx, cy):
+        """Generate every room of a chunk.
+
+        Args:
+            cx: Chunk X coordinate
+            cy: Chunk Y coordinate
+
+        Returns:
+            dict: {"rooms": key -> Location, "kinds": kind -> [keys]}
+        """
+        sector = SECTOR_NAMES[_mix(self.seed, cx, cy, 1) % len(SECTOR_NAMES)]
+        rooms = {}
+        kinds = {}
+        for y in range(cy * CHUNK_SIZE, (cy + 1) * CHUNK_SIZE):
+            for x in range(cx * CHUNK_SIZE, (cx + 1) * CHUNK_SIZE):
+                key = room_key(x, y)
+                kind, location = self._generate_room(x, y, sector)
+                rooms[key] = location
+                kinds.setdefault(kind, []).append(key)
+        return {"rooms": rooms, "kinds": kinds}
+
+    def _generate_room(self, x, y, sector):
+        """Generate a single room.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            sector: Name of the sector the room's chunk belongs to
+
+        Returns:
+            tuple: (kind, Location)
+        """
+        exits = {
+            direction: room_key(x + dx, y + dy)
+            for direction, (dx, dy) in DIRECTIONS.items()
+            if self._is_open(x, y, dx, dy)
+        }
+
+        if (x, y) == (0, 0):
+            for location_key, (exit_name, coords) in SECTOR_GATES.items():
+                if coords == (0, 0):
+                    exits["residential"] = location_key
+            return "gate", Location("Sector Access Gate", GATE_DESCRIPTION, exits)
+
+        roll = _mix(self.seed, x, y, 2) % 100
+        kind = "plaza" if roll < 10 else "apartment" if roll < 55 else "corridor"
+        templates = ROOM_DESCRIPTIONS[kind]
+        description = templates[_mix(self.seed, x, y, 3) % len(templates)]
+        name = f"{sector} {kind.title()} ({x}, {y})"
+        return kind, Location(name, description, exits)
+
+    def _is_open(self, x, y, dx, dy):
+        """Check whether the wall between two adjacent rooms is open.
+
+        East-west passages are always open and every fourth column has a
+        north-south shaft, so the sectors are always connected. Other
+        north-south passages are decided by the seed. The result is the
+        same from either side of the wall.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            dx: X step (-1, 0 or 1)
+            dy: Y step (-1, 0 or 1)
+
+        Returns:
+            bool: True if the rooms are connected
+        """
+        if dy == 0:
+            return True
+        if x % 4 == 0:
+            return True
+        wall_y = min(y, y + dy)
+        return _mix(self.seed, x, wall_y, 4) % 3 == 0
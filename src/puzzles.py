@@ -2,6 +2,8 @@
 Puzzle System - Interactive puzzles and challenges
 """
 
+from src.utils import CopyOnWrite, Versioned
+
 
 class Puzzle:
     """Base puzzle class."""
@@ -110,9 +112,12 @@ class SequencePuzzle(Puzzle):
         ]
 
 
-class PuzzleManager:
+class PuzzleManager(Versioned, CopyOnWrite):
     """Manages all puzzles in the game."""
 
+    COW_FIELDS = ("puzzles",)
+    COW_ITEMS = ("puzzles",)
+
     def __init__(self):
         """Initialize puzzle manager."""
         self.puzzles = {
@@ -120,6 +125,7 @@ class PuzzleManager:
             "logic_puzzle": LogicPuzzle(),
             "sequence": SequencePuzzle(),
         }
+        self.solved_count = 0
 
     def get_puzzle(self, puzzle_id):
         """Get a puzzle by ID.
@@ -149,7 +155,9 @@ class PuzzleManager:
         if puzzle.solved:
             return {"success": True, "message": "You've already solved this puzzle!"}
 
+        puzzle = self.own_item("puzzles", puzzle_id)
         if puzzle.check_solution(answer):
+            self.solved_count += 1
             return {
                 "success": True,
                 "message": f"✅ Correct! You've solved the '{puzzle_id}' puzzle!",
@@ -181,7 +189,8 @@ class PuzzleManager:
         if puzzle.solved:
             return "You've already solved this puzzle."
 
-        hints = puzzle.get_hints()
+        # Some puzzles count the hints they give
+        hints = self.own_item("puzzles", puzzle_id).get_hints()
         if isinstance(hints, list):
             hint_index = min(puzzle.attempts, len(hints) - 1)
             return hints[hint_index]
@@ -193,6 +202,4 @@ class PuzzleManager:
         Returns:
             tuple: (solved_count, total_count)
         """
-        solved = sum(1 for p in self.puzzles.values() if p.solved)
-        total = len(self.puzzles)
-        return solved, total
+        return self.solved_count, len(self.puzzles)
@@ -2,8 +2,10 @@
 NPC Relationship System - Track relationships with characters
 """
 
+from src.utils import CopyOnWrite, Versioned
 
-class NPCRelationship:
+
+class NPCRelationship(Versioned):
     """Tracks relationship with a single NPC."""
 
     def __init__(self, name):
@@ -71,9 +73,12 @@ class NPCRelationship:
             return "Enemy"
 
 
-class RelationshipManager:
+class RelationshipManager(CopyOnWrite):
     """Manages relationships with all NPCs."""
 
+    COW_FIELDS = ("relationships",)
+    COW_ITEMS = ("relationships",)
+
     def __init__(self):
         """Initialize relationship manager."""
         self.relationships = {}
@@ -91,8 +96,9 @@ class RelationshipManager:
             "Administrator",
             "Records Clerk",
             "Dispensary Attendant",
-            "Jessie Bailey",
-            "Ben Bailey",
+            "Scene Officer",
+            "Jessie Baley",
+            "Ben Baley",
             "Vince Barrett",
             "R. Sammy",
             "Han Fastolfe",
@@ -104,10 +110,10 @@ class RelationshipManager:
             self.relationships[npc] = NPCRelationship(npc)
 
         # Set initial family relationships warmer than default
-        if "Jessie Bailey" in self.relationships:
-            self.relationships["Jessie Bailey"].trust = 70
-        if "Ben Bailey" in self.relationships:
-            self.relationships["Ben Bailey"].trust = 50
+        if "Jessie Baley" in self.relationships:
+            self.relationships["Jessie Baley"].trust = 70
+        if "Ben Baley" in self.relationships:
+            self.relationships["Ben Baley"].trust = 50
 
     def get_relationship(self, npc_name):
         """Get relationship object for an NPC.
@@ -118,7 +124,10 @@ class RelationshipManager:
         Returns:
             NPCRelationship or None
         """
-        return self.relationships.get(npc_name)
+        if npc_name not in self.relationships:
+            return None
+        # Callers change what they get, so a fork gets its own copy
+        return self.own_item("relationships", npc_name)
 
     def talk_to_npc(self, npc_name):
         """Record talking to an NPC.
@@ -157,3 +166,12 @@ class RelationshipManager:
         """
         rel = self.get_relationship(npc_name)
         return rel and rel.trust >= -25
+
+    @property
+    def version(self):
+        """Mutation version covering every tracked relationship.
+
+        Each relationship's counter only grows, so their sum changes
+        whenever any relationship does.
+        """
+        return sum(rel.version for rel in self.relationships.values())
@@ -23,6 +23,8 @@ class SaveSystem:
             self.SAVE_DIR = Path(custom_save_dir)
         else:
             self.SAVE_DIR = self.DEFAULT_SAVE_DIR
+        # Full investigation histories, one file per case played
+        self.HISTORY_DIR = self.SAVE_DIR / "history"
 
         self.SAVE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -59,12 +61,17 @@ class SaveSystem:
                 "difficulty": game_state.difficulty,
                 "time_period": game_state.time_period,
                 "day": game_state.day,
+                "clock": game_state.clock,
+                "turns": game_state.turns,
                 "case_solved": game_state.case_solved,
                 "partner_assigned": game_state.partner_assigned,
                 "partner_name": game_state.partner_name,
                 "events_triggered": list(game_state.events_triggered),
+                "events_log": game_state.event_manager.events_log,
                 "visited_locations": list(game_state.visited_locations),
                 "npc_states": game_state.npc_states,
+                "world": game_state.world.to_dict(),
+                "case": game_state.mystery.case,
             },
         }
 
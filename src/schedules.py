@@ -0,0 +1,294 @@
+"""
+NPC Schedules - Where characters are at each time of day
+"""
+
+from src.locations import LOCATIONS
+from src.npc_schedules import NPC_SCHEDULES
+
+TIME_PERIODS = ("morning", "afternoon", "evening", "night")
+
+# The game clock counts minutes from 06:00 on day 1, when a game day
+# begins. Each period starts this many minutes into the day.
+DAY_MINUTES = 24 * 60
+DAY_START = 6 * 60
+PERIOD_STARTS = {"morning": 0, "afternoon": 360, "evening": 720, "night": 960}
+
+
+def clock_period(minute):
+    """Find the day and period of a game clock reading.
+
+    Args:
+        minute: Minutes since the game began
+
+    Returns:
+        tuple: (day from 1, time period)
+    """
+    day, into_day = divmod(minute, DAY_MINUTES)
+    period = TIME_PERIODS[0]
+    for name in TIME_PERIODS:
+        if into_day >= PERIOD_STARTS[name]:
+            period = name
+    return day + 1, period
+
+
+def period_start(day, period):
+    """Find the game clock reading at which a period begins.
+
+    Args:
+        day: Day from 1
+        period: Time period
+
+    Returns:
+        int: Minutes since the game began
+    """
+    return (day - 1) * DAY_MINUTES + PERIOD_STARTS[period]
+
+
+class PresenceIndex:
+    """Index of which NPCs are at each location for the current time.
+
+    Everything that depends only on the schedules is precomputed: the
+    (location, period) presence table, the NPCs that move between each
+    pair of consecutive periods, and the NPCs with day-specific entries.
+    Advancing the clock one period therefore only touches the NPCs that
+    actually move.
+    """
+
+    def __init__(self, locations=None, schedules=None):
+        """Initialize the index at day 1, morning.
+
+        Args:
+            locations: Dict of location key to Location (defaults to LOCATIONS)
+            schedules: NPC schedules (defaults to NPC_SCHEDULES)
+        """
+        self.locations = LOCATIONS if locations is None else locations
+        self.schedules = NPC_SCHEDULES if schedules is None else schedules
+
+        # NPCs in the order the authored locations list them, so rooms
+        # read the same as before schedules existed
+        self.roster = []
+        self.static = {}  # location -> unscheduled NPCs placed there
+        for key, location in self.locations.items():
+            for npc in location.npcs:
+                if npc not in self.roster:
+                    self.roster.append(npc)
+                if npc not in self.schedules:
+                    self.static.setdefault(key, []).append(npc)
+        self.roster += [npc for npc in self.schedules if npc not in self.roster]
+
+        self.by_period = {}  # (location, period) -> NPCs
+        for period in TIME_PERIODS:
+            for key, npcs in self.static.items():
+                self.by_period.setdefault((key, period), []).extend(npcs)
+            for npc in self.roster:
+                location = self.schedules.get(npc, {}).get(period)
+                if location is not None:
+                    self.by_period.setdefault((location, period), []).append(npc)
+
+        self.movers = {}  # (period, next period) -> NPCs whose location differs
+        for period, following in zip(TIME_PERIODS, TIME_PERIODS[1:] + TIME_PERIODS[:1]):
+            self.movers[(period, following)] = [
+                npc
+                for npc, schedule in self.schedules.items()
+                if schedule.get(period) != schedule.get(following)
+            ]
+
+        self.day_specific = {}  # (day, period) -> NPCs with an override then
+        for npc, schedule in self.schedules.items():
+            for slot in schedule:
+                if isinstance(slot, tuple):
+                    self.day_specific.setdefault(slot, []).append(npc)
+
+        self.reset(1, TIME_PERIODS[0])
+
+    def __copy__(self):
+        """Copy the current placement; the schedule tables are shared.
+
+        Returns:
+            PresenceIndex: Copy that can be advanced on its own
+        """
+        clone = object.__new__(PresenceIndex)
+        clone.__dict__.update(self.__dict__)
+        clone.present = {key: dict(npcs) for key, npcs in self.present.items()}
+        clone.listed = {}
+        clone.where = dict(self.where)
+        return clone
+
+    def location_of(self, npc, day, period):
+        """Look up where a scheduled NPC is at a given time.
+
+        Args:
+            npc: NPC name
+            day: Game day
+            period: Time period
+
+        Returns:
+            str or None: Location key, or None if off the map
+        """
+        schedule = self.schedules[npc]
+        return schedule.get((day, period), schedule.get(period))
+
+    def reset(self, day, period):
+        """Rebuild the current placement for an arbitrary time.
+
+        Args:
+            day: Game day
+            period: Time period
+        """
+        self.day = day
+        self.period = period
+        # location -> {npc: None}; dicts keep arrival order and remove in O(1)
+        self.present = {
+            key: dict.fromkeys(npcs)
+            for (key, slot), npcs in self.by_period.items()
+            if slot == period
+        }
+        self.listed = {}  # location -> list view of present, built on demand
+        self.where = {}
+        for npc in self.day_specific.get((day, period), ()):
+            self._move(
+                npc, self.schedules[npc].get(period), self.location_of(npc, day, period)
+            )
+        for npc in self.schedules:
+            self.where[npc] = self.location_of(npc, day, period)
+
+    def advance(self, day, period):
+        """Move NPCs to their places at a new time.
+
+        Stepping to the next period only moves the NPCs listed for that
+        transition or with day-specific entries; any other jump rebuilds.
+
+        Args:
+            day: New game day
+            period: New time period
+
+        Returns:
+            set: Location keys whose NPCs changed
+        """
+        if (day, period) == (self.day, self.period):
+            return set()
+
+        candidates = self.movers.get((self.period, period))
+        next_day = self.day + 1 if period == TIME_PERIODS[0] else self.day
+        if candidates is None or day != next_day:
+            before = {key: list(npcs) for key, npcs in self.present.items() if npcs}
+            self.reset(day, period)
+            after = {key: list(npcs) for key, npcs in self.present.items() if npcs}
+            return {
+                key
+                for key in set(before) | set(after)
+                if before.get(key) != after.get(key)
+            }
+
+        # dict.fromkeys dedupes while keeping a stable arrival order
+        candidates = dict.fromkeys(
+            candidates
+            + self.day_specific.get((self.day, self.period), [])
+            + self.day_specific.get((day, period), [])
+        )
+        self.day = day
+        self.period = period
+
+        changed = set()
+        for npc in candidates:
+            old = self.where.get(npc)
+            new = self.location_of(npc, day, period)
+            if old != new:
+                self._move(npc, old, new)
+                self.where[npc] = new
+                changed.update(key for key in (old, new) if key is not None)
+        return changed
+
+    def npcs_at(self, location_key):
+        """Get the NPCs at a location right now.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            list: NPC names (do not mutate)
+        """
+        listed = self.listed.get(location_key)
+        if listed is None:
+            listed = list(self.present.get(location_key, ()))
+            self.listed[location_key] = listed
+        return listed
+
+    def locate(self, npc):
+        """Get where a scheduled NPC is right now.
+
+        Args:
+            npc: NPC name
+
+        Returns:
+            str or None: Location key
+        """
+        return self.where.get(npc)
+
+    def _move(self, npc, old, new):
+        """Move an NPC between location lists.
+
+        Args:
+            npc: NPC name
+            old: Location key the NPC leaves (or None)
+            new: Location key the NPC enters (or None)
+        """
+        if old is not None:
+            self.present.get(old, {}).pop(npc, None)
+            self.listed.pop(old, None)
+        if new is not None:
+            self.present.setdefault(new, {})[npc] = None
+            self.listed.pop(new, None)
+
+    def check_consistency(self, relationships, dialogue_manager):
+        """Cross-check the schedules against the other NPC systems.
+
+        Args:
+            relationships: RelationshipManager
+            dialogue_manager: DialogueManager
+
+        Returns:
+            list: Problem descriptions (empty when consistent)
+        """
+        problems = []
+        for npc, schedule in self.schedules.items():
+            for location in schedule.values():
+                if location is not None and location not in self.locations:
+                    problems.append(
+                        f"{npc} is scheduled at unknown location '{location}'"
+                    )
+            missing = [p for p in TIME_PERIODS if p not in schedule]
+            if missing:
+                problems.append(f"{npc} has no schedule for: {', '.join(missing)}")
+
+        placements = {}
+        for key, npcs in self.static.items():
+            for npc in npcs:
+                placements.setdefault(npc, []).append(key)
+        for npc, keys in placements.items():
+            if len(keys) > 1:
+                problems.append(
+                    f"{npc} is placed in several locations: {', '.join(keys)}"
+                )
+
+        for npc in self.roster:
+            if relationships.get_relationship(npc) is None:
+                problems.append(f"{npc} has no relationship entry")
+        for npc in relationships.relationships:
+            if npc not in self.roster:
+                problems.append(f"{npc} has a relationship but never appears")
+        for npc in dialogue_manager.trees:
+            if npc not in self.roster:
+                problems.append(f"{npc} has dialogue but never appears")
+        return problems
+
+
+if __name__ == "__main__":
+    from src.dialogue_system import DialogueManager
+    from src.relationships import RelationshipManager
+
+    issues = PresenceIndex().check_consistency(RelationshipManager(), DialogueManager())
+    for issue in issues:
+        print(f"⚠️  {issue}")
+    if not issues:
+        print("✅ NPC schedules are consistent")
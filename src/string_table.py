@@ -0,0 +1,126 @@
+"""
+String Table - Read-only text store memory-mapped from a binary file
+
+Layout (little-endian):
+    magic        8 bytes  b"COSSTR1\\0"
+    stamp       64 bytes  ASCII fingerprint of the sources it was built from
+    count        uint32   number of strings
+    keys_size    uint32   size of the key block
+    offsets      count x (uint32 offset, uint32 length) into the text block
+    keys         keys_size bytes, UTF-8 keys separated by newlines
+    text         UTF-8 strings back to back
+
+Processes that map the same file share one physical copy through the
+page cache; each string is only decoded when it is first asked for.
+Only the examine, NPC description and dialogue tables are stored here
+so far; the game still imports the modules holding the rest of its text.
+"""
+
+import mmap
+import struct
+from pathlib import Path
+
+MAGIC = b"COSSTR1\0"
+STAMP_SIZE = 64
+HEADER = struct.Struct(f"<{len(MAGIC)}s{STAMP_SIZE}sII")
+ENTRY = struct.Struct("<II")
+
+
+def write_string_table(path, strings, stamp=""):
+    """Write a string table file.
+
+    Args:
+        path: Output file
+        strings: Dict of key to text (keys must not contain newlines)
+        stamp: Fingerprint stored in the header (up to 64 ASCII characters)
+    """
+    keys = list(strings)
+    encoded = [strings[key].encode("utf-8") for key in keys]
+    key_block = "\n".join(keys).encode("utf-8")
+
+    parts = [HEADER.pack(MAGIC, stamp.encode("ascii"), len(keys), len(key_block))]
+    offset = 0
+    for data in encoded:
+        parts.append(ENTRY.pack(offset, len(data)))
+        offset += len(data)
+    parts.append(key_block)
+    parts.extend(encoded)
+
+    path = Path(path)
+    temporary = path.with_suffix(".tmp")
+    temporary.write_bytes(b"".join(parts))
+    temporary.replace(path)
+
+
+class StringTable:
+    """Lazily decoded view of a string table file."""
+
+    def __init__(self, path):
+        """Map a string table file.
+
+        Args:
+            path: String table file
+
+        Raises:
+            ValueError: If the file is not a string table
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, stamp, count, keys_size = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a string table")
+        self.stamp = stamp.rstrip(b"\0").decode("ascii")
+
+        self._entries = HEADER.size
+        keys_start = self._entries + count * ENTRY.size
+        self._text = keys_start + keys_size
+        keys = self._map[keys_start : self._text].decode("utf-8")
+        self._index = (
+            {key: i for i, key in enumerate(keys.split("\n"))} if count else {}
+        )
+        self._decoded = {}
+
+    def __len__(self):
+        """Number of strings."""
+        return len(self._index)
+
+    def __contains__(self, key):
+        """Check whether a key is stored."""
+        return key in self._index
+
+    def get(self, key, default=None):
+        """Get a string, decoding it on first use.
+
+        Args:
+            key: String key
+            default: Returned when the key is missing
+
+        Returns:
+            str: Text
+        """
+        text = self._decoded.get(key)
+        if text is None:
+            i = self._index.get(key)
+            if i is None:
+                return default
+            offset, length = ENTRY.unpack_from(
+                self._map, self._entries + i * ENTRY.size
+            )
+            start = self._text + offset
+            text = self._map[start : start + length].decode("utf-8")
+            self._decoded[key] = text
+        return text
+
+    def __getitem__(self, key):
+        """Get a string, raising KeyError when it is missing."""
+        text = self.get(key)
+        if text is None:
+            raise KeyError(key)
+        return text
+
+    def close(self):
+        """Unmap the file."""
+        self._decoded.clear()
+        self._map.close()
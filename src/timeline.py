@@ -0,0 +1,310 @@
+"""
+Timeline - Who was where, and when, on the day of the murder
+
+Alibi claims, witness sightings and events are time intervals indexed
+both by location and by person. Each index keeps its intervals sorted
+by start time with a max-end tree over them, so an overlap query costs
+O(log n) plus the number of matches. New intervals wait in a small
+buffer that is scanned directly until it is big enough to fold in.
+"""
+
+import bisect
+
+from src.utils import format_clock
+
+# Buffered intervals that trigger a rebuild of the sorted index
+REBUILD_THRESHOLD = 256
+
+# Kinds of timeline record
+CLAIM = "claim"  # What a suspect says; not evidence by itself
+SIGHTING = "sighting"  # Confirmed by a witness or a log
+EVENT = "event"
+
+
+class TimelineRecord:
+    """One interval on the timeline."""
+
+    __slots__ = ("end", "kind", "location", "source", "start", "subject")
+
+    def __init__(self, start, end, kind, subject, location, source=None):
+        """Initialize a record.
+
+        Args:
+            start: Start in minutes after midnight
+            end: End in minutes after midnight (equal to start for a moment)
+            kind: CLAIM, SIGHTING or EVENT
+            subject: Person the record is about (or the event's name)
+            location: Location key
+            source: Witness or log that backs the record
+        """
+        self.start = start
+        self.end = end
+        self.kind = kind
+        self.subject = subject
+        self.location = location
+        self.source = source
+
+    def span(self):
+        """Format the interval as clock times.
+
+        Returns:
+            str: "14:00–17:00", or "14:30" for a moment
+        """
+        if self.start == self.end:
+            return format_clock(self.start)
+        return f"{format_clock(self.start)}–{format_clock(self.end)}"
+
+
+class IntervalIndex:
+    """Overlap queries over a growing set of intervals."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._records = []  # Sorted by start
+        self._starts = []
+        self._tree = []  # Max end per node, leaves hold the sorted records
+        self._size = 0
+        self._pending = []
+
+    def __len__(self):
+        """Number of intervals."""
+        return len(self._records) + len(self._pending)
+
+    def add(self, record):
+        """Add an interval.
+
+        Args:
+            record: TimelineRecord
+        """
+        self._pending.append(record)
+        if len(self._pending) >= REBUILD_THRESHOLD:
+            self._rebuild()
+
+    def extend(self, records):
+        """Add many intervals with a single rebuild.
+
+        Args:
+            records: TimelineRecords
+        """
+        self._pending.extend(records)
+        if len(self._pending) >= REBUILD_THRESHOLD:
+            self._rebuild()
+
+    def _rebuild(self):
+        """Fold the buffered intervals into the sorted index."""
+        # The existing records are one sorted run, so this sort is mostly a merge
+        merged = self._records + self._pending
+        merged.sort(key=lambda r: (r.start, r.end))
+        self._records = merged
+        self._pending = []
+        self._starts = [r.start for r in merged]
+
+        size = 1
+        while size < len(merged):
+            size *= 2
+        tree = [-1] * (2 * size)
+        for k, record in enumerate(merged):
+            tree[size + k] = record.end
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._tree = tree
+        self._size = size
+
+    def overlapping(self, start, end):
+        """Find intervals that overlap a window (inclusive at both ends).
+
+        Args:
+            start: Window start in minutes
+            end: Window end in minutes
+
+        Returns:
+            list: Matching records sorted by start
+        """
+        found = []
+        # Only records starting by the window's end can overlap; among
+        # those, descend into subtrees whose latest end reaches the window
+        limit = bisect.bisect_right(self._starts, end)
+        if limit:
+            tree, size = self._tree, self._size
+            stack = [(1, 0, size)]
+            while stack:
+                node, lo, hi = stack.pop()
+                if lo >= limit or tree[node] < start:
+                    continue
+                if hi - lo == 1:
+                    found.append(self._records[lo])
+                    continue
+                mid = (lo + hi) // 2
+                stack.append((2 * node + 1, mid, hi))
+                stack.append((2 * node, lo, mid))
+        extra = [r for r in self._pending if r.start <= end and r.end >= start]
+        if extra:
+            found = sorted(found + extra, key=lambda r: (r.start, r.end))
+        return found
+
+
+class Timeline:
+    """Timeline of the murder day indexed by location and by person."""
+
+    def __init__(self):
+        """Initialize an empty timeline."""
+        self.by_location = {}
+        self.by_subject = {}
+
+    def add(self, start, end, kind, subject, location, source=None):
+        """Add a record.
+
+        Args:
+            start: Start in minutes after midnight
+            end: End in minutes after midnight
+            kind: CLAIM, SIGHTING or EVENT
+            subject: Person the record is about (or the event's name)
+            location: Location key
+            source: Witness or log that backs the record
+
+        Returns:
+            TimelineRecord: The new record
+
+        Raises:
+            ValueError: If the interval ends before it starts
+        """
+        if end < start:
+            raise ValueError(f"{subject} at {location}: interval ends before it starts")
+        record = TimelineRecord(start, end, kind, subject, location, source)
+        self.by_location.setdefault(location, IntervalIndex()).add(record)
+        self.by_subject.setdefault(subject, IntervalIndex()).add(record)
+        return record
+
+    def extend(self, rows, kind, source=None):
+        """Add many records of one kind, rebuilding each index once.
+
+        Args:
+            rows: (start, end, subject, location) tuples
+            kind: CLAIM, SIGHTING or EVENT
+            source: Witness or log that backs them
+
+        Raises:
+            ValueError: If an interval ends before it starts
+        """
+        by_location = {}
+        by_subject = {}
+        for start, end, subject, location in rows:
+            if end < start:
+                raise ValueError(
+                    f"{subject} at {location}: interval ends before it starts"
+                )
+            record = TimelineRecord(start, end, kind, subject, location, source)
+            by_location.setdefault(location, []).append(record)
+            by_subject.setdefault(subject, []).append(record)
+        for location, records in by_location.items():
+            self.by_location.setdefault(location, IntervalIndex()).extend(records)
+        for subject, records in by_subject.items():
+            self.by_subject.setdefault(subject, IntervalIndex()).extend(records)
+
+    def at(self, location, start, end):
+        """Get the records at a location that overlap a window.
+
+        Args:
+            location: Location key
+            start: Window start in minutes
+            end: Window end in minutes
+
+        Returns:
+            list: Records sorted by start
+        """
+        index = self.by_location.get(location)
+        return index.overlapping(start, end) if index else []
+
+    def of(self, subject, start, end):
+        """Get the records about a person that overlap a window.
+
+        Args:
+            subject: Person's name
+            start: Window start in minutes
+            end: Window end in minutes
+
+        Returns:
+            list: Records sorted by start
+        """
+        index = self.by_subject.get(subject)
+        return index.overlapping(start, end) if index else []
+
+    def present(self, locations, start, end):
+        """Find who was confirmed at any of some locations during a window.
+
+        Args:
+            locations: Location keys
+            start: Window start in minutes
+            end: Window end in minutes
+
+        Returns:
+            list: Sighting records sorted by start
+        """
+        found = []
+        for location in locations:
+            found += [r for r in self.at(location, start, end) if r.kind == SIGHTING]
+        return sorted(found, key=lambda r: (r.start, r.end))
+
+    def coverage(self, subject, start, end, exclude=()):
+        """Get the parts of a window in which a person's whereabouts are confirmed.
+
+        Args:
+            subject: Person's name
+            start: Window start in minutes
+            end: Window end in minutes
+            exclude: Location keys whose sightings do not count
+
+        Returns:
+            list: Merged (start, end) intervals clipped to the window
+        """
+        merged = []
+        for record in self.of(subject, start, end):
+            if record.kind != SIGHTING or record.location in exclude:
+                continue
+            lo, hi = max(record.start, start), min(record.end, end)
+            if merged and lo <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+            else:
+                merged.append((lo, hi))
+        return merged
+
+    def gaps(self, subject, start, end, exclude=()):
+        """Get the parts of a window in which a person is unaccounted for.
+
+        Args:
+            subject: Person's name
+            start: Window start in minutes
+            end: Window end in minutes
+            exclude: Location keys whose sightings do not count
+
+        Returns:
+            list: (start, end) intervals with no confirmed whereabouts
+        """
+        gaps = []
+        cursor = start
+        for lo, hi in self.coverage(subject, start, end, exclude):
+            if lo > cursor:
+                gaps.append((cursor, lo))
+            cursor = max(cursor, hi)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def unaccounted(self, subjects, start, end, exclude=()):
+        """Find the people who cannot be placed elsewhere during a window.
+
+        Args:
+            subjects: Names to check
+            start: Window start in minutes
+            end: Window end in minutes
+            exclude: Location keys whose sightings do not count
+
+        Returns:
+            list: (name, gaps) tuples for everyone with a gap
+        """
+        found = []
+        for subject in subjects:
+            gaps = self.gaps(subject, start, end, exclude)
+            if gaps:
+                found.append((subject, gaps))
+        return found
@@ -0,0 +1,527 @@
+"""
+Transit - Weighted walkway, strip and expressway routing with time costs
+"""
+
+import heapq
+from itertools import pairwise
+
+from src.locations import LOCATIONS
+from src.procgen import SECTOR_GATES, parse_room_key, room_key
+
+WALK_MINUTES = 5  # Minutes to walk along one location exit
+WITNESS_SETTLE_LIMIT = 60  # Nodes a witness search may settle
+SECTOR_SETTLE_LIMIT = 5000  # Sector rooms a walk through the sectors may settle
+INFINITY = float("inf")
+
+# Moving strips: (location, location, minutes), ridden in both directions
+STRIPS = [
+    ("corridor_residential", "central_plaza", 2),
+    ("central_plaza", "administrative_section", 2),
+    ("central_plaza", "police_headquarters", 2),
+]
+
+# Expressway lines: name -> ordered (station, minutes from previous station)
+EXPRESSWAYS = {
+    "Spacetown Expressway": [
+        ("corridor_residential", 0),
+        ("central_plaza", 4),
+        ("spacetown", 12),
+    ],
+}
+
+
+class TransitGraph:
+    """Directed graph of travel times routed with a contraction hierarchy.
+
+    ``prepare()`` contracts nodes one at a time (cheapest first, by edge
+    difference), adding shortcut edges where a node lay on the only
+    shortest path between two of its neighbors. A query is then two small
+    Dijkstra searches that only climb towards more important nodes and
+    meet in the middle; shortcuts are unpacked back into the original
+    walk, strip and expressway legs.
+
+    Routes are exact. The City and the sector walks stay small, so a
+    query takes microseconds here. The graph is not built for
+    continent-sized maps: on a 100k-node grid with expressway rows,
+    contraction takes minutes and a query several milliseconds, nearly
+    all of it in the search itself.
+    """
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self.keys = []  # id -> location key
+        self.index = {}  # location key -> id
+        self.legs = {}  # (id, id) -> (minutes, mode, label) of the fastest edge
+        self.up = []  # id -> [(higher-ranked neighbor, minutes)]
+        self.down = []  # id -> [(higher-ranked node with an edge here, minutes)]
+        self.middle = {}  # shortcut (id, id) -> contracted node it bypasses
+        self.prepared = False
+
+    def add_node(self, key):
+        """Add a node if it is not present yet.
+
+        Args:
+            key: Location key
+
+        Returns:
+            int: Node id
+        """
+        node = self.index.get(key)
+        if node is None:
+            node = len(self.keys)
+            self.index[key] = node
+            self.keys.append(key)
+            self.prepared = False
+        return node
+
+    def add_edge(self, source, target, minutes, mode="walk", label=""):
+        """Add a directed edge; parallel edges keep the fastest one.
+
+        Args:
+            source: Location key the edge leaves from
+            target: Location key the edge leads to
+            minutes: Travel time
+            mode: "walk", "strip" or "expressway"
+            label: Exit or line name shown in directions
+        """
+        a = self.add_node(source)
+        b = self.add_node(target)
+        if a != b and minutes < self.legs.get((a, b), (INFINITY,))[0]:
+            self.legs[(a, b)] = (minutes, mode, label)
+            self.prepared = False
+
+    def prepare(self):
+        """Contract the graph and build the upward search graphs.
+
+        Called automatically by route() after the graph changes.
+        """
+        count = len(self.keys)
+        out_edges = [{} for _ in range(count)]
+        in_edges = [{} for _ in range(count)]
+        for (a, b), (minutes, _, _) in self.legs.items():
+            out_edges[a][b] = minutes
+            in_edges[b][a] = minutes
+
+        contracted = [False] * count
+        deleted_neighbors = [0] * count
+        rank = [0] * count
+        self.middle = {}
+
+        def witness_distances(source, skip, limit, targets):
+            # Bounded Dijkstra that ignores the node being contracted
+            distances = {source: 0}
+            heap = [(0, source)]
+            remaining = set(targets)
+            settled = 0
+            while heap and remaining:
+                distance, node = heapq.heappop(heap)
+                if distance > distances[node]:
+                    continue
+                remaining.discard(node)
+                settled += 1
+                if distance > limit or settled > WITNESS_SETTLE_LIMIT:
+                    break
+                for neighbor, minutes in out_edges[node].items():
+                    if neighbor == skip or contracted[neighbor]:
+                        continue
+                    candidate = distance + minutes
+                    if candidate < distances.get(neighbor, INFINITY):
+                        distances[neighbor] = candidate
+                        heapq.heappush(heap, (candidate, neighbor))
+            return distances
+
+        def contract(node, apply):
+            # Returns the edge difference of contracting the node
+            incoming = [(u, m) for u, m in in_edges[node].items() if not contracted[u]]
+            outgoing = [(w, m) for w, m in out_edges[node].items() if not contracted[w]]
+            shortcuts = 0
+            if outgoing:
+                longest = max(m for _, m in outgoing)
+                for u, to_node in incoming:
+                    witnesses = witness_distances(
+                        u, node, to_node + longest, [w for w, _ in outgoing]
+                    )
+                    for w, from_node in outgoing:
+                        via = to_node + from_node
+                        if w == u or witnesses.get(w, INFINITY) <= via:
+                            continue
+                        shortcuts += 1
+                        if apply and via < out_edges[u].get(w, INFINITY):
+                            out_edges[u][w] = via
+                            in_edges[w][u] = via
+                            self.middle[(u, w)] = node
+            return shortcuts - len(incoming) - len(outgoing)
+
+        def priority(node):
+            return contract(node, False) + deleted_neighbors[node]
+
+        # Lazy updates: a popped node is re-queued if its priority went up
+        queue = [(priority(node), node) for node in range(count)]
+        heapq.heapify(queue)
+        level = 0
+        while queue:
+            _, node = heapq.heappop(queue)
+            if contracted[node]:
+                continue
+            current = priority(node)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, node))
+                continue
+            contract(node, True)
+            contracted[node] = True
+            rank[node] = level
+            level += 1
+            for neighbor in set(out_edges[node]) | set(in_edges[node]):
+                if not contracted[neighbor]:
+                    deleted_neighbors[neighbor] += 1
+
+        self.up = [[] for _ in range(count)]
+        self.down = [[] for _ in range(count)]
+        for a in range(count):
+            for b, minutes in out_edges[a].items():
+                if rank[a] < rank[b]:
+                    self.up[a].append((b, minutes))
+                else:
+                    self.down[b].append((a, minutes))
+        self.prepared = True
+
+    def route(self, source_key, target_key):
+        """Find the fastest route between two locations.
+
+        Args:
+            source_key: Starting location key
+            target_key: Destination location key
+
+        Returns:
+            tuple or None: (total minutes, legs) where legs is a list of
+            (mode, label, location key, minutes), or None if unreachable
+        """
+        source = self.index.get(source_key)
+        target = self.index.get(target_key)
+        if source is None or target is None:
+            return None
+        if source == target:
+            return 0, []
+        if not self.prepared:
+            self.prepare()
+
+        best, meeting, forward_parents, backward_parents = self._search(source, target)
+        if meeting is None:
+            return None
+
+        # Rebuild the chain of (possibly shortcut) edges through the meeting node
+        chain = []
+        node = meeting
+        while node != source:
+            parent = forward_parents[node]
+            chain.append((parent, node))
+            node = parent
+        chain.reverse()
+        node = meeting
+        while node != target:
+            child = backward_parents[node]
+            chain.append((node, child))
+            node = child
+
+        legs = []
+        for edge in chain:
+            for a, b in self._unpack(edge):
+                minutes, mode, label = self.legs[(a, b)]
+                legs.append((mode, label, self.keys[b], minutes))
+        return best, legs
+
+    def _search(self, source, target):
+        """Run the bidirectional upward search.
+
+        Each side stops once its queue cannot improve the best meeting
+        point. Nodes reachable more cheaply from a higher-ranked node are
+        stalled (not expanded), since no shortest path passes through them.
+
+        Args:
+            source: Source node id
+            target: Target node id
+
+        Returns:
+            tuple: (minutes, meeting node or None, forward parents,
+            backward parents)
+        """
+        up, down = self.up, self.down
+        pop, push = heapq.heappop, heapq.heappush
+        forward, backward = {source: 0}, {target: 0}
+        forward_parents, backward_parents = {}, {}
+        forward_heap, backward_heap = [(0, source)], [(0, target)]
+        best, meeting = INFINITY, None
+
+        while forward_heap or backward_heap:
+            if forward_heap:
+                distance, node = pop(forward_heap)
+                if distance >= best:
+                    forward_heap = []
+                elif distance <= forward[node]:
+                    other = backward.get(node)
+                    if other is not None and distance + other < best:
+                        best, meeting = distance + other, node
+                    for higher, minutes in down[node]:
+                        reached = forward.get(higher)
+                        if reached is not None and reached + minutes < distance:
+                            break
+                    else:
+                        for neighbor, minutes in up[node]:
+                            candidate = distance + minutes
+                            if candidate < forward.get(neighbor, INFINITY):
+                                forward[neighbor] = candidate
+                                forward_parents[neighbor] = node
+                                push(forward_heap, (candidate, neighbor))
+
+            if backward_heap:
+                distance, node = pop(backward_heap)
+                if distance >= best:
+                    backward_heap = []
+                elif distance <= backward[node]:
+                    other = forward.get(node)
+                    if other is not None and distance + other < best:
+                        best, meeting = distance + other, node
+                    for higher, minutes in up[node]:
+                        reached = backward.get(higher)
+                        if reached is not None and reached + minutes < distance:
+                            break
+                    else:
+                        for neighbor, minutes in down[node]:
+                            candidate = distance + minutes
+                            if candidate < backward.get(neighbor, INFINITY):
+                                backward[neighbor] = candidate
+                                backward_parents[neighbor] = node
+                                push(backward_heap, (candidate, neighbor))
+
+        return best, meeting, forward_parents, backward_parents
+
+    def _unpack(self, edge):
+        """Expand a possibly-shortcut edge into original edges.
+
+        Args:
+            edge: (id, id) pair
+
+        Returns:
+            list: Original (id, id) edges in travel order
+        """
+        edges = []
+        stack = [edge]
+        while stack:
+            a, b = stack.pop()
+            node = self.middle.get((a, b))
+            if node is None:
+                edges.append((a, b))
+            else:
+                stack.append((node, b))
+                stack.append((a, node))
+        return edges
+
+
+def build_city_network(locations=None):
+    """Build the transit graph for the city.
+
+    Every location exit is a walking edge; strips and expressway segments
+    are added in both directions.
+
+    Args:
+        locations: Dict of location key to Location (defaults to LOCATIONS)
+
+    Returns:
+        TransitGraph: Prepared graph
+    """
+    locations = LOCATIONS if locations is None else locations
+    graph = TransitGraph()
+    for key, location in locations.items():
+        graph.add_node(key)
+        for exit_name, target in location.exits.items():
+            if target in locations:
+                graph.add_edge(key, target, WALK_MINUTES, "walk", exit_name)
+
+    for a, b, minutes in STRIPS:
+        graph.add_edge(a, b, minutes, "strip", "strip")
+        graph.add_edge(b, a, minutes, "strip", "strip")
+
+    for line, stations in EXPRESSWAYS.items():
+        for (a, _), (b, minutes) in pairwise(stations):
+            graph.add_edge(a, b, minutes, "expressway", line)
+            graph.add_edge(b, a, minutes, "expressway", line)
+
+    graph.prepare()
+    return graph
+
+
+def merge_legs(legs):
+    """Combine consecutive legs on the same strip or expressway line.
+
+    Args:
+        legs: List of (mode, label, location key, minutes)
+
+    Returns:
+        list: Legs with consecutive rides merged
+    """
+    merged = []
+    for mode, label, key, minutes in legs:
+        if merged and mode != "walk" and merged[-1][:2] == (mode, label):
+            _, _, _, previous_minutes = merged[-1]
+            merged[-1] = (mode, label, key, previous_minutes + minutes)
+        else:
+            merged.append((mode, label, key, minutes))
+    return merged
+
+
+def walk_route(world, source, target, limit=SECTOR_SETTLE_LIMIT):
+    """Find the shortest walk between two rooms of the procedural sectors.
+
+    An A* search over the session's live exits, guided by the distance
+    on the sector grid, which never overestimates the walk. The sectors
+    are unbounded, so the search gives up after settling ``limit`` rooms.
+
+    Args:
+        world: WorldState
+        source: Starting sector room key
+        target: Destination sector room key
+        limit: Most rooms to settle
+
+    Returns:
+        tuple or None: (total minutes, legs) as TransitGraph.route returns
+    """
+    goal = parse_room_key(target)
+    if goal is None or parse_room_key(source) is None:
+        return None
+
+    def estimate(key):
+        x, y = parse_room_key(key)
+        return abs(x - goal[0]) + abs(y - goal[1])
+
+    hops = {source: 0}
+    parents = {}
+    heap = [(estimate(source), 0, source)]
+    settled = 0
+    while heap:
+        _, distance, key = heapq.heappop(heap)
+        if key == target:
+            break
+        if distance > hops[key]:
+            continue
+        settled += 1
+        if settled > limit:
+            return None
+        for exit_name, neighbor in world.exits_at(key).items():
+            if parse_room_key(neighbor) is None:
+                continue  # Gates back into the City are taken by route_in_world
+            if distance + 1 < hops.get(neighbor, INFINITY):
+                hops[neighbor] = distance + 1
+                parents[neighbor] = (key, exit_name)
+                estimated = distance + 1 + estimate(neighbor)
+                heapq.heappush(heap, (estimated, distance + 1, neighbor))
+    else:
+        return None
+
+    legs = []
+    key = target
+    while key != source:
+        parent, exit_name = parents[key]
+        legs.append(("walk", exit_name, key, WALK_MINUTES))
+        key = parent
+    legs.reverse()
+    return hops[target] * WALK_MINUTES, legs
+
+
+def _sector_gates(world):
+    """List the gates between the authored City and the sectors.
+
+    Args:
+        world: WorldState
+
+    Yields:
+        tuple: (authored location key, exit into the sectors, gate room
+        key, exit back out of the gate room)
+    """
+    for location_key, (exit_name, coords) in SECTOR_GATES.items():
+        if location_key not in world.locations:
+            continue
+        gate = room_key(*coords)
+        for back_exit, target in world.exits_at(gate).items():
+            if target == location_key:
+                yield location_key, exit_name, gate, back_exit
+                break
+
+
+def _join(*routes):
+    """Chain routes end to end.
+
+    Args:
+        *routes: (minutes, legs) tuples or None
+
+    Returns:
+        tuple or None: Combined route, or None if any part is missing
+    """
+    if any(route is None for route in routes):
+        return None
+    minutes = sum(minutes for minutes, _ in routes)
+    return minutes, [leg for _, legs in routes for leg in legs]
+
+
+def route_in_world(world, source, target, network=None):
+    """Find the fastest route over a session's world, sectors included.
+
+    Trips between authored locations use the city network. A trip that
+    starts or ends in the procedural sectors walks through them and
+    crosses into the City at a sector gate.
+
+    Args:
+        world: WorldState
+        source: Starting location key
+        target: Destination location key
+        network: TransitGraph of the authored locations (defaults to the
+            shared city network)
+
+    Returns:
+        tuple or None: (total minutes, legs) as TransitGraph.route returns
+    """
+    network = get_city_network() if network is None else network
+    from_sectors = world.is_generated(source)
+    to_sectors = world.is_generated(target)
+    if not from_sectors and not to_sectors:
+        return network.route(source, target)
+    if from_sectors and to_sectors:
+        return walk_route(world, source, target)
+
+    best = None
+    for city_key, into_sectors, gate, out_of_sectors in _sector_gates(world):
+        if from_sectors:
+            route = _join(
+                walk_route(world, source, gate),
+                (WALK_MINUTES, [("walk", out_of_sectors, city_key, WALK_MINUTES)]),
+                network.route(city_key, target),
+            )
+        else:
+            route = _join(
+                network.route(source, city_key),
+                (WALK_MINUTES, [("walk", into_sectors, gate, WALK_MINUTES)]),
+                walk_route(world, gate, target),
+            )
+        if route is not None and (best is None or route[0] < best[0]):
+            best = route
+    return best
+
+
+_city_network = None
+
+
+def get_city_network():
+    """Get the shared city transit graph, building it on first use.
+
+    Returns:
+        TransitGraph
+    """
+    global _city_network
+    if _city_network is None:
+        _city_network = build_city_network()
+    return _city_network
+
+
+def reset_city_network():
+    """Drop the shared graph so it is rebuilt from the current locations."""
+    global _city_network
+    _city_network = None
@@ -2,6 +2,7 @@
 Utility functions for the game
 """
 
+import copy
 import os
 import sys
 
@@ -49,3 +50,128 @@ def slow_print(text, delay=0.05):
         sys.stdout.flush()
         time.sleep(delay)
     print()
+
+
+def clock_minutes(text):
+    """Convert a 24-hour clock time to minutes after midnight.
+
+    Args:
+        text: Time such as "14:45"
+
+    Returns:
+        int: Minutes after midnight
+    """
+    hours, minutes = text.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def format_clock(minutes):
+    """Format minutes after midnight as a 24-hour clock time.
+
+    Args:
+        minutes: Minutes after midnight
+
+    Returns:
+        str: Time such as "14:45"
+    """
+    return f"{minutes // 60 % 24:02d}:{minutes % 60:02d}"
+
+
+class Versioned:
+    """Mixin that keeps a cheap mutation counter in ``version``.
+
+    Every attribute assignment bumps the counter. In-place changes to
+    containers (dict/list/set attributes) must call ``touch()``.
+    """
+
+    version = 0
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "version", self.version + 1)
+
+    def touch(self):
+        """Record an in-place mutation."""
+        object.__setattr__(self, "version", self.version + 1)
+
+
+class CopyOnWrite:
+    """Mixin for session objects that can be forked cheaply.
+
+    ``fork()`` returns a new object sharing every attribute with this one.
+    The containers named in ``COW_FIELDS`` are then borrowed by both, so
+    code that changes one in place first calls ``own(name)``, which copies
+    it the first time. Containers whose values are themselves changed in
+    place are also listed in ``COW_ITEMS``; ``own_item(name, key)`` copies
+    a single value on its first write. Subsystems in ``FORK_FIELDS`` are
+    forked along with the object.
+    """
+
+    COW_FIELDS = ()
+    COW_ITEMS = ()
+    FORK_FIELDS = ()
+    _borrowed = None  # Field -> container as it was at the last fork
+    _copied = None  # Item field -> keys copied since the last fork
+
+    def fork(self):
+        """Make a copy-on-write fork.
+
+        Returns:
+            Same type: Fork sharing all unchanged state with this object
+        """
+        clone = object.__new__(type(self))
+        state = self.__dict__
+        clone_state = clone.__dict__
+        clone_state.update(state)
+        # Bookkeeping goes straight into __dict__ so Versioned objects
+        # do not count it as a change
+        if self.COW_FIELDS:
+            borrowed = {name: state[name] for name in self.COW_FIELDS}
+            state["_borrowed"] = clone_state["_borrowed"] = borrowed
+        if self.COW_ITEMS:
+            state["_copied"] = {}
+            clone_state["_copied"] = {}
+        for name in self.FORK_FIELDS:
+            subsystem = state[name]
+            if subsystem is not None:
+                clone_state[name] = subsystem.fork()
+        return clone
+
+    def own(self, name):
+        """Get a container for writing, copying it if it is borrowed.
+
+        Args:
+            name: Attribute name from COW_FIELDS
+
+        Returns:
+            Container owned by this object alone
+        """
+        value = self.__dict__[name]
+        borrowed = self._borrowed
+        if borrowed is not None and borrowed.get(name) is value:
+            value = copy.copy(value)
+            self.__dict__[name] = value
+        return value
+
+    def own_item(self, name, key):
+        """Get a value of a container for writing, copying it if it is shared.
+
+        Args:
+            name: Attribute name from COW_ITEMS
+            key: Key or index of the value
+
+        Returns:
+            Value owned by this object alone
+        """
+        container = self.own(name)
+        value = container[key]
+        copied = self._copied
+        if copied is not None:
+            keys = copied.get(name)
+            if keys is None:
+                keys = copied[name] = set()
+            if key not in keys:
+                value = copy.copy(value)
+                container[key] = value
+                keys.add(key)
+        return value
@@ -0,0 +1,351 @@
+"""
+Walkthroughs - The shortest command sequence that reaches each ending
+
+A bounded breadth-first search plays real sessions: every candidate
+command goes through a GameEngine just as if a player had typed it, and
+a session that lands in a state already seen is dropped. Each command is
+tried on a copy-on-write fork of the session it follows, so branching
+costs only the state the command changes.
+
+Results are cached per ruleset (the game's code and content) and case,
+so they are only searched again when either changes. From the command line:
+    python -m src.walkthrough [--case SEED] [--refresh] [--play ENDING]
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+from collections import deque
+from pathlib import Path
+
+from src.content import SOURCE_DIR, START_LOCATION, get_content
+from src.crowd import CrowdManager
+from src.game_engine import GameEngine
+from src.game_state import GameState
+from src.player import Player
+from src.save_system import SaveSystem
+
+WALKTHROUGH_FORMAT = 2
+# Walkthroughs can always be searched again, so they live in the user's
+# cache directory rather than beside their saves
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "caves_of_steel"
+    / "walkthroughs"
+)
+
+# Search bounds: commands in one walkthrough, and distinct states visited
+MAX_DEPTH = 24
+MAX_STATES = 4000
+
+
+def _engine(case=None):
+    """Set up a game the way main.py does.
+
+    Args:
+        case: Generated case dict, or None for the novel's case
+
+    Returns:
+        GameEngine: Engine before the opening events
+    """
+    player = Player("Elijah Baley", starting_location=START_LOCATION)
+    return GameEngine(player, GameState(case=case), SaveSystem.DEFAULT_SAVE_DIR)
+
+
+def new_session(case=None):
+    """Start a game with output swallowed and no ambient crowds.
+
+    The crowds take most of the time of a turn and the game runs the
+    same without them, as it does when NumPy is missing.
+
+    Args:
+        case: Generated case dict, or None for the novel's case
+
+    Returns:
+        GameEngine: Engine after the opening events
+    """
+    engine = _engine(case)
+    engine.game_state.world.crowds = CrowdManager(venues={})
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine._check_for_events()
+    return engine
+
+
+def play(engine, command):
+    """Run one command as the game loop would.
+
+    Args:
+        engine: GameEngine
+        command: Command string
+
+    Returns:
+        tuple: (whether the command succeeded, ending id if the case closed)
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        succeeded = engine.command_processor.process(command)
+        if engine.game_state.case_closed:
+            ending = engine.game_state.endings_manager.check_ending(
+                engine.player, engine.game_state, engine.game_state.mystery
+            )
+            return succeeded, ending.ending_id if ending else None
+        engine._end_turn()
+    return succeeded, None
+
+
+def fork_session(engine):
+    """Branch a session without disturbing it.
+
+    Args:
+        engine: GameEngine
+
+    Returns:
+        GameEngine: Engine on copy-on-write forks of the player and game state
+    """
+    return GameEngine(
+        engine.player.fork(), engine.game_state.fork(), engine.save_system.SAVE_DIR
+    )
+
+
+def session_state(engine):
+    """Reduce a session to the state that decides what can happen next.
+
+    Ambient crowds are left out: they change every turn but never open or
+    close a path.
+
+    Args:
+        engine: GameEngine
+
+    Returns:
+        tuple: (game clock, hashable facts); the facts hold everything
+        else, the time period and whether the deadline has passed included
+    """
+    player, game_state = engine.player, engine.game_state
+    mystery = game_state.mystery
+    return game_state.clock, (
+        player.current_location,
+        tuple(sorted(player.inventory)),
+        player.investigation_points,
+        game_state.day,
+        game_state.time_period,
+        mystery.time_remaining == 0,
+        mystery.accused,
+        tuple(sorted(game_state.events_triggered)),
+        mystery.evidence_mask,
+        tuple((s.questioned, s.alibis_verified) for s in mystery.suspects.values()),
+        tuple(
+            pid
+            for pid, puzzle in game_state.puzzle_manager.puzzles.items()
+            if puzzle.solved
+        ),
+        tuple(
+            sorted((key, tuple(items)) for key, items in game_state.world.items.items())
+        ),
+    )
+
+
+def candidate_commands(engine):
+    """List the commands worth trying from a session.
+
+    The procedural sectors are left out, as no case puts anything there.
+    Only items some lead needs are picked up, and puzzles are answered
+    correctly; other commands cannot bring an ending closer. Waiting for
+    the next scheduled event, or for the deadline once nothing more is
+    scheduled, lets time-dependent outcomes be reached.
+
+    Args:
+        engine: GameEngine
+
+    Returns:
+        list: Command strings
+    """
+    player, game_state = engine.player, engine.game_state
+    world, mystery = game_state.world, game_state.mystery
+    location = player.current_location
+    needed = {item for _, item, _ in mystery.topics.values() if item}
+
+    authored = engine.command_processor.content.locations
+    commands = [
+        f"go {exit_name}"
+        for exit_name, target in world.exits_at(location).items()
+        if target in authored
+    ]
+    commands += [
+        f"take {item}"
+        for item in world.items_at(location)
+        if item in needed and item not in player.inventory
+    ]
+    commands += [
+        f"investigate {topic}"
+        for topic, (evidence, _, _) in mystery.topics.items()
+        if not mystery.has_evidence(evidence)
+    ]
+    commands += [
+        f"puzzle {pid} {puzzle.solution}"
+        for pid, puzzle in game_state.puzzle_manager.puzzles.items()
+        if not puzzle.solved
+    ]
+    if mystery.can_accuse(player)[0]:
+        commands += [f"accuse {name}" for name in mystery.suspects]
+    if game_state.event_manager.next_event_time() is not None:
+        commands.append("wait")
+    elif mystery.time_remaining:
+        commands.append(f"wait {mystery.time_remaining}")
+    return commands
+
+
+def find_walkthroughs(case=None, max_depth=MAX_DEPTH, max_states=MAX_STATES):
+    """Search for the shortest walkthrough to every ending.
+
+    Args:
+        case: Generated case dict, or None for the novel's case
+        max_depth: Most commands in one walkthrough
+        max_states: Most distinct states to visit
+
+    Returns:
+        dict: {"endings": ending id -> commands or None, "states": states
+            visited, "exhausted": whether every reachable state was seen}
+    """
+    start = new_session(case)
+    ending_ids = [
+        ending.ending_id for ending in start.game_state.endings_manager.endings
+    ]
+    found = {}
+    # Facts -> earliest clock they were reached at. A session with facts
+    # already reached no later is dropped: waiting takes the earlier
+    # session wherever the later one can go.
+    clock, facts = session_state(start)
+    seen = {facts: clock}
+    queue = deque([((), start)])
+    exhausted = True
+
+    while queue and len(found) < len(ending_ids):
+        commands, session = queue.popleft()
+        if len(commands) >= max_depth:
+            exhausted = False
+            continue
+        for command in candidate_commands(session):
+            engine = fork_session(session)
+            succeeded, ending = play(engine, command)
+            if not succeeded:
+                continue
+            path = commands + (command,)
+            if engine.game_state.case_closed:
+                if ending and ending not in found:
+                    found[ending] = list(path)
+                continue
+            clock, facts = session_state(engine)
+            if seen.get(facts, clock + 1) <= clock:
+                continue
+            if facts not in seen and len(seen) >= max_states:
+                exhausted = False
+                continue
+            seen[facts] = clock
+            queue.append((path, engine))
+
+    return {
+        "endings": {ending_id: found.get(ending_id) for ending_id in ending_ids},
+        "states": len(seen),
+        "exhausted": exhausted and not queue,
+    }
+
+
+def ruleset_fingerprint(source_dir=SOURCE_DIR):
+    """Hash the game code, since a rule change can change any walkthrough.
+
+    Args:
+        source_dir: Package directory holding the game modules
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(source_dir).rglob("*.py")):
+        digest.update(path.relative_to(source_dir).as_posix().encode() + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class WalkthroughCache:
+    """Walkthroughs stored on disk, keyed by ruleset and case."""
+
+    def __init__(self, directory=CACHE_DIR):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding walkthrough files
+        """
+        self.directory = directory
+
+    @staticmethod
+    def key(case=None):
+        """Hash the inputs a walkthrough depends on.
+
+        Args:
+            case: Generated case dict, or None
+
+        Returns:
+            str: Hex digest
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{WALKTHROUGH_FORMAT}:{MAX_DEPTH}:{MAX_STATES}:".encode())
+        digest.update(get_content().fingerprint.encode())
+        digest.update(ruleset_fingerprint().encode())
+        digest.update(json.dumps(case, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def get(self, case=None, refresh=False):
+        """Get the walkthroughs for a case, searching only on a cache miss.
+
+        Args:
+            case: Generated case dict, or None
+            refresh: Search again even if cached
+
+        Returns:
+            dict: Result of find_walkthroughs
+        """
+        path = self.directory / f"{self.key(case)[:32]}.json"
+        if not refresh:
+            try:
+                return json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                pass
+        result = find_walkthroughs(case)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(result), encoding="utf-8")
+        temporary.replace(path)
+        return result
+
+
+if __name__ == "__main__":
+    case = None
+    if "--case" in sys.argv:
+        from src.case_generator import generate_case
+
+        case = generate_case(int(sys.argv[sys.argv.index("--case") + 1]))
+    result = WalkthroughCache().get(case, refresh="--refresh" in sys.argv)
+
+    if "--play" in sys.argv:
+        ending_id = sys.argv[sys.argv.index("--play") + 1]
+        commands = result["endings"].get(ending_id)
+        if not commands:
+            sys.exit(f"❌ No walkthrough reaches {ending_id}")
+        _engine(case).run_demo(commands)
+        sys.exit()
+
+    endings = {
+        e.ending_id: e for e in new_session(case).game_state.endings_manager.endings
+    }
+    for ending_id, commands in result["endings"].items():
+        title = endings[ending_id].title if ending_id in endings else ending_id
+        if commands is None:
+            print(f"\n❌ {ending_id} ({title}): not reached")
+            continue
+        print(f"\n✅ {ending_id} ({title}): {len(commands)} commands")
+        for command in commands:
+            print(f"   > {command}")
+    scope = "every reachable state" if result["exhausted"] else "search bounds reached"
+    print(f"\n{result['states']} states searched ({scope})\n")
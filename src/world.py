@@ -0,0 +1,289 @@
+"""
+World State - Per-session overlay on top of the authored locations
+"""
+
+from src.crowd import CrowdManager
+from src.locations import LOCATIONS
+from src.procgen import DEFAULT_SEED, SectorGenerator
+from src.schedules import PresenceIndex
+from src.utils import CopyOnWrite, Versioned
+
+
+class WorldState(Versioned, CopyOnWrite):
+    """Tracks what a session has changed in the world.
+
+    Authored ``Location`` objects are shared and never mutated. Items taken
+    or dropped are recorded here per location, and every change bumps that
+    location's version so renders can be cached per (location, version).
+    Keys that are not authored fall through to the procedural sectors,
+    whose generated rooms forks share.
+    """
+
+    COW_FIELDS = ("items", "location_versions", "presence")
+    COW_ITEMS = ("items",)
+    FORK_FIELDS = ("crowds",)
+
+    def __init__(self, locations=None, sector_seed=DEFAULT_SEED):
+        """Initialize the world overlay.
+
+        Args:
+            locations: Dict of location key to Location (defaults to LOCATIONS)
+            sector_seed: Seed for the procedural sectors
+        """
+        self.locations = LOCATIONS if locations is None else locations
+        self.sectors = SectorGenerator(sector_seed)
+        self.presence = PresenceIndex(self.locations)
+        self.crowds = CrowdManager(sector_seed)
+        self.items = {}  # location key -> items list replacing the authored one
+        self.location_versions = {}
+
+    def get_location(self, location_key):
+        """Get the location for a key.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            Location or None
+        """
+        location = self.locations.get(location_key)
+        if location is None:
+            location = self.sectors.get_location(location_key)
+        return location
+
+    def find_location(self, phrase):
+        """Resolve a player-supplied destination to a location key.
+
+        Authored locations match by key or name, or by a whole word of
+        either when only one location has it. Sector rooms match by key.
+
+        Args:
+            phrase: Location key or name, case-insensitive
+
+        Returns:
+            str or None: Location key
+        """
+        phrase = " ".join(phrase.lower().replace("_", " ").split())
+        room = phrase.replace(" ", "_")
+        if self.sectors.is_generated(room):
+            return room
+        matches = []
+        for key, location in self.locations.items():
+            names = (key.replace("_", " "), location.name.lower())
+            if phrase in names:
+                return key
+            if any(f" {phrase} " in f" {name} " for name in names):
+                matches.append(key)
+        return matches[0] if len(matches) == 1 else None
+
+    def is_generated(self, location_key):
+        """Check whether a location comes from the procedural sectors.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            bool: True for generated rooms
+        """
+        return location_key not in self.locations and self.sectors.is_generated(
+            location_key
+        )
+
+    def enter(self, location_key):
+        """Note that the player entered a location, streaming nearby sectors.
+
+        Args:
+            location_key: Location key
+        """
+        if self.is_generated(location_key):
+            self.sectors.approach(location_key)
+
+    def exits_at(self, location_key):
+        """Get the exits of a location.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            dict: Exit name to location key
+        """
+        location = self.get_location(location_key)
+        if location is None:
+            return {}
+        gates = self.sectors.gate_exits(location_key)
+        return {**location.exits, **gates} if gates else location.exits
+
+    def npcs_at(self, location_key):
+        """Get the NPCs present at a location.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            list: NPC names (do not mutate)
+        """
+        if location_key in self.locations:
+            return self.presence.npcs_at(location_key)
+        location = self.get_location(location_key)
+        return location.npcs if location else []
+
+    def set_time(self, day, period):
+        """Move scheduled NPCs to where they are at a new time.
+
+        Only the locations whose NPCs changed get a new version.
+
+        Args:
+            day: Game day
+            period: Time period
+        """
+        for location_key in self.own("presence").advance(day, period):
+            self._changed(location_key)
+
+    def tick_crowds(self, location_key):
+        """Advance the ambient crowds near the player by one turn.
+
+        A robot among a venue's NPCs stirs up its crowd.
+
+        Args:
+            location_key: Player's location
+
+        Returns:
+            list: Venues that were simulated
+        """
+        for venue in self.crowds.venues:
+            robots = any(npc.startswith("R. ") for npc in self.npcs_at(venue))
+            self.crowds.set_agitation(venue, 0.6 if robots else 0.0)
+        return self.crowds.tick(location_key, self.exits_at(location_key))
+
+    def reload_content(self, removed):
+        """Bring the overlay in line with reloaded authored locations.
+
+        The shared location table has already been updated in place.
+        NPC placement is rebuilt for the current time and every authored
+        location gets a new version so cached renders are dropped.
+
+        Args:
+            removed: Location keys that no longer exist
+
+        Returns:
+            list: Removed locations that had items in this session's overlay
+        """
+        items = self.own("items")
+        dropped = [key for key in removed if items.pop(key, None)]
+        versions = self.own("location_versions")
+        for key in removed:
+            versions.pop(key, None)
+        day, period = self.presence.day, self.presence.period
+        self.presence = PresenceIndex(self.locations)
+        self.presence.reset(day, period)
+        for location_key in self.locations:
+            self._changed(location_key)
+        return dropped
+
+    def items_at(self, location_key):
+        """Get the items currently lying at a location.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            list: Item names (do not mutate; use add_item/remove_item)
+        """
+        if location_key in self.items:
+            return self.items[location_key]
+        location = self.get_location(location_key)
+        return location.items if location else []
+
+    def add_item(self, location_key, item):
+        """Place an item at a location.
+
+        Args:
+            location_key: Location key
+            item: Item name
+        """
+        self._own_items(location_key).append(item)
+        self._changed(location_key)
+
+    def remove_item(self, location_key, item):
+        """Remove an item from a location.
+
+        Args:
+            location_key: Location key
+            item: Item name
+
+        Returns:
+            bool: True if the item was there
+        """
+        if item not in self.items_at(location_key):
+            return False
+        self._own_items(location_key).remove(item)
+        self._changed(location_key)
+        return True
+
+    def clear_items(self, location_key):
+        """Remove every item from a location.
+
+        Args:
+            location_key: Location key
+        """
+        self.own("items")[location_key] = []
+        self._changed(location_key)
+
+    def location_version(self, location_key):
+        """Get the version of a location's session state.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            int: Counter that changes whenever the location's contents do
+        """
+        return self.location_versions.get(location_key, 0)
+
+    def to_dict(self):
+        """Serialize the session changes for saving.
+
+        Returns:
+            dict: Save data
+        """
+        return {
+            "items": {key: list(items) for key, items in self.items.items()},
+            "sector_seed": self.sectors.seed,
+        }
+
+    def restore(self, data):
+        """Restore session changes from save data.
+
+        Args:
+            data: Dict produced by to_dict (may be empty for old saves)
+        """
+        self.items = {key: list(items) for key, items in data.get("items", {}).items()}
+        self.sectors = SectorGenerator(data.get("sector_seed", DEFAULT_SEED))
+        for location_key in self.locations:
+            self._changed(location_key)
+
+    def _own_items(self, location_key):
+        """Get this session's own, mutable item list for a location.
+
+        Args:
+            location_key: Location key
+
+        Returns:
+            list: Item list stored in the overlay
+        """
+        if location_key not in self.items:
+            items = list(self.items_at(location_key))
+            self.own("items")[location_key] = items
+            return items
+        return self.own_item("items", location_key)
+
+    def _changed(self, location_key):
+        """Bump the version of a location.
+
+        Args:
+            location_key: Location key
+        """
+        self.own("location_versions")[location_key] = (
+            self.location_version(location_key) + 1
+        )
+        self.touch()
@@ -0,0 +1,42 @@
+"""
+Test fixtures - Isolated game sessions
+"""
+
+import os
+import tempfile
+
+import pytest
+
+# Keep saves, caches and the leaderboard out of the real home directory.
+# This runs before any game module computes its paths from the home, so
+# the game is only imported inside the fixtures.
+os.environ["HOME"] = tempfile.mkdtemp(prefix="caves_of_steel_tests_")
+os.environ.pop("XDG_CACHE_HOME", None)
+
+
+@pytest.fixture
+def session():
+    """A fresh game of the novel's case, with output swallowed.
+
+    Returns:
+        GameEngine: Engine after the opening events
+    """
+    from src.walkthrough import new_session
+
+    return new_session()
+
+
+@pytest.fixture
+def run(session):
+    """Play commands in the session fixture.
+
+    Returns:
+        function: run(*commands) -> list of (succeeded, ending id)
+    """
+
+    from src.walkthrough import play
+
+    def run_commands(*commands):
+        return [play(session, command) for command in commands]
+
+    return run_commands
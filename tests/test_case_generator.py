@@ -0,0 +1,49 @@
+"""
+Tests for generated cases - determinism, the solver check and the case cache
+"""
+
+import contextlib
+import io
+
+from src.case_generator import CaseCache, check_case, generate_case
+from src.walkthrough import find_walkthroughs
+
+
+def test_same_seed_same_case():
+    assert generate_case(5) == generate_case(5)
+    assert generate_case(5) != generate_case(6)
+
+
+def test_generated_cases_pass_or_say_why():
+    for seed in range(12):
+        case = generate_case(seed)
+        problems = check_case(case)
+        assert all(isinstance(problem, str) for problem in problems)
+        if not problems:
+            assert case["killer"] in case["suspects"]
+
+
+def test_broken_cases_are_rejected():
+    case = generate_case(3)
+    assert check_case({**case, "format": 0})
+    assert check_case({**case, "killer": "R. Daneel Olivaw"})
+    orphan = [dict(lead, requires="nothing_found") for lead in case["evidence"]]
+    assert check_case({**case, "evidence": orphan})
+
+
+def test_cache_hands_out_each_case_once(tmp_path):
+    cache = CaseCache(tmp_path)
+    seeds = [seed for seed in range(12) if not check_case(generate_case(seed))][:2]
+    for seed in seeds:
+        cache.store(generate_case(seed))
+    assert cache.seeds() == sorted(seeds)
+    taken = [cache.take()["seed"], cache.take()["seed"]]
+    assert taken == sorted(seeds)
+    assert cache.take() is None
+
+
+def test_checked_case_can_be_won():
+    seed = next(seed for seed in range(12) if not check_case(generate_case(seed)))
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = find_walkthroughs(generate_case(seed), max_states=2000)
+    assert any(result["endings"].values())
@@ -0,0 +1,113 @@
+"""
+Tests for the game clock - which commands use up the deadline
+"""
+
+import random
+
+from src.events import TimedEvent
+from src.schedules import TIME_PERIODS
+
+EVIDENCE = (
+    "go corridor",
+    "go plaza",
+    "go police",
+    "go commissioner_office",
+    "take eyeglass_evidence",
+    "investigate eyeglasses",
+    "investigate enderby",
+    "investigate sammy",
+    "investigate spacer_conspiracy",
+)
+
+
+def _minutes(session, run, command):
+    """Game minutes a command takes."""
+    before = session.game_state.clock
+    run(command)
+    return session.game_state.clock - before
+
+
+def test_actions_take_their_minutes(session, run):
+    assert _minutes(session, run, "go corridor") == 5
+    assert _minutes(session, run, "wait 45") == 45
+
+
+def test_usage_listing_and_hints_are_free(session, run):
+    for command in ("investigate", "puzzle", "puzzle access_code", "accuse", "look"):
+        assert _minutes(session, run, command) == 0, command
+    assert run("investigate")[0][0] is False
+
+
+def test_unknown_puzzle_and_topic_are_free(session, run):
+    assert _minutes(session, run, "puzzle nothing 1234") == 0
+    assert _minutes(session, run, "investigate nothing") == 0
+
+
+def test_puzzle_answers_take_time_right_or_wrong(session, run):
+    assert _minutes(session, run, "puzzle access_code 0000") == 20
+    assert _minutes(session, run, "puzzle access_code 1955") == 20
+    # Already solved: nothing is checked
+    assert _minutes(session, run, "puzzle access_code 1955") == 0
+
+
+def test_wrong_accusation_takes_time(session, run):
+    run(*EVIDENCE)
+    assert _minutes(session, run, "accuse R. Sammy") == 30
+    assert not session.game_state.case_solved
+
+
+def test_timed_events_fall_due_in_clock_order(session):
+    rng = random.Random(49)
+    player, game_state = session.player, session.game_state
+    manager = game_state.event_manager
+    for i in range(40):
+        period = rng.choice(TIME_PERIODS)
+        manager.add_event(f"extra_{i}", "Something happens.", period, rng.randint(1, 3))
+    timed = [e for e in manager.events if isinstance(e, TimedEvent) and not e.triggered]
+
+    while manager.next_event_time() is not None:
+        game_state.advance_clock(rng.randint(1, 300))
+        # A linear scan: every pending event now due, earliest first
+        due = sorted(
+            (e for e in timed if not e.triggered and e.at <= game_state.clock),
+            key=lambda e: (e.at, manager.positions[e.event_id]),
+        )
+        expected = [e.event_id for e in due]
+        triggered = manager.get_triggered_events(player, game_state)
+        assert [e.event_id for e in triggered if isinstance(e, TimedEvent)] == expected
+        timed = [e for e in manager.events if isinstance(e, TimedEvent)]
+        pending = [e.at for e in timed if not e.triggered]
+        assert manager.next_event_time() == (min(pending) if pending else None)
+    assert all(e.triggered for e in timed)
+
+
+def _load(session, path):
+    """Load a save into the running session, as the load command does."""
+    player_data, game_state_data = session.save_system.load_game(str(path))
+    session._restore_player(player_data)
+    session._restore_game_state(game_state_data)
+
+
+def test_loading_an_earlier_save_brings_back_later_events(session):
+    player, game_state = session.player, session.game_state
+    manager = game_state.event_manager
+    path = session.save_system.save_game(player, game_state, "save_before.json")
+    due = manager.next_event_time()
+    pending = [
+        e.event_id
+        for e in manager.events
+        if isinstance(e, TimedEvent) and e.at == due and not e.triggered
+    ]
+
+    game_state.advance_clock(due - game_state.clock)
+    fired = [e.event_id for e in manager.get_triggered_events(player, game_state)]
+    assert set(pending) <= set(fired)
+
+    _load(session, path)
+    assert not any(manager.has_event_occurred(event_id) for event_id in pending)
+    assert not set(pending) & set(manager.events_log)
+    assert manager.next_event_time() == due
+
+    game_state.advance_clock(due - game_state.clock)
+    again = [e.event_id for e in manager.get_triggered_events(player, game_state)]
+    assert set(pending) <= set(again)
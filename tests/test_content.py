@@ -0,0 +1,68 @@
+"""
+Tests for the content compiler and the world bundle
+"""
+
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from src import content
+
+
+def test_shipped_bundle_is_up_to_date():
+    bundle = content.load_bundle()
+    assert bundle is not None, "run python -m src.content"
+    bundle.strings.close()
+
+
+def test_shipped_content_validates():
+    assert content.validate(content.collect_sources()) == []
+
+
+def test_fingerprint_covers_only_the_tables(tmp_path, monkeypatch):
+    for name in content.SOURCE_MODULES:
+        shutil.copy(content.SOURCE_DIR / name, tmp_path / name)
+    monkeypatch.setattr(content, "SOURCE_DIR", tmp_path)
+    before = content.source_fingerprint()
+
+    with open(tmp_path / "events.py", "a", encoding="utf-8") as f:
+        f.write("\n# a code change\n")
+    assert content.source_fingerprint() == before
+
+    with open(tmp_path / "content_tables.py", "a", encoding="utf-8") as f:
+        f.write("\n# a table change\n")
+    assert content.source_fingerprint() != before
+
+
+def test_stale_bundle_fallback_refuses_invalid_content(monkeypatch):
+    sources = content.collect_sources()
+    sources["locations"]["bedroom"]["exits"]["nowhere"] = "no_such_place"
+    monkeypatch.setattr(content, "_content", None)
+    monkeypatch.setattr(content, "load_bundle", lambda: None)
+    monkeypatch.setattr(content, "collect_sources", lambda: sources)
+    with pytest.raises(content.ContentError) as error:
+        content.get_content()
+    assert any("no_such_place" in problem for problem in error.value.problems)
+
+
+def test_duplicate_alias_is_reported():
+    sources = content.collect_sources()
+    sources["duplicate_keys"] = {"content_tables.py": [("NPC_NAME_MAP", "ben", 3)]}
+    assert any("repeated" in problem for problem in content.validate(sources))
+
+
+def test_game_does_not_import_the_authoring_tables():
+    code = (
+        "import sys; import main; from src.walkthrough import new_session; "
+        "new_session(); print('src.content_tables' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=content.SOURCE_DIR.parent,
+        check=True,
+    )
+    assert result.stdout.strip().endswith("False")
@@ -0,0 +1,64 @@
+"""
+Tests for the crowd simulation (skipped without NumPy)
+"""
+
+import pytest
+
+from src.crowd import HALL_SIZE, MEDIEVALIST_LEANING, Crowd, CrowdManager
+
+pytest.importorskip("numpy")
+
+VENUES = {"central_plaza": 500, "food_dispensary": 300}
+PLAZA_EXITS = {"north": "police_hq"}
+
+
+def test_only_crowds_near_the_player_are_created_and_stepped():
+    manager = CrowdManager(venues=VENUES)
+    assert manager.tick("bedroom", {"corridor": "corridor_residential"}) == []
+    assert manager.crowds == {}
+
+    assert manager.tick("central_plaza", PLAZA_EXITS) == ["central_plaza"]
+    assert set(manager.crowds) == {"central_plaza"}
+    assert manager.crowds["central_plaza"].ticks == 1
+
+
+def test_same_seed_gives_the_same_crowd():
+    first, second = Crowd("central_plaza", 500, 7), Crowd("central_plaza", 500, 7)
+    for _ in range(5):
+        first.step()
+        second.step()
+    assert first.summary() == second.summary()
+    assert first.canvass() == second.canvass()
+
+
+def test_step_keeps_citizens_on_the_floor_with_valid_moods():
+    crowd = Crowd("central_plaza", 2000, 3)
+    for _ in range(20):
+        crowd.step()
+    for axis in (crowd.x, crowd.y):
+        assert axis.min() >= 0 and axis.max() <= HALL_SIZE
+    assert crowd.mood.min() >= 0 and crowd.mood.max() <= 1
+
+
+def test_agitation_sours_the_medievalists():
+    calm, stirred = Crowd("central_plaza", 2000, 5), Crowd("central_plaza", 2000, 5)
+    stirred.agitation = 0.6
+    for _ in range(30):
+        calm.step()
+        stirred.step()
+    medievalists = calm.leaning < MEDIEVALIST_LEANING
+    assert stirred.mood[medievalists].mean() < calm.mood[medievalists].mean() - 0.1
+
+
+def test_fork_steps_its_own_copy():
+    manager = CrowdManager(venues=VENUES)
+    manager.tick("central_plaza", PLAZA_EXITS)
+    crowd = manager.crowds["central_plaza"]
+    positions = crowd.x.copy()
+
+    fork = manager.fork()
+    fork.tick("central_plaza", PLAZA_EXITS)
+    assert fork.crowds["central_plaza"] is not crowd
+    assert fork.crowds["central_plaza"].ticks == 2
+    assert crowd.ticks == 1
+    assert (crowd.x == positions).all()
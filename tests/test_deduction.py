@@ -0,0 +1,105 @@
+"""
+Tests for the deduction engine against a recount from the facts
+"""
+
+import random
+
+from src.deduction import DeductionEngine
+
+WINDOW = (100, 200)
+SUSPECTS = [f"suspect_{i}" for i in range(6)]
+
+
+def _random_case(rng):
+    """Evidence -> (implicated suspects, cleared suspects)."""
+    evidence = {}
+    for i in range(8):
+        implicates = rng.sample(SUSPECTS, rng.randint(0, 3))
+        others = [name for name in SUSPECTS if name not in implicates]
+        evidence[f"evidence_{i}"] = (implicates, rng.sample(others, rng.randint(0, 2)))
+    return evidence
+
+
+def _covers(intervals, window):
+    """Whether intervals together cover the whole window."""
+    reached = window[0]
+    for start, end in sorted(intervals):
+        if start > reached:
+            break
+        reached = max(reached, end)
+    return reached >= window[1]
+
+
+def _expected(evidence, found, alibis):
+    """Recompute candidates, support and open leads from all the facts."""
+    cleared = {name for e in found for name in evidence[e][1]}
+    suspects = {
+        name for implicates, clears in evidence.values() for name in implicates + clears
+    }
+    suspects |= set(alibis)
+    candidates = {
+        name
+        for name in suspects
+        if name not in cleared and not _covers(alibis.get(name, []), WINDOW)
+    }
+    support = {
+        name: sum(1 for e in found if name in evidence[e][0]) for name in candidates
+    }
+    open_leads = {
+        e: sum(1 for name in implicates if name in candidates)
+        for e, (implicates, _) in evidence.items()
+        if e not in found
+    }
+    return candidates, support, open_leads
+
+
+def test_incremental_facts_match_a_recount():
+    rng = random.Random(40)
+    for _ in range(50):
+        evidence = _random_case(rng)
+        engine = DeductionEngine(WINDOW)
+        for name, (implicates, clears) in evidence.items():
+            engine.add_evidence(name, implicates, clears)
+        found, alibis = set(), {}
+        for _ in range(20):
+            if rng.random() < 0.5:
+                name = rng.choice(list(evidence))
+                engine.record_evidence(name)
+                found.add(name)
+            else:
+                suspect = rng.choice(SUSPECTS)
+                start = rng.randrange(80, 200, 10)
+                interval = (start, start + rng.randrange(10, 80, 10))
+                engine.record_alibi(suspect, *interval)
+                alibis.setdefault(suspect, []).append(interval)
+
+            candidates, support, open_leads = _expected(evidence, found, alibis)
+            assert engine.candidates == candidates
+            assert dict(engine.ranked_candidates()) == support
+            assert engine.open_leads == open_leads
+            for lead, implicated in engine.splitting_evidence():
+                assert 0 < len(implicated) < len(candidates)
+                assert set(implicated) <= candidates
+                assert lead not in found
+
+
+def test_ranking_puts_the_best_supported_first():
+    engine = DeductionEngine(WINDOW)
+    engine.add_evidence("glasses", ["Enderby"])
+    engine.add_evidence("transport", ["Sammy", "Enderby"])
+    engine.add_evidence("spacetown", ["Fastolfe"], clears=["Sammy"])
+    engine.record_evidence("glasses")
+    engine.record_evidence("transport")
+    assert engine.ranked_candidates() == [("Enderby", 2), ("Sammy", 1), ("Fastolfe", 0)]
+    assert engine.record_evidence("spacetown") == ["Sammy"]
+    assert engine.eliminated == {"Sammy": "cleared by spacetown"}
+
+
+def test_partial_alibis_merge_until_they_cover():
+    engine = DeductionEngine(WINDOW)
+    assert not engine.record_alibi("Clerk", 150, 200)
+    assert not engine.record_alibi("Clerk", 90, 120)
+    assert engine.cover["Clerk"] == [(90, 120), (150, 200)]
+    assert engine.record_alibi("Clerk", 120, 150)
+    assert engine.cover["Clerk"] == [(90, 200)]
+    assert "Clerk" in engine.eliminated
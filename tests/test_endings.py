@@ -0,0 +1,72 @@
+"""
+Tests for endings - the decision table and how the case closes
+"""
+
+import itertools
+
+from src.endings import FEATURES, NUMERIC_FEATURES, EndingsManager
+from tests.test_clock import EVIDENCE
+
+
+def _passes(test, value):
+    """Evaluate one ending condition directly."""
+    if isinstance(test, tuple):
+        low, high = test
+        return (low is None or value >= low) and (high is None or value < high)
+    return value == test
+
+
+def _predicate_chain(endings, features):
+    """Decide an ending by testing every condition in score order."""
+    values = dict(zip(FEATURES, features))
+    for ending in sorted(endings, key=lambda e: -e.score_bonus):
+        if all(_passes(test, values[name]) for name, test in ending.conditions.items()):
+            return ending
+    return None
+
+
+def test_decision_table_matches_predicate_chain():
+    manager = EndingsManager()
+    grid = {
+        "correct": (True, False),
+        "killer": ("Julius Enderby", "R. Sammy"),
+        "evidence": range(6),
+        "points": (0, 29, 30, 49, 50, 120),
+        "period": ("morning", "night"),
+        "day": (1, 3, 4),
+        "wrongly_accused": (True, False),
+    }
+    assert set(grid) == set(FEATURES) and NUMERIC_FEATURES <= set(FEATURES)
+    reached = set()
+    for features in itertools.product(*(grid[name] for name in FEATURES)):
+        ending = manager.decide(features)
+        assert ending is _predicate_chain(manager.endings, features), features
+        if ending:
+            reached.add(ending.ending_id)
+    assert reached == {ending.ending_id for ending in manager.endings}
+
+
+def test_running_out_of_time_closes_the_case(session, run):
+    minutes = session.game_state.mystery.time_remaining
+    assert run(f"wait {minutes}") == [(True, "gave_up")]
+
+
+def test_wrong_accusation_on_record_goes_to_trial(session, run):
+    run(*EVIDENCE)
+    assert run("accuse R. Sammy") == [(True, None)]
+    assert session.game_state.mystery.wrongly_accused
+    minutes = session.game_state.mystery.time_remaining
+    assert run(f"wait {minutes}") == [(True, "wrongful_conviction")]
+
+
+def test_accusing_a_stranger_is_not_recorded(session, run):
+    run(*EVIDENCE)
+    assert run("accuse Nobody") == [(False, None)]
+    assert session.game_state.mystery.accused is None
+
+
+def test_killer_named_late_still_solves(session, run):
+    run(*EVIDENCE, "accuse R. Sammy")
+    succeeded, ending = run("accuse Julius Enderby")[0]
+    assert succeeded
+    assert ending == "perfect_justice"
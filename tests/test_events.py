@@ -0,0 +1,88 @@
+"""
+Tests for event rules - incremental re-evaluation against checking every rule
+"""
+
+import contextlib
+import io
+import random
+
+from src.events import GameEvent, TimedEvent, _source, fact_source
+from src.walkthrough import candidate_commands, new_session
+
+EXTRA_EVENTS = (
+    GameEvent("in_plaza", "Crowds jostle you.", when={"location": "central_plaza"}),
+    GameEvent(
+        "second_morning",
+        "A new day below the domes.",
+        when={"day": 2, "time_period": "morning"},
+    ),
+    GameEvent(
+        "carrying_proof",
+        "The glasses weigh on your mind.",
+        lambda facts: "eyeglass_evidence" in facts["inventory"]
+        and facts["evidence"] >= 1,
+        ("inventory", "evidence"),
+    ),
+    GameEvent(
+        "well_travelled",
+        "You know the Cave.",
+        lambda facts: len(facts["visited"]) >= 6,
+        ("visited",),
+    ),
+)
+
+
+def _all_facts(manager, player, game_state):
+    """Read every fact any rule uses, straight from the game."""
+    facts = {}
+    for event in manager.events:
+        for fact in event.depends_on:
+            source, reader = fact_source(fact)
+            value = _source(source, player, game_state)
+            facts[fact] = reader(value) if value is not None else None
+    return facts
+
+
+def _walk(session, rng):
+    """Play random commands, checking the rules after each.
+
+    Returns:
+        set: IDs of the events that occurred
+    """
+    player, game_state = session.player, session.game_state
+    manager = game_state.event_manager
+    manager.own("events").extend(EXTRA_EVENTS)
+    manager._index()
+    processor = session.command_processor
+
+    for _ in range(150):
+        # Accusing or waiting out the deadline would end the game before
+        # every rule had its chance
+        commands = [
+            c
+            for c in candidate_commands(session)
+            if not c.startswith(("accuse", "wait "))
+        ]
+        with contextlib.redirect_stdout(io.StringIO()):
+            processor.process(rng.choice(commands))
+        facts = _all_facts(manager, player, game_state)
+        expected = {
+            event.event_id
+            for event in manager.events
+            if not isinstance(event, TimedEvent) and event.should_trigger(facts)
+        }
+        triggered = manager.get_triggered_events(player, game_state)
+        assert {
+            e.event_id for e in triggered if not isinstance(e, TimedEvent)
+        } == expected
+        if game_state.case_closed:
+            break
+    return set(manager.events_log)
+
+
+def test_changed_facts_trigger_what_a_full_check_would():
+    rng = random.Random(48)
+    occurred = set()
+    for _ in range(5):
+        occurred |= _walk(new_session(), rng)
+    assert {event.event_id for event in EXTRA_EVENTS} <= occurred
@@ -0,0 +1,51 @@
+"""
+Tests for the evidence bitset and the suspect reverse index
+"""
+
+import random
+
+from src.case_generator import generate_case
+from src.mystery_plot import MysteryPlot
+
+
+def _check_counters(mystery):
+    """Compare the maintained counters with a recount of the evidence dict."""
+    found = [name for name, seen in mystery.key_evidence.items() if seen]
+    assert mystery.evidence_count == len(found)
+    for name in mystery.key_evidence:
+        assert mystery.has_evidence(name) == (name in found)
+    for suspect in mystery.suspects:
+        expected = sum(
+            1 for name in found if suspect in mystery.evidence_links.get(name, ())
+        )
+        assert mystery.evidence_against(suspect) == expected, suspect
+
+
+def test_counters_follow_the_evidence_found():
+    random.seed(39)
+    for case in (None, generate_case(3), generate_case(11)):
+        mystery = MysteryPlot(case)
+        names = [*mystery.key_evidence, "nothing_at_all"]
+        for _ in range(40):
+            mystery.record_evidence(random.choice(names))
+            _check_counters(mystery)
+        assert mystery.evidence_count == len(mystery.key_evidence)
+
+
+def test_locked_evidence_is_not_counted():
+    mystery = MysteryPlot()
+    mystery.branch_choice("trust_spacers")
+    mystery.record_evidence("spacer_conspiracy")
+    assert not mystery.has_evidence("spacer_conspiracy")
+    _check_counters(mystery)
+
+
+def test_forks_count_apart():
+    mystery = MysteryPlot()
+    mystery.record_evidence("enderby_medievalist")
+    fork = mystery.fork()
+    fork.record_evidence("r_sammy_transport")
+    assert mystery.evidence_against("Julius Enderby") == 1
+    assert fork.evidence_against("Julius Enderby") == 2
+    _check_counters(mystery)
+    _check_counters(fork)
@@ -0,0 +1,62 @@
+"""
+Tests for copy-on-write forks - a fork and its source never see each other's changes
+"""
+
+from src.walkthrough import fork_session, play, session_state
+from tests.test_clock import EVIDENCE
+
+
+def _snapshot(engine):
+    """Everything a fork could leak into, as plain values."""
+    player, game_state = engine.player, engine.game_state
+    mystery = game_state.mystery
+    return (
+        session_state(engine),
+        sorted(player.clues_found),
+        sorted(player.met_characters),
+        sorted(game_state.visited_locations),
+        repr(game_state.npc_states),
+        list(game_state.event_manager.events_log),
+        [entry.to_list() for entry in mystery.history.recent(64)],
+        {name: s.questioned for name, s in mystery.suspects.items()},
+        sorted(mystery.deduction.eliminated),
+    )
+
+
+def test_fork_changes_stay_in_the_fork(session):
+    before = _snapshot(session)
+    fork = fork_session(session)
+    for command in (*EVIDENCE, "puzzle access_code 1955", "talk Julius Enderby"):
+        play(fork, command)
+    assert _snapshot(session) == before
+    assert _snapshot(fork) != before
+
+
+def test_source_changes_stay_out_of_the_fork(session):
+    fork = fork_session(session)
+    before = _snapshot(fork)
+    for command in EVIDENCE:
+        play(session, command)
+    assert _snapshot(fork) == before
+
+
+def test_sibling_and_nested_forks_are_isolated(session):
+    play(session, "go corridor")
+    left, right = fork_session(session), fork_session(session)
+    nested = fork_session(left)
+    right_before, nested_before = _snapshot(right), _snapshot(nested)
+    for command in EVIDENCE[1:]:
+        play(left, command)
+    assert _snapshot(right) == right_before
+    assert _snapshot(nested) == nested_before
+    for command in EVIDENCE[1:5]:
+        play(nested, command)
+    assert _snapshot(right) == right_before
+    assert _snapshot(left) != _snapshot(nested)
+
+
+def test_unforked_objects_own_their_containers(session):
+    # Objects never forked have nothing borrowed and write in place
+    player = session.player
+    inventory = player.inventory
+    assert player.own("inventory") is inventory
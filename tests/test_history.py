@@ -0,0 +1,68 @@
+"""
+Tests for the investigation history - ring, indexes and spill file
+"""
+
+from src.case_generator import generate_case
+from src.game_state import GameState
+from src.history import EVIDENCE_FOUND, QUESTIONED, SPILL_BATCH, HistoryLog
+
+
+def _fill(log, count):
+    """Add alternating questioned and evidence entries."""
+    for at in range(count):
+        if at % 2:
+            log.add(EVIDENCE_FOUND, "broken_glasses_found", at, related=("R. Sammy",))
+        else:
+            log.add(QUESTIONED, "R. Sammy", at)
+
+
+def test_ring_keeps_the_latest_entries():
+    log = HistoryLog(capacity=4)
+    _fill(log, 10)
+    assert len(log) == 10
+    assert [entry.seq for entry in log.recent(10)] == [6, 7, 8, 9]
+    assert [entry.seq for entry in log.recent(2)] == [8, 9]
+
+
+def test_index_by_subject_and_kind():
+    log = HistoryLog(capacity=8)
+    _fill(log, 6)
+    assert len(log.about("R. Sammy")) == 6
+    assert [entry.seq for entry in log.about("R. Sammy", QUESTIONED)] == [0, 2, 4]
+    assert [entry.seq for entry in log.about("broken_glasses_found")] == [1, 3, 5]
+
+
+def test_spill_file_holds_the_whole_history(tmp_path):
+    path = tmp_path / "history.jsonl"
+    log = HistoryLog(capacity=4, spill_path=path)
+    _fill(log, SPILL_BATCH * 2 + 10)
+    assert path.exists()
+    assert [entry.seq for entry in log.all_entries()] == list(range(len(log)))
+    assert [entry.seq for entry in log.all_entries("broken_glasses_found")] == list(
+        range(1, len(log), 2)
+    )
+
+
+def test_forks_do_not_spill(tmp_path):
+    log = HistoryLog(capacity=4, spill_path=tmp_path / "history.jsonl")
+    fork = log.fork()
+    _fill(fork, SPILL_BATCH * 2)
+    fork.flush()
+    assert not (tmp_path / "history.jsonl").exists()
+    assert len(log) == 0
+
+
+def test_game_state_keeps_a_file_per_case(tmp_path):
+    game_state = GameState()
+    game_state.keep_history(tmp_path)
+    first = game_state.mystery.history.spill_path
+    assert first.parent == tmp_path
+    history = game_state.mystery.history
+    for _ in range(100):
+        game_state.mystery.advance_time(1)
+    game_state.start_case(generate_case(7))
+    second = game_state.mystery.history.spill_path
+    assert second != first
+    # Switching cases flushes the entries the old case had spilled
+    assert first.read_text().count("\n") == len(history) - history.capacity
+    assert game_state.fork().mystery.history.spill_path is None
@@ -0,0 +1,88 @@
+"""
+Tests for hot reload - edited content reaching a running session
+"""
+
+import os
+import shutil
+
+import pytest
+
+from src import content, hot_reload
+from src.commands import CommandProcessor
+from src.locations import LOCATIONS
+from src.transit import reset_city_network
+
+
+@pytest.fixture
+def sources_dir(tmp_path, monkeypatch):
+    """A copy of the content modules to edit, with the live tables restored after.
+
+    Returns:
+        Path: Directory the watcher reads from
+    """
+    for name in content.SOURCE_MODULES:
+        shutil.copy(content.SOURCE_DIR / name, tmp_path / name)
+    monkeypatch.setattr(content, "SOURCE_DIR", tmp_path)
+    monkeypatch.setattr(hot_reload, "SOURCE_DIR", tmp_path)
+    locations = dict(LOCATIONS)
+    bundle = content.get_content()
+    yield tmp_path
+    LOCATIONS.clear()
+    LOCATIONS.update(locations)
+    content.set_content(bundle)
+    CommandProcessor.use_content(bundle)
+    CommandProcessor.parser.clear_cache()
+    reset_city_network()
+
+
+def _edit(path, old, new):
+    """Replace text in a module and make sure its mtime moves."""
+    text = path.read_text(encoding="utf-8")
+    assert old in text
+    path.write_text(text.replace(old, new), encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_renamed_location_reaches_the_session(sources_dir, session, capsys):
+    watcher = hot_reload.ContentWatcher()
+    assert not watcher.check()
+    _edit(sources_dir / "locations.py", "Your Personal Quarters", "Baley Family Unit")
+    assert watcher.check()
+
+    update, rejected = watcher.take()
+    assert rejected == []
+    assert update.changed == ["locations.py"] and update.restart_needed == []
+    assert watcher.take() == (None, [])
+
+    report = hot_reload.apply_update(update, [(session.player, session.game_state)])
+    assert report == []
+    assert LOCATIONS["bedroom"].name == "Baley Family Unit"
+    capsys.readouterr()
+    session.display_current_location(force=True)
+    assert "BALEY FAMILY UNIT" in capsys.readouterr().out
+
+
+def test_invalid_edit_is_rejected(sources_dir):
+    watcher = hot_reload.ContentWatcher()
+    _edit(
+        sources_dir / "locations.py",
+        '"corridor": "corridor_residential"',
+        '"corridor": "no_such_place"',
+    )
+    assert not watcher.check()
+    update, rejected = watcher.take()
+    assert update is None
+    assert any("no_such_place" in problem for problem in rejected)
+    assert "no_such_place" not in LOCATIONS["bedroom"].exits.values()
+
+
+def test_code_module_change_needs_a_restart(sources_dir):
+    watcher = hot_reload.ContentWatcher()
+    with open(sources_dir / "events.py", "a", encoding="utf-8") as f:
+        f.write("\n# an edit\n")
+    stat = os.stat(sources_dir / "events.py")
+    os.utime(sources_dir / "events.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert watcher.check()
+    update, _ = watcher.take()
+    assert update.changed == [] and update.restart_needed == ["events.py"]
@@ -0,0 +1,97 @@
+"""
+Tests for the leaderboard and achievement tracking
+"""
+
+import random
+
+from src.achievements import ACHIEVEMENTS, AchievementTracker
+from src.game_engine import GameEngine
+from src.game_state import GameState
+from src.leaderboard import RUN_COLUMNS, Leaderboard, format_runs
+from src.player import Player
+from tests.test_clock import EVIDENCE
+
+ENDINGS = ("perfect_justice", "justice_served", "gave_up")
+DIFFICULTIES = ("easy", "normal", "hard")
+
+
+def test_top_runs_match_sorting_every_run():
+    rng = random.Random(50)
+    board = Leaderboard(":memory:")
+    runs = []
+    for i in range(300):
+        run = (
+            f"detective_{i}",
+            rng.randrange(0, 1000, 50),
+            rng.choice(ENDINGS),
+            rng.choice(DIFFICULTIES),
+            rng.randint(5, 60),
+            rng.randint(30, 4000),
+        )
+        runs.append((board.record(*run), *run))
+
+    for difficulty in (None, *DIFFICULTIES):
+        for ending in (None, *ENDINGS):
+            expected = sorted(
+                (
+                    run
+                    for run in runs
+                    if difficulty in (None, run[4]) and ending in (None, run[3])
+                ),
+                key=lambda run: (-run[2], run[5]),
+            )
+            top = board.top(10, difficulty=difficulty, ending=ending)
+            assert len(top) == min(10, len(expected))
+            # Ties on score and turns may come in any order
+            assert [(r[2], r[5]) for r in top] == [(r[2], r[5]) for r in expected[:10]]
+            for row in top:
+                assert row[: len(RUN_COLUMNS) - 1] in runs
+
+
+def test_runs_persist_in_a_file_named_by_a_string(tmp_path):
+    path = str(tmp_path / "scores" / "leaderboard.db")
+    Leaderboard(path).record("Elijah Baley", 500, "gave_up", "easy", 10, 90)
+    (run,) = Leaderboard(path).top()
+    assert run[1:3] == ("Elijah Baley", 500)
+
+
+def test_achievements_unlock_once_across_games():
+    board = Leaderboard(":memory:")
+    assert board.unlock("first_clue", "Elijah Baley")
+    assert not board.unlock("first_clue", "Jessie Baley")
+    assert board.unlocked() == {"first_clue"}
+    tracker = AchievementTracker(board)
+    # An achievement unlocked in an earlier game is no longer tracked
+    assert [a.achievement_id for a in tracker.by_fact["clues"]] == ["total_recall"]
+
+
+def test_tracker_unlocks_what_the_facts_reach(session, run):
+    board = Leaderboard(":memory:")
+    tracker = AchievementTracker(board)
+    for command in EVIDENCE:
+        run(command)
+        tracker.update(session.player, session.game_state)
+        values = tracker.watcher.values
+        for achievement, unlocked, value in tracker.progress():
+            assert value == values.get(achievement.fact)
+            if achievement.reached(value):
+                assert unlocked, achievement.achievement_id
+    assert {"hard_evidence", "airtight"} <= board.unlocked()
+    assert len(tracker.progress()) == len(ACHIEVEMENTS)
+
+
+def test_finished_game_goes_on_the_board(tmp_path, capsys):
+    board = Leaderboard(":memory:")
+    player = Player("Elijah Baley", starting_location="bedroom")
+    engine = GameEngine(player, GameState(), tmp_path, leaderboard=board)
+    commands = [*EVIDENCE, "accuse Julius Enderby"]
+    engine.run_demo(commands)
+    (run,) = board.top()
+    _, name, score, ending, difficulty, turns, minutes, _ = run
+    assert (name, ending, difficulty) == ("Elijah Baley", "perfect_justice", "normal")
+    assert turns == len(commands)
+    endings = engine.game_state.endings_manager
+    reached = endings.check_ending(player, engine.game_state, engine.game_state.mystery)
+    assert score == endings.final_score(reached, player)
+    assert minutes == engine.game_state.clock
+    assert "▶" in format_runs([run], highlight=run[0])
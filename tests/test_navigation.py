@@ -0,0 +1,35 @@
+"""
+Tests for the reachability report
+"""
+
+from src.locations import LOCATIONS, Location
+from src.navigation import (
+    locations_without_entrance,
+    reachability_report,
+    reachable_from,
+)
+
+TOY = {
+    "a": Location("A", "", {"east": "b"}),
+    "b": Location("B", "", {"west": "a", "north": "missing"}),
+    "c": Location("C", "", {"south": "a"}),
+}
+
+
+def test_reachable_from_follows_exits():
+    assert reachable_from("a", TOY) == {"a", "b"}
+    assert reachable_from("c", TOY) == {"a", "b", "c"}
+
+
+def test_locations_without_entrance():
+    assert locations_without_entrance(TOY) == ["c"]
+
+
+def test_report_lists_problems():
+    report = reachability_report("a", TOY)
+    assert "Reachable: 2/3" in report
+    assert "Unreachable: c" in report
+
+
+def test_every_authored_location_is_reachable():
+    assert reachable_from("bedroom") == set(LOCATIONS)
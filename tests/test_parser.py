@@ -0,0 +1,75 @@
+"""
+Tests for the natural-language parser and its parse cache
+"""
+
+from src.parser import CommandParser
+
+NPC_ALIASES = {"julius": "Julius Enderby", "enderby": "Julius Enderby"}
+ITEM_ALIASES = {"glasses": "eyeglass_evidence"}
+CORRIDOR = (
+    "bedroom",
+    (("corridor", "residential_corridor"),),
+    ("Julius Enderby",),
+    ("eyeglass_evidence", "id_card"),
+    (),
+)
+PLAZA = (
+    "central_plaza",
+    (("north", "police_headquarters"),),
+    (),
+    (),
+    ("eyeglass_evidence",),
+)
+
+
+def _parser():
+    return CommandParser(NPC_ALIASES, ITEM_ALIASES)
+
+
+def test_phrasings_resolve_to_commands():
+    parser = _parser()
+    assert parser.parse("pick up the glasses", CORRIDOR) == (
+        "take",
+        "eyeglass_evidence",
+    )
+    assert parser.parse("Grab  the GLASSES", CORRIDOR) == ("take", "eyeglass_evidence")
+    assert parser.parse("go to the corridor", CORRIDOR) == ("go", "corridor")
+    assert parser.parse("talk to julius", CORRIDOR) == ("talk", "julius enderby")
+    assert parser.parse("look at the id card", CORRIDOR) == ("examine", "id_card")
+    assert parser.parse("look around", CORRIDOR) == ("look", "around")
+    assert parser.parse("arrest enderby", CORRIDOR) == ("accuse", "Julius Enderby")
+
+
+def test_unknown_phrases_pass_through():
+    parser = _parser()
+    assert parser.parse("take the moon", CORRIDOR) == ("take", "moon")
+    assert parser.parse("", CORRIDOR) == ("", "")
+    # Commands outside the grammar keep their argument text and case
+    assert parser.parse("accuse", CORRIDOR) == ("accuse", "")
+    assert parser.parse("save My Game", CORRIDOR) == ("save", "My Game")
+    assert parser.cache_info().currsize == 2
+
+
+def test_repeated_phrasings_hit_the_cache():
+    parser = _parser()
+    for _ in range(3):
+        parser.parse("pick up the glasses", CORRIDOR)
+        parser.parse("pick  up the GLASSES", CORRIDOR)
+    info = parser.cache_info()
+    assert (info.misses, info.hits) == (1, 5)
+
+
+def test_cache_is_keyed_on_the_location():
+    parser = _parser()
+    assert parser.parse("drop glasses", CORRIDOR) == ("drop", "glasses")
+    assert parser.parse("drop glasses", PLAZA) == ("drop", "eyeglass_evidence")
+    assert parser.cache_info().misses == 2
+    parser.clear_cache()
+    assert parser.cache_info().currsize == 0
+
+
+def test_session_parses_against_the_live_world(session):
+    processor = session.command_processor
+    assert processor.parse("go to the corridor") == ("go", "corridor")
+    assert processor.parse("pick up the notebook") == ("take", "notebook")
+    assert processor.parse("pick up the glasses") == ("take", "glasses")  # Not here
@@ -0,0 +1,38 @@
+"""
+Tests for command pipelines - batching, stopping and turn counting
+"""
+
+from src.game_engine import GameEngine
+from tests.test_clock import EVIDENCE
+
+
+def test_split_on_semicolons_and_newlines():
+    assert GameEngine.is_pipeline("go corridor; look")
+    assert not GameEngine.is_pipeline("go corridor")
+    assert GameEngine.split_pipeline("go corridor;; look\ninventory ;") == [
+        "go corridor",
+        "look",
+        "inventory",
+    ]
+
+
+def test_every_command_is_a_turn(session, capsys):
+    turns = session.game_state.turns
+    assert session.run_pipeline("go corridor; go plaza; look") == 3
+    assert session.game_state.turns == turns + 3
+    assert session.player.current_location == "central_plaza"
+
+
+def test_batch_stops_at_a_failure(session, capsys):
+    turns = session.game_state.turns
+    assert session.run_pipeline("go corridor; go nowhere; go plaza") == 2
+    assert session.game_state.turns == turns + 2
+    assert "Skipped: go plaza" in capsys.readouterr().out
+
+
+def test_closing_the_case_counts_each_command(session, capsys):
+    turns = session.game_state.turns
+    batch = "; ".join((*EVIDENCE, "accuse Julius Enderby", "look"))
+    assert session.run_pipeline(batch) == len(EVIDENCE) + 1
+    assert session.game_state.turns == turns + len(EVIDENCE) + 1
+    assert not session.running
@@ -0,0 +1,42 @@
+"""
+Tests for the hint planner - following Daneel's advice
+"""
+
+from src.planner import HintPlanner
+
+
+def _plan(session):
+    planner = HintPlanner(session.game_state, session.command_processor.content)
+    return planner, planner.plan(session.player)
+
+
+def test_plan_path_counts_down_to_the_accusation(session, run):
+    planner, plan = _plan(session)
+    assert plan is not None
+    action, distance, ending, following = plan
+    assert distance == len(following) + 1
+    assert following[-1] == ("accuse",)
+
+    for step in [action, *following]:
+        if step[0] not in ("go", "take", "investigate"):
+            break
+        [(succeeded, _)] = run(" ".join(step[:2]))
+        assert succeeded, step
+        next_plan = planner.plan(session.player)
+        assert next_plan[1] == distance - 1
+        assert next_plan[2].ending_id == ending.ending_id
+        distance = next_plan[1]
+    assert distance < plan[1]
+
+
+def test_new_planner_agrees_with_memoized_one(session, run):
+    planner, plan = _plan(session)
+    run(" ".join(plan[0][:2]))
+    _, fresh = _plan(session)
+    remembered = planner.plan(session.player)
+    assert fresh[1:3] == remembered[1:3]
+
+
+def test_no_plan_after_the_deadline(session):
+    session.game_state.mystery.time_remaining = 0
+    assert _plan(session)[1] is None
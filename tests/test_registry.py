@@ -0,0 +1,63 @@
+"""
+Tests for the command registry and lazy plugin loading
+"""
+
+import importlib
+
+import pytest
+
+from src.command_plugins import PLUGIN_COMMANDS
+from src.command_registry import HELP_WIDTH, CommandRegistry, CommandSpec, command
+from src.commands import CommandProcessor
+
+
+def test_plugin_index_matches_the_plugins():
+    for module_name in set(PLUGIN_COMMANDS.values()):
+        registry = CommandRegistry()
+        registry.collect(importlib.import_module(f"src.command_plugins.{module_name}"))
+        indexed = {
+            verb for verb, name in PLUGIN_COMMANDS.items() if name == module_name
+        }
+        assert set(registry.verbs) == indexed, module_name
+
+
+def test_plugins_load_on_first_use():
+    registry = CommandRegistry("src.command_plugins", PLUGIN_COMMANDS)
+    assert registry.lookup("nothing") is None
+    assert not registry.loaded_plugins
+    spec = registry.lookup("sleep")
+    assert spec.name == "wait"
+    assert registry.loaded_plugins == {"clock"}
+    assert registry.lookup("wait") is spec
+
+
+def test_verbs_cannot_be_taken_twice():
+    registry = CommandRegistry()
+    registry.register(CommandSpec("look", aliases=("l",)))
+    with pytest.raises(ValueError, match="'l'"):
+        registry.register(CommandSpec("load", aliases=("l",)))
+
+
+def test_decorator_records_the_time_a_command_takes():
+    @command("nap", advances_time=15)
+    def nap(processor, args):
+        pass
+
+    @command("dream", advances_time=True)
+    def dream(processor, args):
+        pass
+
+    assert nap.command_spec.minutes == 15
+    assert dream.command_spec.minutes == 0
+    assert dream.command_spec.advances_time is True
+
+
+def test_help_lists_every_command():
+    registry = CommandProcessor.registry
+    text = registry.render_help()
+    assert all(verb in registry.verbs for verb in PLUGIN_COMMANDS)
+    for spec in registry.specs.values():
+        for syntax, _ in spec.usage:
+            assert syntax in text, spec.name
+    box = [line.strip() for line in text.strip("\n").split("\n")]
+    assert {len(line) for line in box} == {HELP_WIDTH}
@@ -0,0 +1,33 @@
+"""
+Tests for the render cache of read-only commands
+"""
+
+from src.case_generator import generate_case
+
+
+def _output(session, capsys, command):
+    """Output a command prints."""
+    capsys.readouterr()
+    session.command_processor.process(command)
+    return capsys.readouterr().out
+
+
+def test_unchanged_state_reuses_output(session, capsys):
+    processor = session.command_processor
+    first = _output(session, capsys, "mystery")
+    assert _output(session, capsys, "mystery") == first
+    assert processor.render_cache_stats()["hits"] == 1
+
+
+def test_new_case_is_not_served_from_cache(session, capsys):
+    game_state = session.game_state
+    game_state.start_case(generate_case(7))
+    game_state.mystery.advance_time(60)
+    before = _output(session, capsys, "mystery")
+    # Built and changed the same way, the next mystery reaches the same
+    # version with different contents
+    game_state.start_case(generate_case(8))
+    game_state.mystery.advance_time(30)
+    after = _output(session, capsys, "mystery")
+    assert after != before
+    assert session.game_state.mystery.get_mystery_summary() in after
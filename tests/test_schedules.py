@@ -0,0 +1,54 @@
+"""
+Tests for NPC schedules - the presence index against placing everyone afresh
+"""
+
+import random
+
+from src.schedules import TIME_PERIODS, PresenceIndex, clock_period, period_start
+
+
+def _placement(index):
+    """Location -> set of NPCs present."""
+    return {key: set(npcs) for key, npcs in index.present.items() if npcs}
+
+
+def test_stepping_matches_a_fresh_index():
+    index = PresenceIndex()
+    day, position = 1, 0
+    for _ in range(16):
+        before = _placement(index)
+        position += 1
+        if position == len(TIME_PERIODS):
+            day, position = day + 1, 0
+        changed = index.advance(day, TIME_PERIODS[position])
+
+        fresh = PresenceIndex()
+        fresh.reset(day, TIME_PERIODS[position])
+        after = _placement(index)
+        assert after == _placement(fresh)
+        assert changed >= {
+            k for k in set(before) | set(after) if before.get(k) != after.get(k)
+        }
+        for key in set(after) | set(before):
+            assert set(index.npcs_at(key)) == after.get(key, set())
+
+
+def test_jumps_match_a_fresh_index():
+    rng = random.Random(34)
+    index = PresenceIndex()
+    for _ in range(30):
+        day, period = rng.randint(1, 4), rng.choice(TIME_PERIODS)
+        index.advance(day, period)
+        fresh = PresenceIndex()
+        fresh.reset(day, period)
+        assert _placement(index) == _placement(fresh)
+        for npc in index.schedules:
+            assert index.locate(npc) == index.location_of(npc, day, period)
+
+
+def test_clock_periods_round_trip():
+    for day in (1, 2, 3):
+        for period in TIME_PERIODS:
+            start = period_start(day, period)
+            assert clock_period(start) == (day, period)
+            assert clock_period(start - 1) != (day, period)
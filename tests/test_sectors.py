@@ -0,0 +1,63 @@
+"""
+Tests for the procedural sectors - determinism, bounded memory and exits
+"""
+
+from src.procgen import (
+    CHUNK_SIZE,
+    DIRECTIONS,
+    SectorGenerator,
+    parse_room_key,
+    room_key,
+)
+
+
+def _snapshot(generator, keys):
+    rooms = [generator.get_location(key) for key in keys]
+    return [(room.name, room.description, dict(room.exits)) for room in rooms]
+
+
+def test_evicted_chunks_come_back_the_same():
+    keys = [room_key(x, y) for x in range(-20, 21, 7) for y in range(-20, 21, 9)]
+    roomy = SectorGenerator(max_chunks=100)
+    tight = SectorGenerator(max_chunks=2)
+    assert _snapshot(roomy, keys) == _snapshot(tight, keys)
+    assert len(tight.chunks) <= 2
+    assert tight.chunks_generated > roomy.chunks_generated
+
+
+def test_exits_lead_both_ways():
+    generator = SectorGenerator()
+    opposite = {"north": "south", "south": "north", "east": "west", "west": "east"}
+    for x in range(-CHUNK_SIZE, CHUNK_SIZE):
+        for y in range(-CHUNK_SIZE, CHUNK_SIZE):
+            key = room_key(x, y)
+            for direction, target in generator.get_location(key).exits.items():
+                if direction not in DIRECTIONS:
+                    continue  # The gate back to the authored city
+                back = generator.get_location(target).exits
+                assert back.get(opposite[direction]) == key, (key, direction)
+
+
+def test_nearest_matches_a_scan():
+    generator = SectorGenerator()
+    x, y = 3, -2
+    start = room_key(x, y)
+    reach = 2 * CHUNK_SIZE
+    for kind in ("plaza", "apartment", "corridor"):
+        distances = [
+            abs(dx) + abs(dy)
+            for dx in range(-reach, reach + 1)
+            for dy in range(-reach, reach + 1)
+            if (dx or dy)
+            and generator.get_location(room_key(x + dx, y + dy))
+            .name.split(" (")[0]
+            .endswith(kind.title())
+        ]
+        found = generator.nearest(start, kind)
+        fx, fy = parse_room_key(found)
+        assert abs(fx - x) + abs(fy - y) == min(distances), kind
+
+
+def test_room_keys_round_trip():
+    assert parse_room_key(room_key(-3, 12)) == (-3, 12)
+    assert parse_room_key("central_plaza") is None
@@ -0,0 +1,60 @@
+"""
+Tests for the memory-mapped string table
+"""
+
+import pytest
+
+from src.content import (
+    STRINGS_PATH,
+    collect_sources,
+    compile_content,
+    source_fingerprint,
+)
+from src.string_table import StringTable, write_string_table
+
+
+def test_strings_round_trip(tmp_path):
+    strings = {
+        "plain": "Hello",
+        "unicode": "Dôme — 東京 🚇",
+        "empty": "",
+        "long": "x" * 10000,
+    }
+    path = tmp_path / "strings.bin"
+    write_string_table(path, strings, stamp="abc123")
+    table = StringTable(path)
+    assert table.stamp == "abc123"
+    assert len(table) == len(strings)
+    for key, text in strings.items():
+        assert key in table
+        assert table[key] == text
+    assert table.get("missing", "fallback") == "fallback"
+    with pytest.raises(KeyError):
+        table["missing"]
+    table.close()
+
+
+def test_empty_table(tmp_path):
+    path = tmp_path / "strings.bin"
+    write_string_table(path, {})
+    table = StringTable(path)
+    assert len(table) == 0
+    assert table.get("anything") is None
+    table.close()
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "strings.bin"
+    path.write_bytes(b"\0" * 200)
+    with pytest.raises(ValueError):
+        StringTable(path)
+
+
+def test_shipped_table_holds_the_compiled_text():
+    fingerprint = source_fingerprint()
+    _, strings = compile_content(collect_sources(), fingerprint)
+    table = StringTable(STRINGS_PATH)
+    assert table.stamp == fingerprint
+    assert {key: table[key] for key in strings} == strings
+    assert len(table) == len(strings)
+    table.close()
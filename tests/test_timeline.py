@@ -0,0 +1,95 @@
+"""
+Tests for the timeline index against linear scans
+"""
+
+import random
+
+import pytest
+
+from src.mystery_plot import MysteryPlot
+from src.timeline import (
+    REBUILD_THRESHOLD,
+    SIGHTING,
+    IntervalIndex,
+    Timeline,
+    TimelineRecord,
+)
+
+
+def _records(rng, count):
+    records = []
+    for _ in range(count):
+        start = rng.randrange(0, 1440)
+        records.append(
+            TimelineRecord(start, start + rng.randrange(0, 120), SIGHTING, "x", "y")
+        )
+    return records
+
+
+def _key(records):
+    return sorted(id(record) for record in records)
+
+
+def test_overlap_queries_match_a_linear_scan():
+    rng = random.Random(41)
+    index = IntervalIndex()
+    everything = []
+    # Grow past a rebuild, leaving some intervals in the buffer
+    for batch in (_records(rng, REBUILD_THRESHOLD + 40), _records(rng, 30)):
+        for record in batch:
+            index.add(record)
+        everything += batch
+        assert len(index) == len(everything)
+        for _ in range(200):
+            start = rng.randrange(0, 1500)
+            end = start + rng.randrange(0, 90)
+            found = index.overlapping(start, end)
+            expected = [r for r in everything if r.start <= end and r.end >= start]
+            assert _key(found) == _key(expected)
+            assert [r.start for r in found] == sorted(r.start for r in found)
+
+
+def test_coverage_and_gaps_match_minute_by_minute():
+    rng = random.Random(410)
+    for _ in range(50):
+        timeline = Timeline()
+        rows = []
+        for _ in range(rng.randrange(0, 6)):
+            start = rng.randrange(0, 100)
+            rows.append(
+                (start, start + rng.randrange(0, 30), "Clerk", rng.choice("abc"))
+            )
+        timeline.extend(rows, SIGHTING)
+        start, end = 20, 80
+        covered = set()
+        for lo, hi in timeline.coverage("Clerk", start, end, exclude=("c",)):
+            covered.update(range(lo, hi))
+        expected = {
+            minute
+            for row_start, row_end, _, location in rows
+            if location != "c"
+            for minute in range(max(row_start, start), min(row_end, end))
+        }
+        assert covered == expected
+        unaccounted = set()
+        for lo, hi in timeline.gaps("Clerk", start, end, exclude=("c",)):
+            unaccounted.update(range(lo, hi))
+        assert unaccounted == set(range(start, end)) - expected
+
+
+def test_backwards_interval_is_rejected():
+    with pytest.raises(ValueError):
+        Timeline().add(60, 50, SIGHTING, "Clerk", "records_office")
+
+
+def test_only_the_killer_is_unplaced_in_the_novel():
+    mystery = MysteryPlot()
+    start, end = mystery.victim.death_window
+    timeline = mystery.timeline
+    unaccounted = timeline.unaccounted(
+        ["Records Clerk", "R. Daneel Olivaw", "Julius Enderby", "Han Fastolfe"],
+        start,
+        end,
+        exclude=(mystery.victim.scene,),
+    )
+    assert [name for name, _ in unaccounted] == ["Julius Enderby"]
@@ -0,0 +1,117 @@
+"""
+Tests for transit routing - contraction hierarchy and sector walks
+"""
+
+import heapq
+import random
+from collections import deque
+
+import pytest
+
+from src.transit import (
+    INFINITY,
+    TransitGraph,
+    build_city_network,
+    route_in_world,
+    walk_route,
+)
+from src.world import WorldState
+
+
+def dijkstra(graph, source, target):
+    """Reference shortest path over the graph's original edges."""
+    edges = {}
+    for (a, b), (minutes, _, _) in graph.legs.items():
+        edges.setdefault(graph.keys[a], []).append((graph.keys[b], minutes))
+    distances = {source: 0}
+    heap = [(0, source)]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if node == target:
+            return distance
+        if distance > distances[node]:
+            continue
+        for neighbor, minutes in edges.get(node, ()):
+            if distance + minutes < distances.get(neighbor, INFINITY):
+                distances[neighbor] = distance + minutes
+                heapq.heappush(heap, (distance + minutes, neighbor))
+    return None
+
+
+def check_route(graph, source, target):
+    """Compare one CH route with Dijkstra and check its legs chain up."""
+    route = graph.route(source, target)
+    expected = dijkstra(graph, source, target)
+    if expected is None:
+        assert route is None
+        return
+    minutes, legs = route
+    assert minutes == expected
+    assert sum(leg[3] for leg in legs) == minutes
+    here = source
+    for _, _, key, leg_minutes in legs:
+        edge = graph.legs[(graph.index[here], graph.index[key])]
+        assert edge[0] == leg_minutes
+        here = key
+    assert here == target
+
+
+def test_city_network_matches_dijkstra():
+    graph = build_city_network()
+    for source in graph.keys:
+        for target in graph.keys:
+            check_route(graph, source, target)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_graphs_match_dijkstra(seed):
+    rng = random.Random(seed)
+    graph = TransitGraph()
+    nodes = [f"n{i}" for i in range(40)]
+    for node in nodes:
+        graph.add_node(node)
+    for _ in range(120):
+        a, b = rng.sample(nodes, 2)
+        graph.add_edge(a, b, rng.randint(1, 20), rng.choice(["walk", "strip"]), "x")
+    for _ in range(200):
+        check_route(graph, rng.choice(nodes), rng.choice(nodes))
+
+
+def sector_hops(world, source, target, limit=5000):
+    """Reference breadth-first walk length inside the sectors."""
+    hops = {source: 0}
+    queue = deque([source])
+    while queue and len(hops) < limit:
+        key = queue.popleft()
+        if key == target:
+            return hops[key]
+        for neighbor in world.exits_at(key).values():
+            if world.is_generated(neighbor) and neighbor not in hops:
+                hops[neighbor] = hops[key] + 1
+                queue.append(neighbor)
+    return None
+
+
+@pytest.mark.parametrize("target", ["sector_5_3", "sector_-4_7", "sector_9_-6"])
+def test_walk_route_is_shortest(target):
+    world = WorldState()
+    minutes, legs = walk_route(world, "sector_0_0", target)
+    assert minutes == 5 * sector_hops(world, "sector_0_0", target)
+    assert legs[-1][2] == target
+
+
+def test_travel_between_sectors_and_city():
+    world = WorldState()
+    out = route_in_world(world, "sector_3_-1", "records_office")
+    assert out is not None and out[1][-1][2] == "records_office"
+    back = route_in_world(world, "records_office", "sector_3_-1")
+    assert back is not None and back[1][-1][2] == "sector_3_-1"
+    for key in world.locations:
+        assert route_in_world(world, "sector_3_-1", key) is not None
+
+
+def test_travel_command_from_a_sector(session, run):
+    session.player.current_location = "sector_2_0"
+    assert run("travel records office") == [(True, None)]
+    assert session.player.current_location == "records_office"
+    assert session.game_state.world.find_location("sector 2 0") == "sector_2_0"
@@ -0,0 +1,60 @@
+"""
+Tests for walkthroughs - search state, candidates and the cache key
+"""
+
+from src import walkthrough
+from src.save_system import SaveSystem
+from src.walkthrough import (
+    CACHE_DIR,
+    WalkthroughCache,
+    candidate_commands,
+    fork_session,
+    ruleset_fingerprint,
+    session_state,
+)
+
+
+def test_state_separates_the_clock(session, run):
+    other = fork_session(session)
+    run("wait 30")
+    clock, facts = session_state(session)
+    other_clock, other_facts = session_state(other)
+    assert clock == other_clock + 30
+    assert facts == other_facts
+
+
+def test_state_sees_the_deadline(session):
+    _, facts = session_state(session)
+    session.game_state.mystery.time_remaining = 0
+    _, expired = session_state(session)
+    assert facts != expired
+
+
+def test_waiting_is_a_candidate(session):
+    assert "wait" in candidate_commands(session)
+
+
+def test_search_reaches_endings():
+    result = walkthrough.find_walkthroughs(max_states=500)
+    assert result["endings"]["spacer_resolution"]
+    assert result["states"] <= 500
+
+
+def test_cache_key_follows_the_ruleset(tmp_path, monkeypatch):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "rules.py").write_text("MINUTES = 5\n")
+    before = ruleset_fingerprint(source)
+    key = WalkthroughCache.key()
+
+    (source / "rules.py").write_text("MINUTES = 6\n")
+    assert ruleset_fingerprint(source) != before
+
+    monkeypatch.setattr(walkthrough, "ruleset_fingerprint", lambda: before)
+    assert WalkthroughCache.key() != key
+
+
+def test_cache_is_kept_apart_from_saves():
+    saves = SaveSystem.DEFAULT_SAVE_DIR.parent
+    assert saves not in CACHE_DIR.parents
+    assert CACHE_DIR.parent.name == "caves_of_steel"
@@ -0,0 +1,55 @@
+"""
+Tests for the world overlay and the cached location renders
+"""
+
+from src.locations import LOCATIONS
+from src.world import WorldState
+
+
+def _shown(session, capsys):
+    """Output of drawing the current location."""
+    capsys.readouterr()
+    session.display_current_location()
+    return capsys.readouterr().out
+
+
+def test_taking_an_item_leaves_the_authored_location_alone(session, run):
+    authored = list(LOCATIONS["bedroom"].items)
+    assert "notebook" in authored
+    assert run("take notebook")[0][0]
+    world = session.game_state.world
+    assert "notebook" not in world.items_at("bedroom")
+    assert LOCATIONS["bedroom"].items == authored
+    assert WorldState().items_at("bedroom") == authored
+
+
+def test_location_is_redrawn_only_when_it_changes(session, run, capsys):
+    session.display_current_location(force=True)
+    assert _shown(session, capsys).strip() == f"📍 {LOCATIONS['bedroom'].name}"
+
+    run("take notebook")
+    redrawn = _shown(session, capsys)
+    assert LOCATIONS["bedroom"].name.upper() in redrawn
+    assert "notebook" not in redrawn
+
+    run("drop notebook")
+    assert "notebook" in _shown(session, capsys)
+
+
+def test_render_cache_follows_location_version(session, run):
+    world = session.game_state.world
+    first = session.render_location("bedroom")
+    assert session.render_location("bedroom") is first
+    version = world.location_version("bedroom")
+    run("take notebook")
+    assert world.location_version("bedroom") > version
+    assert session.render_location("bedroom") != first
+
+
+def test_overlay_round_trips(session, run):
+    run("take notebook")
+    world = session.game_state.world
+    restored = WorldState()
+    restored.restore(world.to_dict())
+    assert restored.items_at("bedroom") == world.items_at("bedroom")
+    assert "notebook" not in restored.items_at("bedroom")